@@ -251,9 +251,8 @@ class AuthController(Controller):
             return {"authenticated": False, "guest": True}
 
         if session.user_id:
-            user = await auth_service.get_user(session.user_id)
+            user, stats = await auth_service.get_user_with_stats(session.user_id)
             if user:
-                stats = await auth_service.get_user_stats(user.id)
                 return {
                     "authenticated": True,
                     "guest": False,
@@ -303,12 +302,10 @@ class AuthController(Controller):
         if not session or not session.user_id:
             return Redirect(path="/auth/login")
 
-        user = await auth_service.get_user(session.user_id)
+        user, stats = await auth_service.get_user_with_stats(session.user_id)
         if not user:
             return Redirect(path="/auth/login")
 
-        stats = await auth_service.get_user_stats(user.id)
-
         return Template(
             template_name="auth/profile.html",
             context={
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
 import secrets
+import time
 from datetime import UTC, datetime, timedelta
 from typing import TYPE_CHECKING, Any
 from uuid import UUID, uuid4
@@ -10,15 +12,89 @@ from uuid import UUID, uuid4
 import structlog
 
 from scribbl_py.auth.config import OAUTH_URLS, OAuthConfig
-from scribbl_py.auth.models import OAuthProvider, Session, User, UserStats
+from scribbl_py.auth.models import GameResult, OAuthProvider, Session, User, UserStats
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
     from sqlalchemy.ext.asyncio import AsyncSession
 
     from scribbl_py.storage.db.auth_storage import AuthDatabaseStorage
 
 logger = structlog.get_logger(__name__)
 
+# Leaderboards are the same for every viewer, so database reads are reused briefly
+_LEADERBOARD_TTL_SECONDS = 60.0
+
+# Sessions are looked up on nearly every request; keep recent ones in process
+_SESSION_CACHE_TTL_SECONDS = 60.0
+_SESSION_CACHE_MAX_SIZE = 10_000
+
+
+class SessionDataloader:
+    """Coalesces concurrent session lookups into a single query.
+
+    Tokens requested during the same event loop iteration are collected and
+    loaded together with one ``WHERE session_token IN (...)`` query, so a burst
+    of connections (e.g. a room reconnecting) costs one round trip.
+    """
+
+    def __init__(self, session_factory: Any, get_storage: Callable[[AsyncSession], AuthDatabaseStorage]) -> None:
+        """Initialize the loader.
+
+        Args:
+            session_factory: SQLAlchemy async session factory.
+            get_storage: Builds the auth storage for a database session.
+        """
+        self._session_factory = session_factory
+        self._get_storage = get_storage
+        self._pending: dict[str, asyncio.Future[Session | None]] = {}
+        self._flush_scheduled = False
+        self._flush_tasks: set[asyncio.Task[None]] = set()
+
+    async def load(self, session_token: str) -> Session | None:
+        """Load a session by token, batched with other lookups from this iteration.
+
+        Args:
+            session_token: Token of the session to load.
+
+        Returns:
+            The session, or None if no session has this token.
+        """
+        future = self._pending.get(session_token)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._pending[session_token] = future
+            if not self._flush_scheduled:
+                self._flush_scheduled = True
+                loop.call_soon(self._start_flush)
+        # Shielded so one cancelled caller doesn't cancel the lookup for the others
+        return await asyncio.shield(future)
+
+    def _start_flush(self) -> None:
+        """Hand the collected tokens to a flush task."""
+        pending, self._pending = self._pending, {}
+        self._flush_scheduled = False
+        task = asyncio.create_task(self._flush(pending))
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_tasks.discard)
+
+    async def _flush(self, pending: dict[str, asyncio.Future[Session | None]]) -> None:
+        """Load all pending tokens and resolve their futures."""
+        try:
+            async with self._session_factory() as db_session:
+                sessions = await self._get_storage(db_session).get_sessions(list(pending))
+        except Exception as e:  # noqa: BLE001
+            for future in pending.values():
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for token, future in pending.items():
+            if not future.done():
+                future.set_result(sessions.get(token))
+
 
 class DatabaseAuthService:
     """Database-backed authentication service.
@@ -47,12 +123,28 @@ class DatabaseAuthService:
         self._memory_sessions: dict[str, Session] = {}
         self._memory_stats: dict[UUID, UserStats] = {}
 
+        # (category, limit) -> (expires_at monotonic, entries), database mode only
+        self._leaderboard_cache: dict[tuple[str, int], tuple[float, list[tuple[User, UserStats]]]] = {}
+        self._leaderboard_lock = asyncio.Lock()
+        # Bumped on every invalidation so a refresh that raced a write doesn't cache stale rows
+        self._leaderboard_generation = 0
+
+        # session_id -> (expires_at monotonic, session), database mode only
+        self._session_cache: dict[str, tuple[float, Session]] = {}
+        self._session_loader = SessionDataloader(session_factory, self._get_storage) if session_factory else None
+
     def _get_storage(self, db_session: AsyncSession) -> AuthDatabaseStorage:
         """Get storage instance for database operations."""
         from scribbl_py.storage.db.auth_storage import AuthDatabaseStorage  # noqa: PLC0415
 
         return AuthDatabaseStorage(db_session)
 
+    def _cache_session(self, session: Session) -> None:
+        """Remember a database session, evicting the oldest entry when full."""
+        if session.id not in self._session_cache and len(self._session_cache) >= _SESSION_CACHE_MAX_SIZE:
+            del self._session_cache[next(iter(self._session_cache))]
+        self._session_cache[session.id] = (time.monotonic() + _SESSION_CACHE_TTL_SECONDS, session)
+
     # === Session Management ===
 
     async def create_session(
@@ -81,6 +173,7 @@ class DatabaseAuthService:
                 storage = self._get_storage(db_session)
                 await storage.create_session(session)
                 await db_session.commit()
+            self._cache_session(session)
         else:
             # In-memory fallback
             self._memory_sessions[session_id] = session
@@ -112,24 +205,29 @@ class DatabaseAuthService:
                     return None
             return session
 
-        async with self._session_factory() as db_session:
-            storage = self._get_storage(db_session)
-            session = await storage.get_session(session_id)
-
+        cached = self._session_cache.get(session_id)
+        if cached is not None and cached[0] > time.monotonic():
+            session = cached[1]
+        else:
+            session = await self._session_loader.load(session_id)
             if not session:
+                self._session_cache.pop(session_id, None)
                 return None
-
-            # Check expiration (handle both naive and aware datetimes)
-            if session.expires_at:
-                expires = session.expires_at
-                if expires.tzinfo is None:
-                    expires = expires.replace(tzinfo=UTC)
-                if expires < now:
-                    await storage.delete_session(session_id)
+            self._cache_session(session)
+
+        # Check expiration (handle both naive and aware datetimes)
+        if session.expires_at:
+            expires = session.expires_at
+            if expires.tzinfo is None:
+                expires = expires.replace(tzinfo=UTC)
+            if expires < now:
+                self._session_cache.pop(session_id, None)
+                async with self._session_factory() as db_session:
+                    await self._get_storage(db_session).delete_session(session_id)
                     await db_session.commit()
-                    return None
+                return None
 
-            return session
+        return session
 
     async def delete_session(self, session_id: str) -> bool:
         """Delete a session (logout)."""
@@ -141,6 +239,7 @@ class DatabaseAuthService:
                 return True
             return False
 
+        self._session_cache.pop(session_id, None)
         async with self._session_factory() as db_session:
             storage = self._get_storage(db_session)
             result = await storage.delete_session(session_id)
@@ -165,6 +264,7 @@ class DatabaseAuthService:
                 await storage.delete_session(session_id)
                 await storage.create_session(session)
                 await db_session.commit()
+            self._cache_session(session)
         else:
             # In-memory - already updated since we mutated the object
             self._memory_sessions[session_id] = session
@@ -183,6 +283,17 @@ class DatabaseAuthService:
             storage = self._get_storage(db_session)
             return await storage.get_user(user_id)
 
+    async def get_user_with_stats(self, user_id: UUID) -> tuple[User | None, UserStats | None]:
+        """Get a user and their stats in one lookup."""
+        if not self._session_factory:
+            # In-memory fallback
+            return self._memory_users.get(user_id), self._memory_stats.get(user_id)
+
+        async with self._session_factory() as db_session:
+            storage = self._get_storage(db_session)
+            found = await storage.get_users_with_stats([user_id])
+        return found[0] if found else (None, None)
+
     async def get_user_by_oauth(self, provider: OAuthProvider, oauth_id: str) -> User | None:
         """Get a user by OAuth provider and ID."""
         if not self._session_factory:
@@ -220,10 +331,8 @@ class DatabaseAuthService:
         if self._session_factory:
             async with self._session_factory() as db_session:
                 storage = self._get_storage(db_session)
-                user = await storage.create_user(user)
-                # Initialize stats
-                stats = UserStats(user_id=user.id)
-                await storage.create_stats(stats)
+                # Create the user and initial stats in a single flush
+                user, _ = await storage.create_user_with_stats(user, UserStats(user_id=user.id))
                 await db_session.commit()
         else:
             # In-memory fallback
@@ -249,6 +358,7 @@ class DatabaseAuthService:
                 storage = self._get_storage(db_session)
                 user = await storage.update_user(user)
                 await db_session.commit()
+            self._invalidate_leaderboard()
         else:
             # In-memory fallback
             self._memory_users[user.id] = user
@@ -303,6 +413,7 @@ class DatabaseAuthService:
                 storage = self._get_storage(db_session)
                 stats = await storage.update_stats(stats)
                 await db_session.commit()
+            self._invalidate_leaderboard()
         else:
             # In-memory fallback
             self._memory_stats[stats.user_id] = stats
@@ -321,33 +432,55 @@ class DatabaseAuthService:
         drawings_guessed: int,
     ) -> UserStats | None:
         """Record a game result for a user."""
-        stats = await self.get_user_stats(user_id)
-        if not stats:
-            return None
+        updated = await self.record_game_results(
+            [
+                GameResult(
+                    user_id=user_id,
+                    score=score,
+                    won=won,
+                    correct_guesses=correct_guesses,
+                    total_guesses=total_guesses,
+                    total_guess_time_ms=total_guess_time_ms,
+                    fastest_guess_ms=fastest_guess_ms,
+                    drawings_completed=drawings_completed,
+                    drawings_guessed=drawings_guessed,
+                )
+            ]
+        )
+        return updated[0] if updated else None
 
-        stats.games_played += 1
-        stats.total_score += score
-        stats.correct_guesses += correct_guesses
-        stats.total_guesses += total_guesses
-        stats.total_guess_time_ms += total_guess_time_ms
-        stats.drawings_completed += drawings_completed
-        stats.drawings_guessed += drawings_guessed
-
-        if won:
-            stats.games_won += 1
-            stats.current_win_streak += 1
-            stats.best_win_streak = max(stats.best_win_streak, stats.current_win_streak)
-        else:
-            stats.current_win_streak = 0
+    async def record_game_results(self, results: Sequence[GameResult]) -> list[UserStats]:
+        """Record the results of a finished game for several users at once.
 
-        stats.best_game_score = max(stats.best_game_score, score)
+        All updates share one database session and are committed together.
 
-        if fastest_guess_ms is not None and (
-            stats.fastest_guess_ms is None or fastest_guess_ms < stats.fastest_guess_ms
-        ):
-            stats.fastest_guess_ms = fastest_guess_ms
+        Args:
+            results: Per-user game results.
+
+        Returns:
+            Updated stats for each user that has a stats record.
+        """
+        updated: list[UserStats] = []
+        if not self._session_factory:
+            # In-memory fallback
+            for result in results:
+                stats = self._memory_stats.get(result.user_id)
+                if stats:
+                    stats.apply_game_result(result)
+                    updated.append(await self.update_user_stats(stats))
+            return updated
 
-        return await self.update_user_stats(stats)
+        async with self._session_factory() as db_session:
+            storage = self._get_storage(db_session)
+            for result in results:
+                stats = await storage.get_stats(result.user_id)
+                if stats:
+                    stats.apply_game_result(result)
+                    stats.updated_at = datetime.now(UTC)
+                    updated.append(await storage.update_stats(stats))
+            await db_session.commit()
+        self._invalidate_leaderboard()
+        return updated
 
     # === Leaderboards ===
 
@@ -356,7 +489,11 @@ class DatabaseAuthService:
         category: str = "wins",
         limit: int = 10,
     ) -> list[tuple[User, UserStats]]:
-        """Get leaderboard for a category."""
+        """Get leaderboard for a category.
+
+        Database results are cached per (category, limit) for a short TTL and
+        dropped whenever stats or users change.
+        """
         if not self._session_factory:
             # In-memory fallback
             entries: list[tuple[User, UserStats]] = []
@@ -372,6 +509,8 @@ class DatabaseAuthService:
                 entries = [e for e in entries if e[1].fastest_guess_ms is not None]
                 entries.sort(key=lambda x: x[1].fastest_guess_ms or float("inf"))
             elif category == "drawer":
+                # Match the database query: users who never drew have no success rate
+                entries = [e for e in entries if e[1].drawings_completed > 0]
                 entries.sort(key=lambda x: x[1].drawing_success_rate, reverse=True)
             elif category == "games":
                 entries.sort(key=lambda x: x[1].games_played, reverse=True)
@@ -380,9 +519,30 @@ class DatabaseAuthService:
 
             return entries[:limit]
 
-        async with self._session_factory() as db_session:
-            storage = self._get_storage(db_session)
-            return await storage.get_leaderboard(category, limit)
+        key = (category, limit)
+        cached = self._leaderboard_cache.get(key)
+        if cached is not None and cached[0] > time.monotonic():
+            return list(cached[1])
+
+        # Only one request refreshes at a time; the others then read its result
+        async with self._leaderboard_lock:
+            cached = self._leaderboard_cache.get(key)
+            if cached is not None and cached[0] > time.monotonic():
+                return list(cached[1])
+
+            generation = self._leaderboard_generation
+            async with self._session_factory() as db_session:
+                storage = self._get_storage(db_session)
+                entries = await storage.get_leaderboard(category, limit)
+            # A write committed during the read may not be in these rows; don't cache them
+            if generation == self._leaderboard_generation:
+                self._leaderboard_cache[key] = (time.monotonic() + _LEADERBOARD_TTL_SECONDS, entries)
+        return list(entries)
+
+    def _invalidate_leaderboard(self) -> None:
+        """Drop cached leaderboards after stats or users change."""
+        self._leaderboard_generation += 1
+        self._leaderboard_cache.clear()
 
     # === OAuth Helpers (same as sync version) ===
 
@@ -126,6 +126,61 @@ class UserStats:
             return 0.0
         return (self.games_won / self.games_played) * 100
 
+    def apply_game_result(self, result: GameResult) -> None:
+        """Fold a finished game into these stats.
+
+        Args:
+            result: The user's result for the game.
+        """
+        self.games_played += 1
+        self.total_score += result.score
+        self.correct_guesses += result.correct_guesses
+        self.total_guesses += result.total_guesses
+        self.total_guess_time_ms += result.total_guess_time_ms
+        self.drawings_completed += result.drawings_completed
+        self.drawings_guessed += result.drawings_guessed
+
+        if result.won:
+            self.games_won += 1
+            self.current_win_streak += 1
+            self.best_win_streak = max(self.best_win_streak, self.current_win_streak)
+        else:
+            self.current_win_streak = 0
+
+        self.best_game_score = max(self.best_game_score, result.score)
+
+        if result.fastest_guess_ms is not None and (
+            self.fastest_guess_ms is None or result.fastest_guess_ms < self.fastest_guess_ms
+        ):
+            self.fastest_guess_ms = result.fastest_guess_ms
+
+
+@dataclass
+class GameResult:
+    """A single user's result for a finished game.
+
+    Attributes:
+        user_id: The user identifier.
+        score: Points earned in the game.
+        won: Whether the user won (highest score).
+        correct_guesses: Number of correct guesses.
+        total_guesses: Total guesses made.
+        total_guess_time_ms: Total time spent on correct guesses.
+        fastest_guess_ms: Fastest correct guess time.
+        drawings_completed: Number of drawings completed.
+        drawings_guessed: Number of user's drawings that were guessed.
+    """
+
+    user_id: UUID
+    score: int
+    won: bool
+    correct_guesses: int
+    total_guesses: int
+    total_guess_time_ms: int
+    fastest_guess_ms: int | None
+    drawings_completed: int
+    drawings_guessed: int
+
 
 @dataclass
 class Session:
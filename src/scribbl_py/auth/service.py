@@ -10,7 +10,7 @@ from uuid import UUID, uuid4
 import structlog
 
 from scribbl_py.auth.config import OAUTH_URLS, OAuthConfig
-from scribbl_py.auth.models import OAuthProvider, Session, User, UserStats
+from scribbl_py.auth.models import GameResult, OAuthProvider, Session, User, UserStats
 
 logger = structlog.get_logger(__name__)
 
@@ -318,27 +318,19 @@ class AuthService:
         if not stats:
             return None
 
-        stats.games_played += 1
-        stats.total_score += score
-        stats.correct_guesses += correct_guesses
-        stats.total_guesses += total_guesses
-        stats.total_guess_time_ms += total_guess_time_ms
-        stats.drawings_completed += drawings_completed
-        stats.drawings_guessed += drawings_guessed
-
-        if won:
-            stats.games_won += 1
-            stats.current_win_streak += 1
-            stats.best_win_streak = max(stats.best_win_streak, stats.current_win_streak)
-        else:
-            stats.current_win_streak = 0
-
-        stats.best_game_score = max(stats.best_game_score, score)
-
-        if fastest_guess_ms is not None and (
-            stats.fastest_guess_ms is None or fastest_guess_ms < stats.fastest_guess_ms
-        ):
-            stats.fastest_guess_ms = fastest_guess_ms
+        stats.apply_game_result(
+            GameResult(
+                user_id=user_id,
+                score=score,
+                won=won,
+                correct_guesses=correct_guesses,
+                total_guesses=total_guesses,
+                total_guess_time_ms=total_guess_time_ms,
+                fastest_guess_ms=fastest_guess_ms,
+                drawings_completed=drawings_completed,
+                drawings_guessed=drawings_guessed,
+            )
+        )
 
         return self.update_user_stats(stats)
 
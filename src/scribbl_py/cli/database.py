@@ -459,7 +459,7 @@ def tasks_list() -> None:
 
     # Static list of configured tasks
     tasks_info = [
-        ("cleanup_expired_sessions", "Daily @ 3:00 AM", "Remove expired user sessions"),
+        ("cleanup_expired_sessions", "Every minute", "Remove expired user sessions"),
         ("reset_weekly_stats", "Monday @ 00:00", "Reset weekly win streaks"),
         ("cleanup_old_canvases", "Daily @ 4:00 AM", "Remove abandoned canvases"),
         ("aggregate_telemetry", "Hourly", "Aggregate telemetry data"),
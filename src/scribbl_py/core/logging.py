@@ -15,6 +15,9 @@ import structlog
 if TYPE_CHECKING:
     from litestar.types import ASGIApp, Message, Receive, Scope, Send
 
+# Whether DEBUG events pass the configured level; structlog logs every level until configured
+_debug_enabled = True
+
 
 def configure_logging(*, debug: bool = False, json_logs: bool = False) -> None:
     """Configure structured logging for the application.
@@ -23,6 +26,9 @@ def configure_logging(*, debug: bool = False, json_logs: bool = False) -> None:
         debug: Enable debug level logging.
         json_logs: Output logs as JSON (for production).
     """
+    global _debug_enabled  # noqa: PLW0603
+    _debug_enabled = debug
+
     processors: list = [
         structlog.contextvars.merge_contextvars,
         structlog.processors.add_log_level,
@@ -56,6 +62,17 @@ def configure_logging(*, debug: bool = False, json_logs: bool = False) -> None:
     )
 
 
+def is_debug_enabled() -> bool:
+    """Check whether DEBUG log events are emitted with the current logging configuration.
+
+    Hot paths use this to skip building debug event fields that would be filtered out.
+
+    Returns:
+        True if :func:`configure_logging` enabled debug logging or has not been called.
+    """
+    return _debug_enabled
+
+
 class CorrelationIdMiddleware:
     """Middleware that adds correlation IDs to all requests.
 
@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
+from functools import cached_property
+from operator import attrgetter
 from uuid import UUID, uuid4
 
 from scribbl_py.core.style import ElementStyle
@@ -53,6 +55,11 @@ class Element:
     locked: bool = False
     created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
 
+    @cached_property
+    def created_at_iso(self) -> str:
+        """ISO 8601 form of ``created_at``, computed once per element."""
+        return self.created_at.isoformat()
+
 
 @dataclass
 class Stroke(Element):
@@ -158,3 +165,8 @@ class Canvas:
     elements: list[Element] = field(default_factory=list)
     created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
     updated_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+
+    @property
+    def elements_by_zindex(self) -> list[Element]:
+        """Elements sorted by z_index for rendering (lowest first)."""
+        return sorted(self.elements, key=attrgetter("z_index"))
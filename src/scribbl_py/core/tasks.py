@@ -21,6 +21,9 @@ if TYPE_CHECKING:
 # Lazy Huey instance - only created when tasks extra is installed
 _huey_instance: SqliteHuey | None = None
 
+# Expired sessions are deleted in batches of this size, one transaction each
+_SESSION_CLEANUP_BATCH_SIZE = 1000
+
 
 @dataclass
 class TaskQueueSettings:
@@ -119,8 +122,8 @@ def register_tasks() -> None:
     # Import crontab here to avoid import errors when huey not installed
     from huey import crontab
 
-    # Register cleanup_expired_sessions - runs daily at 3 AM
-    @huey.periodic_task(crontab(minute="0", hour="3"))
+    # Register cleanup_expired_sessions - runs every minute so each sweep stays small
+    @huey.periodic_task(crontab(minute="*"))
     def cleanup_expired_sessions_task() -> dict:
         """Clean up expired sessions from the database."""
         return _run_cleanup_expired_sessions()
@@ -172,9 +175,13 @@ def _run_cleanup_expired_sessions() -> dict:
                 from scribbl_py.storage.db.auth_storage import AuthDatabaseStorage
 
                 storage = AuthDatabaseStorage(session)
-                deleted = await storage.delete_expired_sessions()
-                await session.commit()
-                return deleted
+                deleted = 0
+                while True:
+                    batch = await storage.delete_expired_sessions(batch_size=_SESSION_CLEANUP_BATCH_SIZE)
+                    await session.commit()
+                    deleted += batch
+                    if batch < _SESSION_CLEANUP_BATCH_SIZE:
+                        return deleted
         except ImportError:
             logger.warning("Database not configured, skipping session cleanup")
             return 0
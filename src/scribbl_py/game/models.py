@@ -15,6 +15,8 @@ from enum import StrEnum
 from typing import Any
 from uuid import UUID, uuid4
 
+from scribbl_py.game.exceptions import InsufficientWordsError
+
 
 class GameState(StrEnum):
     """State of the game room.
@@ -122,9 +124,19 @@ class Player:
         self.has_guessed = False
         self.guess_time = None
 
+    def full_reset(self) -> None:
+        """Reset score and per-round state for a new game."""
+        self.score = 0
+        self.has_guessed = False
+        self.guess_time = None
+
     def award_points(self, points: int) -> None:
         """Add points to player's total score.
 
+        This does not refresh the owning room's cached leaderboard. For a player in a
+        room, call :meth:`GameRoom.award_points` instead; the same applies to writing
+        ``score``, ``is_spectator`` or ``connection_state`` directly.
+
         Args:
             points: Number of points to award.
         """
@@ -193,7 +205,7 @@ class WordBank:
             self.words.remove(normalized)
 
 
-@dataclass
+@dataclass(slots=True)
 class Guess:
     """Represents a player's guess attempt.
 
@@ -218,7 +230,7 @@ class Guess:
     timestamp: datetime = field(default_factory=lambda: datetime.now(UTC))
 
 
-@dataclass
+@dataclass(slots=True)
 class ChatMessage:
     """Chat message for guessing and communication.
 
@@ -308,6 +320,32 @@ class Round:
     scores: dict[str, int] = field(default_factory=dict)  # player_id -> points
     strokes: list[dict] = field(default_factory=list)  # Drawing strokes for replay
     is_active: bool = False
+    # Lowercased word_options for O(1) selection checks, kept in sync by set_word_options
+    _word_options_lower: set[str] = field(default_factory=set, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Precompute lowercased word options passed to the constructor."""
+        self._word_options_lower = {w.lower() for w in self.word_options}
+
+    def set_word_options(self, options: list[str]) -> None:
+        """Set the words offered to the drawer.
+
+        Args:
+            options: Words the drawer can choose from.
+        """
+        self.word_options = options
+        self._word_options_lower = {w.lower() for w in options}
+
+    def is_word_option(self, word: str) -> bool:
+        """Check whether a word is one of the offered options (case-insensitive).
+
+        Args:
+            word: Word to check.
+
+        Returns:
+            True if the word matches one of the word options.
+        """
+        return word.lower() in self._word_options_lower
 
     def add_stroke(self, stroke: dict) -> None:
         """Add a drawing stroke to the round.
@@ -545,6 +583,8 @@ class GameRoom:
         created_at: When the room was created.
         started_at: When the game started (left lobby).
         ended_at: When the game ended.
+        active_count: Number of connected players (including spectators), kept in sync by
+            add_player and set_player_state.
     """
 
     id: UUID = field(default_factory=uuid4)
@@ -564,18 +604,91 @@ class GameRoom:
     started_at: datetime | None = None
     ended_at: datetime | None = None
     metadata: dict[str, Any] = field(default_factory=dict)
+    active_count: int = field(default=0, init=False, compare=False)
+    # player.id -> player index over ``players`` for O(1) get_player lookups; kept in sync by
+    # add_player, add_spectator and replace_players
+    _players_by_id: dict[UUID, Player] = field(default_factory=dict, init=False, repr=False, compare=False)
+    # Shuffled custom words for custom-words-only games, the next offer position, and a
+    # tuple(settings.custom_words) snapshot of the words the pool was built from
+    _custom_pool: list[str] = field(default_factory=list, init=False, repr=False, compare=False)
+    _custom_pool_pos: int = field(default=0, init=False, repr=False, compare=False)
+    _custom_pool_key: tuple[str, ...] | None = field(default=None, init=False, repr=False, compare=False)
+    # Sorted leaderboard, recomputed after scores or connections change (see award_points)
+    _leaderboard: list[tuple[Player, int]] = field(default_factory=list, init=False, repr=False, compare=False)
+    _leaderboard_dirty: bool = field(default=True, init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
-        """Generate room code if not provided."""
+        """Generate room code if not provided and count connected players."""
         if not self.room_code:
             # Generate 6-character alphanumeric code
             self.room_code = "".join(random.choices(string.ascii_uppercase + string.digits, k=6))
+        self.active_count = sum(1 for p in self.players if p.connection_state == PlayerState.CONNECTED)
+        self._players_by_id = {p.id: p for p in self.players}
+
+    def replace_players(self, players: list[Player]) -> None:
+        """Replace the room's player list and rebuild the state derived from it.
+
+        Assigning to ``players`` directly leaves the player index, the connected
+        count and the cached leaderboard stale; use this method instead.
+
+        Args:
+            players: New list of players and spectators.
+        """
+        self.players = players
+        self.active_count = sum(1 for p in players if p.connection_state == PlayerState.CONNECTED)
+        self._players_by_id = {p.id: p for p in players}
+        self._leaderboard_dirty = True
+
+    def can_add_player(self, player: Player) -> str | None:
+        """Check whether a player may join the room.
+
+        Spectators can join regardless of room capacity or game state (except GAME_OVER).
+        Regular players can only join in LOBBY or DRAWING state when room is not full.
+
+        Args:
+            player: Player that wants to join.
+
+        Returns:
+            The reason the player cannot join, or None if they can.
+        """
+        if player.is_spectator:
+            return self.can_add_spectator(player)
+
+        # Check if user is banned
+        if player.user_id and player.user_id in self.banned_user_ids:
+            return "You have been banned from this room"
+
+        # Regular players have restrictions
+        if len(self.active_guessers()) >= self.settings.max_players:
+            return "Room is full"
+
+        if self.game_state not in (GameState.LOBBY, GameState.DRAWING):
+            return "Cannot join: game already in progress"
+
+        return None
+
+    def can_add_spectator(self, player: Player) -> str | None:
+        """Check whether a spectator may join the room.
+
+        Spectators can join anytime except when banned or after the game is over.
+
+        Args:
+            player: Spectator that wants to join.
+
+        Returns:
+            The reason the spectator cannot join, or None if they can.
+        """
+        if player.user_id and player.user_id in self.banned_user_ids:
+            return "You have been banned from this room"
+        if self.game_state == GameState.GAME_OVER:
+            return "Cannot spectate: game is over"
+        return None
 
     def add_player(self, player: Player) -> None:
         """Add a player to the room.
 
-        Spectators can join regardless of room capacity or game state (except GAME_OVER).
-        Regular players can only join in LOBBY state when room is not full.
+        See :meth:`can_add_player` for the join rules. Callers that already checked
+        them can use :meth:`admit_player` to skip the second check.
 
         Args:
             player: Player to add.
@@ -583,28 +696,72 @@ class GameRoom:
         Raises:
             ValueError: If room is full (non-spectators), banned, or cannot join in current state.
         """
-        # Check if user is banned
-        if player.user_id and player.user_id in self.banned_user_ids:
-            raise ValueError("You have been banned from this room")
-
-        if player.is_spectator:
-            # Spectators can join anytime except game over
-            if self.game_state == GameState.GAME_OVER:
-                raise ValueError("Cannot spectate: game is over")
-        else:
-            # Regular players have restrictions
-            if len(self.active_guessers()) >= self.settings.max_players:
-                raise ValueError("Room is full")
+        reason = self.can_add_player(player)
+        if reason:
+            raise ValueError(reason)
+        self.admit_player(player)
 
-            if self.game_state not in (GameState.LOBBY, GameState.DRAWING):
-                raise ValueError("Cannot join: game already in progress")
+    def admit_player(self, player: Player) -> None:
+        """Add a player to the room without checking the join rules.
 
+        Args:
+            player: Player to add; must have passed :meth:`can_add_player`.
+        """
         # First non-spectator player becomes host
         if not self.players and not player.is_spectator:
             player.is_host = True
             self.host_id = player.id
 
         self.players.append(player)
+        self._players_by_id[player.id] = player
+        if player.connection_state == PlayerState.CONNECTED:
+            self.active_count += 1
+        self._leaderboard_dirty = True
+
+    def add_spectator(self, player: Player) -> None:
+        """Add a spectator without checking the join rules.
+
+        Spectators never take over as host and do not count towards capacity, so this
+        only records the player.
+
+        Args:
+            player: Spectator to add; must have passed :meth:`can_add_spectator`.
+        """
+        self.players.append(player)
+        self._players_by_id[player.id] = player
+        if player.connection_state == PlayerState.CONNECTED:
+            self.active_count += 1
+
+    def set_player_state(self, player: Player, state: PlayerState) -> None:
+        """Change a player's connection state and keep ``active_count`` in sync.
+
+        Args:
+            player: Player in this room.
+            state: New connection state.
+        """
+        was_connected = player.connection_state == PlayerState.CONNECTED
+        player.connection_state = state
+        self.active_count += (state == PlayerState.CONNECTED) - was_connected
+        self._leaderboard_dirty = True
+
+    def award_points(self, player: Player, points: int) -> None:
+        """Award points to a player in this room.
+
+        Use this instead of :meth:`Player.award_points` so the cached leaderboard
+        is refreshed.
+
+        Args:
+            player: Player in this room.
+            points: Number of points to award.
+        """
+        player.award_points(points)
+        self._leaderboard_dirty = True
+
+    def reset_scores(self) -> None:
+        """Reset every player's score and round state for a new game."""
+        for player in self.players:
+            player.full_reset()
+        self._leaderboard_dirty = True
 
     def remove_player(self, player_id: UUID) -> None:
         """Remove a player from the room.
@@ -614,7 +771,7 @@ class GameRoom:
         """
         player = self.get_player(player_id)
         if player:
-            player.connection_state = PlayerState.LEFT
+            self.set_player_state(player, PlayerState.LEFT)
 
             # Transfer host if needed
             if player.is_host:
@@ -634,7 +791,7 @@ class GameRoom:
         Returns:
             Player if found, None otherwise.
         """
-        return next((p for p in self.players if p.id == player_id), None)
+        return self._players_by_id.get(player_id)
 
     def active_players(self) -> list[Player]:
         """Get all connected players (including spectators).
@@ -660,13 +817,25 @@ class GameRoom:
         """
         return [p for p in self.players if p.connection_state == PlayerState.CONNECTED and p.is_spectator]
 
-    def start_game(self) -> None:
-        """Start the game, transitioning from LOBBY to first round."""
+    def can_start_game(self) -> str | None:
+        """Check whether the game can be started.
+
+        Returns:
+            The reason the game cannot start, or None if it can.
+        """
         if self.game_state != GameState.LOBBY:
-            raise ValueError("Game already started")
+            return "Game already started"
 
         if len(self.active_guessers()) < 2:
-            raise ValueError("Need at least 2 players to start")
+            return "Need at least 2 players to start"
+
+        return None
+
+    def start_game(self) -> None:
+        """Start the game, transitioning from LOBBY to first round."""
+        reason = self.can_start_game()
+        if reason:
+            raise ValueError(reason)
 
         self.started_at = datetime.now(UTC)
         self.game_state = GameState.WORD_SELECTION
@@ -720,17 +889,67 @@ class GameRoom:
         self.game_state = GameState.ROUND_END
         self.current_round_number += 1
 
+    def next_custom_word_options(self, count: int = 3) -> list[str]:
+        """Draw the next word options from the room's custom words.
+
+        Custom words are shuffled once and offered in order, ``count`` at a time, so every
+        word is offered before any repeats. When fewer than ``count`` words are left, the
+        pool is reshuffled behind the leftover words. The pool is rebuilt whenever the
+        contents of ``settings.custom_words`` change.
+
+        Args:
+            count: Number of word options to return.
+
+        Returns:
+            Distinct custom words for the drawer to choose from.
+
+        Raises:
+            InsufficientWordsError: If there are fewer than ``count`` custom words.
+        """
+        words = self.settings.custom_words
+        # A snapshot of the words, so both replacing the list and editing it in place are seen
+        key = tuple(words)
+        if key != self._custom_pool_key:
+            self._custom_pool = [w for w in words if w]
+            random.shuffle(self._custom_pool)
+            self._custom_pool_pos = 0
+            self._custom_pool_key = key
+
+        pool = self._custom_pool
+        if len(pool) < count:
+            raise InsufficientWordsError(count, len(pool))
+
+        pos = self._custom_pool_pos
+        if pos + count > len(pool):
+            # Start a new cycle with the leftover words first so options stay distinct
+            rest = pool[:pos]
+            random.shuffle(rest)
+            pool[:] = pool[pos:] + rest
+            pos = 0
+
+        self._custom_pool_pos = pos + count
+        return pool[pos : pos + count]
+
     def get_leaderboard(self) -> list[tuple[Player, int]]:
         """Get sorted leaderboard of players and scores (excludes spectators).
 
+        The sorted result is cached until points are awarded through :meth:`award_points`,
+        scores are reset, players are replaced through :meth:`replace_players`, or a player
+        joins or changes connection state through :meth:`set_player_state`. Changing a
+        player's ``score``, ``is_spectator`` or ``connection_state`` by any other route
+        leaves the cache stale.
+
         Returns:
             List of (player, score) tuples sorted by score descending.
         """
-        return sorted(
-            [(p, p.score) for p in self.active_guessers()],
-            key=lambda x: x[1],
-            reverse=True,
-        )
+        if self._leaderboard_dirty:
+            self._leaderboard = sorted(
+                [(p, p.score) for p in self.active_guessers()],
+                key=lambda x: x[1],
+                reverse=True,
+            )
+            self._leaderboard_dirty = False
+        return list(self._leaderboard)
 
     def total_turns(self) -> int:
         """Calculate total turns in the game.
@@ -803,7 +1022,7 @@ class GameRoom:
         if target.is_host:
             raise ValueError("Cannot kick the host")
 
-        target.connection_state = PlayerState.LEFT
+        self.set_player_state(target, PlayerState.LEFT)
         return target
 
     def ban_player(self, banner_id: UUID, target_id: UUID) -> Player | None:
@@ -835,7 +1054,7 @@ class GameRoom:
         if target.user_id:
             self.banned_user_ids.add(target.user_id)
 
-        target.connection_state = PlayerState.LEFT
+        self.set_player_state(target, PlayerState.LEFT)
         return target
 
     def unban_player(self, unbanner_id: UUID, user_id: str) -> bool:
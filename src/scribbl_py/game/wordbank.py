@@ -374,10 +374,13 @@ class WordBank:
         """Determine if a guess is close to the target word.
 
         Uses multiple heuristics:
-        1. Sequence similarity ratio (main metric)
-        2. Common prefix/suffix detection
-        3. Single character difference detection
-        4. Plural/singular variations
+        1. Plural/singular variations
+        2. Single character difference detection
+        3. Common prefix detection
+        4. Sequence similarity ratio
+
+        The cheap string checks run first; the similarity ratio is only computed when
+        its upper bounds (``real_quick_ratio``/``quick_ratio``) can reach the threshold.
 
         Args:
             word: The normalized target word.
@@ -386,11 +389,6 @@ class WordBank:
         Returns:
             True if the guess is considered close to the word.
         """
-        # Calculate sequence similarity
-        similarity = SequenceMatcher(None, word, guess).ratio()
-        if similarity >= self.similarity_threshold:
-            return True
-
         # Check for plural/singular variations
         if self._is_plural_variation(word, guess):
             return True
@@ -405,7 +403,14 @@ class WordBank:
             if word[:min_prefix_len] == guess[:min_prefix_len]:
                 return True
 
-        return False
+        # Calculate sequence similarity
+        threshold = self.similarity_threshold
+        matcher = SequenceMatcher(None, word, guess)
+        return (
+            matcher.real_quick_ratio() >= threshold
+            and matcher.quick_ratio() >= threshold
+            and matcher.ratio() >= threshold
+        )
 
     def _is_plural_variation(self, word: str, guess: str) -> bool:
         """Check if word and guess are plural/singular variations.
@@ -459,12 +464,10 @@ class WordBank:
             differences = sum(1 for w, g in zip(word, guess, strict=False) if w != g)
             return differences == 1
 
-        # Check for single insertion/deletion
+        # Check for single insertion/deletion: skip the common prefix, then the rest of
+        # the longer word past the extra character must equal the rest of the shorter one
         shorter, longer = (word, guess) if len(word) < len(guess) else (guess, word)
-        for i in range(len(longer)):
-            # Try removing character at position i from longer word
-            test = longer[:i] + longer[i + 1 :]
-            if test == shorter:
-                return True
-
-        return False
+        i = 0
+        while i < len(shorter) and shorter[i] == longer[i]:
+            i += 1
+        return shorter[i:] == longer[i + 1 :]
@@ -16,6 +16,7 @@ from scribbl_py.realtime.manager import ConnectionManager
 from scribbl_py.services.canvas import CanvasService
 from scribbl_py.services.export import ExportService
 from scribbl_py.services.game import GameService
+from scribbl_py.services.telemetry import TelemetryService, get_telemetry
 from scribbl_py.storage.memory import InMemoryStorage
 from scribbl_py.web.router import create_router
 
@@ -177,6 +178,7 @@ class ScribblPlugin(InitPluginProtocol):
         self._game_ws_handler: Any = None
         self._auth_service: DatabaseAuthService | None = None
         self._oauth_config: OAuthConfig | None = None
+        self._telemetry: TelemetryService | None = None
 
     def on_app_init(self, app_config: AppConfig) -> AppConfig:  # noqa: C901, PLR0915
         """Initialize the plugin during application startup.
@@ -202,8 +204,9 @@ class ScribblPlugin(InitPluginProtocol):
         # Create canvas service with the storage backend
         self._service = CanvasService(self._storage)
 
-        # Create export service
+        # Create export service; its tiled-PNG worker pool is stopped with the app
         self._export_service = ExportService()
+        app_config.on_shutdown.append(self._export_service.shutdown)
 
         # Create game service with word bank
         word_bank = WordBank()
@@ -215,6 +218,9 @@ class ScribblPlugin(InitPluginProtocol):
         # Store OAuth config for lazy auth service creation
         self._oauth_config = OAuthConfig()
 
+        # Resolve the telemetry service once so request paths get it by injection
+        self._telemetry = get_telemetry()
+
         # Register service as a dependency provider
         def provide_service() -> CanvasService:
             """Dependency provider for CanvasService.
@@ -260,6 +266,17 @@ class ScribblPlugin(InitPluginProtocol):
                 raise RuntimeError(msg)
             return self._game_service
 
+        def provide_telemetry() -> TelemetryService:
+            """Dependency provider for TelemetryService.
+
+            Returns:
+                The initialized TelemetryService instance.
+            """
+            if self._telemetry is None:
+                msg = "Telemetry service not initialized"
+                raise RuntimeError(msg)
+            return self._telemetry
+
         def provide_auth_service(request: Any) -> DatabaseAuthService:
             """Dependency provider for DatabaseAuthService.
 
@@ -302,6 +319,10 @@ class ScribblPlugin(InitPluginProtocol):
             provide_game_service,
             sync_to_thread=False,
         )
+        app_config.dependencies["telemetry"] = Provide(
+            provide_telemetry,
+            sync_to_thread=False,
+        )
         app_config.dependencies["auth_service"] = Provide(
             provide_auth_service,
             sync_to_thread=False,
@@ -346,6 +367,7 @@ class ScribblPlugin(InitPluginProtocol):
                 game_service=self._game_service,
                 connection_manager=self._connection_manager,
                 auth_service=self._auth_service,  # Will be set lazily
+                telemetry=self._telemetry,
             )
             app_config.route_handlers.append(game_ws_router)
 
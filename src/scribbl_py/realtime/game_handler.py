@@ -12,6 +12,7 @@ from uuid import UUID
 
 import structlog
 
+from scribbl_py.auth.models import GameResult
 from scribbl_py.game.models import (
     GuessResult,
     Player,
@@ -21,7 +22,7 @@ from scribbl_py.game.models import (
 from scribbl_py.game.moderation import filter_message
 from scribbl_py.realtime.manager import ConnectionManager
 from scribbl_py.services.game import GameNotFoundError, GameStateError, PlayerNotFoundError
-from scribbl_py.services.telemetry import get_telemetry
+from scribbl_py.services.telemetry import TelemetryService, get_telemetry
 
 if TYPE_CHECKING:
     from litestar import Router, WebSocket
@@ -103,6 +104,7 @@ class GameWebSocketHandler:
         game_service: GameService,
         connection_manager: ConnectionManager | None = None,
         auth_service: DatabaseAuthService | None = None,
+        telemetry: TelemetryService | None = None,
     ) -> None:
         """Initialize the game WebSocket handler.
 
@@ -110,10 +112,12 @@ class GameWebSocketHandler:
             game_service: The game service instance.
             connection_manager: Optional connection manager for advanced tracking.
             auth_service: Optional auth service for user stats tracking.
+            telemetry: Telemetry service (defaults to the global instance).
         """
         self._service = game_service
         self._manager = connection_manager or ConnectionManager()
         self._auth_service = auth_service
+        self._telemetry = telemetry or get_telemetry()
         self._plugin: Any = None  # Set by plugin for lazy auth service access
         self._connections: dict[int, GameConnection] = {}  # socket_id -> connection
         self._room_sockets: dict[UUID, set[int]] = {}  # room_id -> socket_ids
@@ -162,13 +166,7 @@ class GameWebSocketHandler:
 
         try:
             # Send current list of open public lobbies
-            from scribbl_py.game.models import GameState
-
-            open_lobbies = [
-                self._serialize_lobby(room)
-                for room in self._service._rooms.values()
-                if room.game_state == GameState.LOBBY and room.settings.is_public
-            ]
+            open_lobbies = [self._serialize_lobby(room) for room in self._service.get_lobby_rooms()]
 
             await self._send(
                 socket,
@@ -223,7 +221,7 @@ class GameWebSocketHandler:
             "id": str(room.id),
             "name": room.name,
             "code": room.room_code,
-            "player_count": len(room.active_players()),
+            "player_count": room.active_count,
             "max_players": room.settings.max_players,
             "is_public": room.settings.is_public,
         }
@@ -383,7 +381,7 @@ class GameWebSocketHandler:
         self._room_sockets[room_id].add(socket_id)
 
         # Track telemetry
-        telemetry = get_telemetry()
+        telemetry = self._telemetry
         telemetry.track_connection_opened("websocket")
         telemetry.track_player_joined(room_id, player.id, is_spectator=False)
 
@@ -460,7 +458,7 @@ class GameWebSocketHandler:
             {
                 "type": GameMessageType.PLAYER_JOINED,
                 "player": self._serialize_player(player),
-                "player_count": len(room.active_players()),
+                "player_count": room.active_count,
             },
             exclude_socket=socket_id,
         )
@@ -546,8 +544,8 @@ class GameWebSocketHandler:
         )
 
         # Track telemetry
-        telemetry = get_telemetry()
-        telemetry.track_game_started(room_id, len(room.active_players()))
+        telemetry = self._telemetry
+        telemetry.track_game_started(room_id, room.active_count)
 
         # Broadcast game started
         await self._broadcast_to_room(
@@ -662,7 +660,7 @@ class GameWebSocketHandler:
         room = self._service.get_room(room_id)
 
         # Track telemetry
-        telemetry = get_telemetry()
+        telemetry = self._telemetry
         telemetry.track_guess(
             room_id,
             connection.player_id,
@@ -1175,7 +1173,7 @@ class GameWebSocketHandler:
                 room = self._service.get_room(room_id)
                 player = room.get_player(player_id)
                 if player:
-                    player.connection_state = PlayerState.DISCONNECTED
+                    room.set_player_state(player, PlayerState.DISCONNECTED)
 
                     # Broadcast disconnect
                     await self._broadcast_to_room(
@@ -1191,7 +1189,7 @@ class GameWebSocketHandler:
                 pass
 
             # Track telemetry
-            telemetry = get_telemetry()
+            telemetry = self._telemetry
             telemetry.track_connection_closed("websocket")
             is_spectator = player.is_spectator if player else False
             telemetry.track_player_left(room_id, player_id, is_spectator=is_spectator)
@@ -1494,7 +1492,7 @@ class GameWebSocketHandler:
         room = self._service.get_room(room_id)
 
         # Track telemetry - drawing completed
-        telemetry = get_telemetry()
+        telemetry = self._telemetry
         was_guessed = any(p.has_guessed for p in room.active_players() if p.id != results["drawer_id"])
         telemetry.track_drawing_completed(room_id, results["drawer_id"], was_guessed)
 
@@ -1519,7 +1517,7 @@ class GameWebSocketHandler:
             telemetry.track_game_ended(
                 room_id,
                 winner_id,
-                len(room.active_players()),
+                room.active_count,
                 results["round_number"],
             )
 
@@ -1574,37 +1572,38 @@ class GameWebSocketHandler:
         # Winner is first in leaderboard
         winner_player = leaderboard[0][0] if leaderboard else None
 
-        for player, score in leaderboard:
+        game_results = [
+            GameResult(
+                user_id=player.auth_user_id,
+                score=score,
+                won=player.id == winner_player.id if winner_player else False,
+                correct_guesses=1 if player.has_guessed else 0,  # Simplified
+                total_guesses=1,  # Simplified
+                total_guess_time_ms=int((player.guess_time or 0) * 1000),
+                fastest_guess_ms=int((player.guess_time or 0) * 1000) if player.guess_time else None,
+                drawings_completed=1,  # Simplified - each player drew once per round
+                drawings_guessed=1 if player.has_guessed else 0,
+            )
+            for player, score in leaderboard
             # Skip players without auth user ID
-            if not player.auth_user_id:
-                continue
-
-            won = player.id == winner_player.id if winner_player else False
+            if player.auth_user_id
+        ]
+        if not game_results:
+            return
 
-            try:
-                await auth_service.record_game_result(
-                    user_id=player.auth_user_id,
-                    score=score,
-                    won=won,
-                    correct_guesses=1 if player.has_guessed else 0,  # Simplified
-                    total_guesses=1,  # Simplified
-                    total_guess_time_ms=int((player.guess_time or 0) * 1000),
-                    fastest_guess_ms=int((player.guess_time or 0) * 1000) if player.guess_time else None,
-                    drawings_completed=1,  # Simplified - each player drew once per round
-                    drawings_guessed=1 if player.has_guessed else 0,
-                )
-                logger.info(
-                    "Recorded game stats",
-                    user_id=str(player.auth_user_id),
-                    score=score,
-                    won=won,
-                )
-            except Exception as e:
-                logger.error(
-                    "Failed to record game stats",
-                    user_id=str(player.auth_user_id),
-                    error=str(e),
-                )
+        # Record every player in one transaction rather than one per player
+        try:
+            await auth_service.record_game_results(game_results)
+            logger.info(
+                "Recorded game stats",
+                user_ids=[str(result.user_id) for result in game_results],
+            )
+        except Exception as e:
+            logger.error(
+                "Failed to record game stats",
+                user_ids=[str(result.user_id) for result in game_results],
+                error=str(e),
+            )
 
     async def _broadcast_round_started(
         self,
@@ -1623,7 +1622,7 @@ class GameWebSocketHandler:
         drawer_name = drawer.user_name if drawer else "Unknown"
 
         # Track round started telemetry
-        telemetry = get_telemetry()
+        telemetry = self._telemetry
         telemetry.track_round_started(room_id, round_obj.round_number, round_obj.drawer_id)
 
         # Broadcast round started
@@ -1768,6 +1767,7 @@ def create_game_websocket_handler(
     game_service: GameService,
     connection_manager: ConnectionManager | None = None,
     auth_service: DatabaseAuthService | None = None,
+    telemetry: TelemetryService | None = None,
 ) -> tuple[Router, GameWebSocketHandler]:
     """Create a WebSocket router for game real-time communication.
 
@@ -1776,13 +1776,14 @@ def create_game_websocket_handler(
         game_service: The game service instance.
         connection_manager: Optional connection manager.
         auth_service: Optional auth service for stats tracking.
+        telemetry: Optional telemetry service.
 
     Returns:
         A tuple of (Litestar Router, GameWebSocketHandler instance).
     """
     from litestar import Router, websocket
 
-    handler = GameWebSocketHandler(game_service, connection_manager, auth_service)
+    handler = GameWebSocketHandler(game_service, connection_manager, auth_service, telemetry)
 
     @websocket(path="/lobby/{room_id:uuid}")
     async def lobby_websocket(socket: WebSocket, room_id: UUID) -> None:
@@ -35,6 +35,10 @@ class CanvasService:
     This service provides business logic for canvas operations,
     wrapping the storage layer with validation and convenience methods.
 
+    Storage backends return private copies of elements, so single-field
+    changes (z-index, visibility, grouping, position) are applied to the
+    fetched element in place instead of rebuilding it with ``replace``.
+
     Attributes:
         command_history: Manager for undo/redo command histories.
         clipboard: In-memory clipboard for copy/paste operations.
@@ -418,8 +422,8 @@ class CanvasService:
         cmd.set_old_z_index(old_z)
         self.command_history.push(canvas_id, cmd)
 
-        updated = replace(element, z_index=new_z)
-        return await self._storage.update_element(canvas_id, updated)
+        element.z_index = new_z
+        return await self._storage.update_element(canvas_id, element)
 
     async def send_to_back(
         self,
@@ -455,8 +459,8 @@ class CanvasService:
         cmd.set_old_z_index(old_z)
         self.command_history.push(canvas_id, cmd)
 
-        updated = replace(element, z_index=new_z)
-        return await self._storage.update_element(canvas_id, updated)
+        element.z_index = new_z
+        return await self._storage.update_element(canvas_id, element)
 
     async def move_forward(
         self,
@@ -487,8 +491,8 @@ class CanvasService:
         cmd.set_old_z_index(old_z)
         self.command_history.push(canvas_id, cmd)
 
-        updated = replace(element, z_index=new_z)
-        return await self._storage.update_element(canvas_id, updated)
+        element.z_index = new_z
+        return await self._storage.update_element(canvas_id, element)
 
     async def move_backward(
         self,
@@ -519,8 +523,8 @@ class CanvasService:
         cmd.set_old_z_index(old_z)
         self.command_history.push(canvas_id, cmd)
 
-        updated = replace(element, z_index=new_z)
-        return await self._storage.update_element(canvas_id, updated)
+        element.z_index = new_z
+        return await self._storage.update_element(canvas_id, element)
 
     # Layer state operations (visibility/lock)
 
@@ -556,8 +560,8 @@ class CanvasService:
         cmd.set_previous_state({"visible": element.visible})
         self.command_history.push(canvas_id, cmd)
 
-        updated = replace(element, visible=new_visible)
-        return await self._storage.update_element(canvas_id, updated)
+        element.visible = new_visible
+        return await self._storage.update_element(canvas_id, element)
 
     async def set_visibility(
         self,
@@ -593,8 +597,8 @@ class CanvasService:
         cmd.set_previous_state({"visible": element.visible})
         self.command_history.push(canvas_id, cmd)
 
-        updated = replace(element, visible=visible)
-        return await self._storage.update_element(canvas_id, updated)
+        element.visible = visible
+        return await self._storage.update_element(canvas_id, element)
 
     async def toggle_lock(
         self,
@@ -627,8 +631,8 @@ class CanvasService:
         cmd.set_previous_state({"locked": element.locked})
         self.command_history.push(canvas_id, cmd)
 
-        updated = replace(element, locked=new_locked)
-        return await self._storage.update_element(canvas_id, updated)
+        element.locked = new_locked
+        return await self._storage.update_element(canvas_id, element)
 
     async def set_lock(
         self,
@@ -664,8 +668,8 @@ class CanvasService:
         cmd.set_previous_state({"locked": element.locked})
         self.command_history.push(canvas_id, cmd)
 
-        updated = replace(element, locked=locked)
-        return await self._storage.update_element(canvas_id, updated)
+        element.locked = locked
+        return await self._storage.update_element(canvas_id, element)
 
     # Grouping operations
 
@@ -713,8 +717,8 @@ class CanvasService:
         for eid in element_ids:
             element = await self._storage.get_element(canvas_id, eid)
             if element:
-                updated = replace(element, group_id=created_group.id)
-                await self._storage.update_element(canvas_id, updated)
+                element.group_id = created_group.id
+                await self._storage.update_element(canvas_id, element)
 
         # Record command for undo
         cmd = GroupElementsCommand(
@@ -760,9 +764,9 @@ class CanvasService:
         for child_id in child_ids:
             element = await self._storage.get_element(canvas_id, child_id)
             if element:
-                updated = replace(element, group_id=None)
-                await self._storage.update_element(canvas_id, updated)
-                ungrouped_elements.append(updated)
+                element.group_id = None
+                await self._storage.update_element(canvas_id, element)
+                ungrouped_elements.append(element)
 
         # Record command before deleting group
         cmd = UngroupElementsCommand(
@@ -921,15 +925,15 @@ class CanvasService:
             element = await self._storage.get_element(canvas_id, command.element_id)
             if element:
                 old_pos = Point(x=command.old_x, y=command.old_y)
-                restored = replace(element, position=old_pos)
-                await self._storage.update_element(canvas_id, restored)
+                element.position = old_pos
+                await self._storage.update_element(canvas_id, element)
 
         elif isinstance(command, ReorderElementCommand):
             # Undo reorder = restore old z-index
             element = await self._storage.get_element(canvas_id, command.element_id)
             if element:
-                restored = replace(element, z_index=command.old_z_index)
-                await self._storage.update_element(canvas_id, restored)
+                element.z_index = command.old_z_index
+                await self._storage.update_element(canvas_id, element)
 
         elif isinstance(command, GroupElementsCommand):
             # Undo group = ungroup and restore previous group assignments
@@ -938,19 +942,19 @@ class CanvasService:
                 for eid, prev_gid in command.previous_group_ids.items():
                     element = await self._storage.get_element(canvas_id, eid)
                     if element:
-                        restored = replace(element, group_id=prev_gid)
-                        await self._storage.update_element(canvas_id, restored)
+                        element.group_id = prev_gid
+                        await self._storage.update_element(canvas_id, element)
                 # Delete the group
                 await self._storage.delete_element(canvas_id, command.group_id)
 
         elif isinstance(command, UngroupElementsCommand) and command.deleted_group:
-            # Undo ungroup = recreate group and reassign children
+            # Undo ungroup = recreate group and reassign children (if any)
             await self._storage.add_element(canvas_id, command.deleted_group)
             for child_id in command.child_ids:
                 element = await self._storage.get_element(canvas_id, child_id)
                 if element:
-                    restored = replace(element, group_id=command.group_id)
-                    await self._storage.update_element(canvas_id, restored)
+                    element.group_id = command.group_id
+                    await self._storage.update_element(canvas_id, element)
 
         return True
 
@@ -991,15 +995,15 @@ class CanvasService:
             element = await self._storage.get_element(canvas_id, command.element_id)
             if element:
                 new_pos = Point(x=command.new_x, y=command.new_y)
-                updated = replace(element, position=new_pos)
-                await self._storage.update_element(canvas_id, updated)
+                element.position = new_pos
+                await self._storage.update_element(canvas_id, element)
 
         elif isinstance(command, ReorderElementCommand):
             # Redo reorder = apply new z-index
             element = await self._storage.get_element(canvas_id, command.element_id)
             if element:
-                updated = replace(element, z_index=command.new_z_index)
-                await self._storage.update_element(canvas_id, updated)
+                element.z_index = command.new_z_index
+                await self._storage.update_element(canvas_id, element)
 
         elif isinstance(command, GroupElementsCommand):
             # Redo group = recreate group
@@ -1012,16 +1016,16 @@ class CanvasService:
                 for eid in command.element_ids:
                     element = await self._storage.get_element(canvas_id, eid)
                     if element:
-                        updated = replace(element, group_id=command.group_id)
-                        await self._storage.update_element(canvas_id, updated)
+                        element.group_id = command.group_id
+                        await self._storage.update_element(canvas_id, element)
 
         elif isinstance(command, UngroupElementsCommand):
-            # Redo ungroup = ungroup again
+            # Redo ungroup = ungroup again (empty groups only need deleting)
             for child_id in command.child_ids:
                 element = await self._storage.get_element(canvas_id, child_id)
                 if element:
-                    updated = replace(element, group_id=None)
-                    await self._storage.update_element(canvas_id, updated)
+                    element.group_id = None
+                    await self._storage.update_element(canvas_id, element)
             await self._storage.delete_element(canvas_id, command.group_id)
 
         return True
@@ -4,6 +4,9 @@ from __future__ import annotations
 
 import io
 import json
+import multiprocessing
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from typing import TYPE_CHECKING, Any
 from uuid import UUID
@@ -13,9 +16,41 @@ from PIL import Image, ImageDraw
 from scribbl_py.core.models import Canvas, Group, Shape, Stroke, Text
 from scribbl_py.core.types import ShapeType
 
+try:
+    import cv2
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on the optional render extra
+    cv2 = None
+    np = None
+
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from scribbl_py.core.models import Element
 
+    # RGB or RGBA color tuple; its length selects the image mode
+    _Color = tuple[int, ...]
+
+    # Hex color string (or None for the default) -> parsed color tuple
+    _Palette = dict[str | None, _Color]
+
+# Translation table for escaping special XML characters in a single pass
+_XML_ESCAPE = str.maketrans(
+    {
+        "&": "&amp;",
+        "<": "&lt;",
+        ">": "&gt;",
+        '"': "&quot;",
+        "'": "&apos;",
+    }
+)
+
+# Overlap in pixels rendered around each tile of a parallel PNG export
+_TILE_MARGIN = 32
+
+# Column order of each serialized stroke point
+_POINTS_SCHEMA = ("x", "y", "pressure", "timestamp")
+
 
 class ExportService:
     """Service for exporting canvases to various formats.
@@ -26,32 +61,94 @@ class ExportService:
     - PNG: Raster image
     """
 
-    def to_json(self, canvas: Canvas, *, indent: int | None = 2) -> str:
+    def __init__(
+        self,
+        cache_size: int = 128,
+        *,
+        parallel_threshold: int = 5000,
+        tile_size: int = 1024,
+        max_workers: int | None = None,
+    ) -> None:
+        """Initialize the export service.
+
+        Args:
+            cache_size: Maximum number of canvas versions kept in each export cache.
+            parallel_threshold: Minimum element count before PNG export is
+                rasterized as tiles in a process pool.
+            tile_size: Edge length in pixels of each parallel PNG tile.
+            max_workers: Process pool size for tiled PNG export (None for CPU count).
+        """
+        self._parallel_threshold = parallel_threshold
+        self._tile_size = tile_size
+        self._max_workers = max_workers
+        # Started on the first tiled export and kept for the life of the service
+        self._executor: ProcessPoolExecutor | None = None
+        # Exports keyed on (canvas.id, canvas.updated_at); storage bumps updated_at
+        # on every mutation, so a new version is a cache miss.
+        self._cache_size = cache_size
+        self._dict_cache: OrderedDict[tuple[UUID, datetime], dict[str, Any]] = OrderedDict()
+        self._compact_dict_cache: OrderedDict[tuple[UUID, datetime], dict[str, Any]] = OrderedDict()
+        self._svg_cache: OrderedDict[tuple[UUID, datetime], str] = OrderedDict()
+
+        self._draw_dispatch: dict[
+            type[Element], Callable[[ImageDraw.ImageDraw, Any, float, _Palette, tuple[int, int]], None]
+        ] = {
+            Stroke: self._draw_stroke,
+            Shape: self._draw_shape,
+            Text: self._draw_text,
+        }
+        self._svg_dispatch: dict[type[Element], Callable[[Any], str | None]] = {
+            Stroke: self._stroke_to_svg,
+            Shape: self._shape_to_svg,
+            Text: self._text_to_svg,
+        }
+        self._dict_dispatch: dict[type[Element], Callable[[Any, dict[str, Any]], None]] = {
+            Stroke: self._stroke_fields,
+            Shape: self._shape_fields,
+            Text: self._text_fields,
+            Group: self._group_fields,
+        }
+        self._compact_dict_dispatch = {**self._dict_dispatch, Stroke: self._compact_stroke_fields}
+
+    def to_json(self, canvas: Canvas, *, indent: int | None = 2, compact_points: bool = False) -> str:
         """Export canvas to JSON format.
 
         Args:
             canvas: The canvas to export.
             indent: JSON indentation level (None for compact).
+            compact_points: Write stroke points as rows (see ``to_dict``).
 
         Returns:
             JSON string representation of the canvas.
         """
         return json.dumps(
-            self._canvas_to_dict(canvas),
+            self.to_dict(canvas, compact_points=compact_points),
             indent=indent,
             default=self._json_serializer,
         )
 
-    def to_dict(self, canvas: Canvas) -> dict[str, Any]:
+    def to_dict(self, canvas: Canvas, *, compact_points: bool = False) -> dict[str, Any]:
         """Export canvas to a dictionary.
 
+        The result is cached per canvas version and shared between callers,
+        so it must not be mutated.
+
         Args:
             canvas: The canvas to export.
+            compact_points: Write stroke points as ``(x, y, pressure, timestamp)``
+                rows, described by a ``points_schema`` key, instead of one
+                object per point. Much smaller for long strokes.
 
         Returns:
             Dictionary representation of the canvas.
         """
-        return self._canvas_to_dict(canvas)
+        cache = self._compact_dict_cache if compact_points else self._dict_cache
+        key = (canvas.id, canvas.updated_at)
+        cached = self._cache_get(cache, key)
+        if cached is None:
+            cached = self._canvas_to_dict(canvas, compact_points=compact_points)
+            self._cache_put(cache, key, cached)
+        return cached
 
     def to_svg(self, canvas: Canvas) -> str:
         """Export canvas to SVG format.
@@ -62,8 +159,13 @@ class ExportService:
         Returns:
             SVG string representation of the canvas.
         """
-        # Sort elements by z_index for proper layering
-        sorted_elements = sorted(canvas.elements, key=lambda e: e.z_index)
+        key = (canvas.id, canvas.updated_at)
+        cached = self._cache_get(self._svg_cache, key)
+        if cached is not None:
+            return cached
+
+        # Elements in z_index order for proper layering
+        sorted_elements = canvas.elements_by_zindex
 
         svg_elements = []
         for element in sorted_elements:
@@ -71,7 +173,7 @@ class ExportService:
             if svg_element:
                 svg_elements.append(svg_element)
 
-        return f"""<?xml version="1.0" encoding="UTF-8"?>
+        svg = f"""<?xml version="1.0" encoding="UTF-8"?>
 <svg xmlns="http://www.w3.org/2000/svg"
      width="{canvas.width}"
      height="{canvas.height}"
@@ -80,13 +182,23 @@ class ExportService:
   <rect width="100%" height="100%" fill="{canvas.background_color}"/>
   {chr(10).join(svg_elements)}
 </svg>"""
+        self._cache_put(self._svg_cache, key, svg)
+        return svg
+
+    def to_png(self, canvas: Canvas, *, scale: float = 1.0, compression: int = 1) -> bytes:
+        """Export canvas to PNG format.
 
-    def to_png(self, canvas: Canvas, *, scale: float = 1.0) -> bytes:
-        """Export canvas to PNG format using Pillow.
+        Strokes are rasterized with OpenCV when the ``render`` extra is
+        installed; otherwise everything is drawn with Pillow. Canvases with at
+        least ``parallel_threshold`` elements are split into tiles that are
+        rasterized in parallel worker processes. Rendering is CPU-bound, so
+        async callers should run this off the event loop.
 
         Args:
             canvas: The canvas to export.
             scale: Scale factor for the output image.
+            compression: zlib compression level (0-9). DEFLATE dominates encode
+                time on large canvases, so the default favors speed over size.
 
         Returns:
             PNG image as bytes.
@@ -94,22 +206,62 @@ class ExportService:
         width = int(canvas.width * scale)
         height = int(canvas.height * scale)
 
-        # Create image with background color
         bg_color = self._parse_color(canvas.background_color)
-        image = Image.new("RGBA", (width, height), bg_color)
-        draw = ImageDraw.Draw(image)
 
-        # Sort elements by z_index for proper layering
-        sorted_elements = sorted(canvas.elements, key=lambda e: e.z_index)
+        # Elements in z_index order for proper layering
+        sorted_elements = canvas.elements_by_zindex
+        palette = self._build_palette(sorted_elements)
 
-        for element in sorted_elements:
-            self._draw_element(draw, element, scale)
+        # Fully opaque exports are drawn in RGB, a quarter less memory to
+        # write and encode than RGBA
+        if bg_color[3] == 255 and all(color[3] == 255 for color in palette.values()):
+            bg_color = bg_color[:3]
+            palette = {key: color[:3] for key, color in palette.items()}
+
+        if len(sorted_elements) >= self._parallel_threshold and max(width, height) > self._tile_size:
+            image = self._render_tiled(sorted_elements, width, height, bg_color, scale, palette)
+        else:
+            image = self._rasterize(sorted_elements, (width, height), bg_color, scale, palette)
 
         # Convert to bytes
         buffer = io.BytesIO()
-        image.save(buffer, format="PNG")
+        image.save(buffer, format="PNG", compress_level=compression, optimize=False)
         return buffer.getvalue()
 
+    def shutdown(self) -> None:
+        """Stop the worker processes used for tiled PNG export, if any were started."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """Get the process pool for tiled PNG export, starting it on first use.
+
+        Workers are spawned rather than forked so they don't inherit the
+        server's event loop and background threads.
+        """
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self._max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._executor
+
+    def _cache_get(self, cache: OrderedDict[tuple[UUID, datetime], Any], key: tuple[UUID, datetime]) -> Any:
+        """Return a cached export and mark it as most recently used."""
+        value = cache.get(key)
+        if value is not None:
+            cache.move_to_end(key)
+        return value
+
+    def _cache_put(
+        self, cache: OrderedDict[tuple[UUID, datetime], Any], key: tuple[UUID, datetime], value: Any
+    ) -> None:
+        """Store an export, evicting the least recently used entry past the size limit."""
+        cache[key] = value
+        if len(cache) > self._cache_size:
+            cache.popitem(last=False)
+
     def _parse_color(self, color: str | None) -> tuple[int, int, int, int]:
         """Parse hex color string to RGBA tuple."""
         if not color:
@@ -123,42 +275,224 @@ class ExportService:
             return (r, g, b, a)
         return (0, 0, 0, 255)
 
-    def _draw_element(self, draw: ImageDraw.ImageDraw, element: Element, scale: float) -> None:
-        """Draw an element onto the image."""
-        if isinstance(element, Stroke):
-            self._draw_stroke(draw, element, scale)
+    def _build_palette(self, elements: list[Element]) -> _Palette:
+        """Parse every distinct color used by the elements once.
+
+        Canvases typically use a small palette across many elements, so draw
+        calls look colors up in this dict instead of re-parsing hex strings.
+        """
+        colors = {None}
+        for element in elements:
+            colors.add(element.style.stroke_color)
+            colors.add(element.style.fill_color)
+        return {color: self._parse_color(color) for color in colors}
+
+    def _rasterize(
+        self,
+        elements: list[Element],
+        size: tuple[int, int],
+        bg_color: _Color,
+        scale: float,
+        palette: _Palette,
+        origin: tuple[int, int] = (0, 0),
+    ) -> Image.Image:
+        """Rasterize elements onto a new RGB or RGBA image of ``size``.
+
+        The image mode follows the length of ``bg_color``. ``origin`` is the
+        top-left corner of the image in output pixel coordinates, so a tile of
+        a larger canvas can be drawn on its own.
+        """
+        if cv2 is not None:
+            return self._render_np(elements, size, bg_color, scale, palette, origin)
+
+        # Create image with background color
+        image = Image.new(_image_mode(bg_color), size, bg_color)
+        draw = ImageDraw.Draw(image)
+        for element in elements:
+            self._draw_element(draw, element, scale, palette, origin)
+        return image
+
+    def _render_tiled(
+        self,
+        elements: list[Element],
+        width: int,
+        height: int,
+        bg_color: _Color,
+        scale: float,
+        palette: _Palette,
+    ) -> Image.Image:
+        """Rasterize a large canvas as tiles in a process pool and stitch them together.
+
+        Each tile draws only the elements whose bounding box intersects it,
+        clipped at the tile edge, so the stitched result matches a single-pass
+        render. Tiles without elements keep the background.
+        """
+        tile = self._tile_size
+        margin = _TILE_MARGIN
+        bounds = [(element, self._element_bounds(element, scale)) for element in elements]
+
+        jobs: list[tuple[tuple[int, int], tuple[int, int], list[Element]]] = []
+        for top in range(0, height, tile):
+            for left in range(0, width, tile):
+                right = min(left + tile, width)
+                bottom = min(top + tile, height)
+                subset = [
+                    element
+                    for element, (x0, y0, x1, y1) in bounds
+                    if x1 >= left and x0 < right and y1 >= top and y0 < bottom
+                ]
+                if subset:
+                    jobs.append(((left, top), (right - left, bottom - top), subset))
+
+        image = Image.new(_image_mode(bg_color), (width, height), bg_color)
+        pool = self._get_executor()
+        # Tiles are rendered with an overlap margin and cropped, so
+        # rasterizer clipping at the tile edge never shows in the output.
+        futures = [
+            (
+                origin,
+                size,
+                pool.submit(
+                    _rasterize_tile,
+                    subset,
+                    (size[0] + 2 * margin, size[1] + 2 * margin),
+                    bg_color,
+                    scale,
+                    palette,
+                    (origin[0] - margin, origin[1] - margin),
+                ),
+            )
+            for origin, size, subset in jobs
+        ]
+        for origin, size, future in futures:
+            tile_image = future.result().crop((margin, margin, margin + size[0], margin + size[1]))
+            image.paste(tile_image, origin)
+        return image
+
+    def _element_bounds(self, element: Element, scale: float) -> tuple[float, float, float, float]:
+        """Conservative bounding box of an element in output pixel coordinates."""
+        pad = element.style.stroke_width * scale + 2
+        if isinstance(element, Stroke) and element.points:
+            xs = [p.x for p in element.points]
+            ys = [p.y for p in element.points]
+            x0, y0, x1, y1 = min(xs), min(ys), max(xs), max(ys)
         elif isinstance(element, Shape):
-            self._draw_shape(draw, element, scale)
+            x0 = min(element.position.x, element.position.x + element.width)
+            x1 = max(element.position.x, element.position.x + element.width)
+            y0 = min(element.position.y, element.position.y + element.height)
+            y1 = max(element.position.y, element.position.y + element.height)
         elif isinstance(element, Text):
-            self._draw_text(draw, element, scale)
+            # Text is drawn with Pillow's default font, which is not scaled;
+            # font_size per character over-estimates its extent.
+            x0, y0 = element.position.x, element.position.y
+            return (
+                x0 * scale - pad,
+                y0 * scale - pad,
+                x0 * scale + len(element.content) * element.font_size + pad,
+                y0 * scale + 2 * element.font_size + pad,
+            )
+        else:
+            x0 = x1 = element.position.x
+            y0 = y1 = element.position.y
+        return (x0 * scale - pad, y0 * scale - pad, x1 * scale + pad, y1 * scale + pad)
+
+    def _draw_element(
+        self,
+        draw: ImageDraw.ImageDraw,
+        element: Element,
+        scale: float,
+        palette: _Palette,
+        origin: tuple[int, int] = (0, 0),
+    ) -> None:
+        """Draw an element onto the image."""
+        draw_fn = self._draw_dispatch.get(type(element))
+        if draw_fn is not None:
+            draw_fn(draw, element, scale, palette, origin)
 
-    def _draw_stroke(self, draw: ImageDraw.ImageDraw, stroke: Stroke, scale: float) -> None:
+    def _draw_stroke(
+        self, draw: ImageDraw.ImageDraw, stroke: Stroke, scale: float, palette: _Palette, origin: tuple[int, int]
+    ) -> None:
         """Draw a stroke onto the image."""
         if not stroke.points or len(stroke.points) < 2:
             return
 
-        color = self._parse_color(stroke.style.stroke_color)
+        color = palette[stroke.style.stroke_color]
         width = max(1, int(stroke.style.stroke_width * scale))
 
-        # Draw lines between consecutive points
-        for i in range(len(stroke.points) - 1):
-            p1 = stroke.points[i]
-            p2 = stroke.points[i + 1]
-            draw.line(
-                [(p1.x * scale, p1.y * scale), (p2.x * scale, p2.y * scale)],
-                fill=color,
-                width=width,
-            )
+        # Scale each point once and draw the whole polyline in a single call
+        ox, oy = origin
+        pts = [(p.x * scale - ox, p.y * scale - oy) for p in stroke.points]
+        draw.line(pts, fill=color, width=width)
+
+    def _render_np(
+        self,
+        elements: list[Element],
+        size: tuple[int, int],
+        bg_color: _Color,
+        scale: float,
+        palette: _Palette,
+        origin: tuple[int, int],
+    ) -> Image.Image:
+        """Rasterize elements onto a NumPy buffer, drawing strokes with OpenCV.
+
+        Strokes are rendered as a single ``cv2.polylines`` call each. Runs of
+        other elements (shapes, text) are drawn with Pillow, converting the
+        buffer to an image once per run to preserve z-ordering.
+        """
+        width, height = size
+        arr = np.full((height, width, len(bg_color)), bg_color, dtype=np.uint8)
+        pending: list[Element] = []
+
+        for element in elements:
+            if type(element) is Stroke:
+                if pending:
+                    arr = self._draw_pillow_run(arr, pending, scale, palette, origin)
+                    pending = []
+                self._draw_stroke_np(arr, element, scale, palette, origin)
+            else:
+                pending.append(element)
+
+        if pending:
+            arr = self._draw_pillow_run(arr, pending, scale, palette, origin)
+
+        return Image.fromarray(arr)
+
+    def _draw_pillow_run(
+        self, arr: np.ndarray, elements: list[Element], scale: float, palette: _Palette, origin: tuple[int, int]
+    ) -> np.ndarray:
+        """Draw a run of non-stroke elements onto a NumPy buffer using Pillow."""
+        image = Image.fromarray(arr)
+        draw = ImageDraw.Draw(image)
+        for element in elements:
+            self._draw_element(draw, element, scale, palette, origin)
+        return np.array(image)
+
+    def _draw_stroke_np(
+        self, arr: np.ndarray, stroke: Stroke, scale: float, palette: _Palette, origin: tuple[int, int]
+    ) -> None:
+        """Draw a stroke onto a NumPy buffer as a single anti-aliased polyline."""
+        if not stroke.points or len(stroke.points) < 2:
+            return
+
+        color = palette[stroke.style.stroke_color]
+        width = max(1, int(stroke.style.stroke_width * scale))
+
+        pts = np.array([(p.x, p.y) for p in stroke.points], dtype=np.float64) * scale - origin
+        cv2.polylines(
+            arr, [pts.round().astype(np.int32)], isClosed=False, color=color, thickness=width, lineType=cv2.LINE_AA
+        )
 
-    def _draw_shape(self, draw: ImageDraw.ImageDraw, shape: Shape, scale: float) -> None:
+    def _draw_shape(
+        self, draw: ImageDraw.ImageDraw, shape: Shape, scale: float, palette: _Palette, origin: tuple[int, int]
+    ) -> None:
         """Draw a shape onto the image."""
-        x = shape.position.x * scale
-        y = shape.position.y * scale
+        x = shape.position.x * scale - origin[0]
+        y = shape.position.y * scale - origin[1]
         w = shape.width * scale
         h = shape.height * scale
 
-        fill = self._parse_color(shape.style.fill_color) if shape.style.fill_color else None
-        outline = self._parse_color(shape.style.stroke_color)
+        fill = palette[shape.style.fill_color] if shape.style.fill_color else None
+        outline = palette[shape.style.stroke_color]
         width = max(1, int(shape.style.stroke_width * scale))
 
         if shape.shape_type == ShapeType.RECTANGLE:
@@ -171,15 +505,17 @@ class ExportService:
             points = [(x + w / 2, y), (x, y + h), (x + w, y + h)]
             draw.polygon(points, fill=fill, outline=outline, width=width)
 
-    def _draw_text(self, draw: ImageDraw.ImageDraw, text: Text, scale: float) -> None:
+    def _draw_text(
+        self, draw: ImageDraw.ImageDraw, text: Text, scale: float, palette: _Palette, origin: tuple[int, int]
+    ) -> None:
         """Draw text onto the image."""
-        x = text.position.x * scale
-        y = text.position.y * scale
-        color = self._parse_color(text.style.stroke_color or text.style.fill_color)
+        x = text.position.x * scale - origin[0]
+        y = text.position.y * scale - origin[1]
+        color = palette[text.style.stroke_color or text.style.fill_color]
         # Note: Custom fonts would require loading font files
         draw.text((x, y), text.content, fill=color)
 
-    def _canvas_to_dict(self, canvas: Canvas) -> dict[str, Any]:
+    def _canvas_to_dict(self, canvas: Canvas, *, compact_points: bool = False) -> dict[str, Any]:
         """Convert canvas to dictionary with proper serialization."""
         return {
             "id": str(canvas.id),
@@ -187,86 +523,93 @@ class ExportService:
             "width": canvas.width,
             "height": canvas.height,
             "background_color": canvas.background_color,
-            "elements": [self._element_to_dict(e) for e in canvas.elements],
+            "elements": [self._element_to_dict(e, compact_points=compact_points) for e in canvas.elements],
             "created_at": canvas.created_at.isoformat(),
             "updated_at": canvas.updated_at.isoformat(),
         }
 
-    def _element_to_dict(self, element: Element) -> dict[str, Any]:
+    def _element_to_dict(self, element: Element, *, compact_points: bool = False) -> dict[str, Any]:
         """Convert element to dictionary with proper serialization."""
+        st = element.style
+        pos = element.position
         base = {
             "id": str(element.id),
-            "element_type": element.element_type.value,
-            "position": {"x": element.position.x, "y": element.position.y},
+            # ElementType is a StrEnum, so the member serializes as its value
+            "element_type": element.element_type,
+            "position": {"x": pos.x, "y": pos.y},
             "style": {
-                "stroke_color": element.style.stroke_color,
-                "fill_color": element.style.fill_color,
-                "stroke_width": element.style.stroke_width,
-                "opacity": element.style.opacity,
+                "stroke_color": st.stroke_color,
+                "fill_color": st.fill_color,
+                "stroke_width": st.stroke_width,
+                "opacity": st.opacity,
             },
             "z_index": element.z_index,
             "group_id": str(element.group_id) if element.group_id else None,
-            "created_at": element.created_at.isoformat(),
+            "created_at": element.created_at_iso,
         }
 
-        if isinstance(element, Stroke):
-            base["points"] = [
-                {
-                    "x": p.x,
-                    "y": p.y,
-                    "pressure": p.pressure,
-                    "timestamp": p.timestamp,
-                }
-                for p in element.points
-            ]
-            base["smoothing"] = element.smoothing
-
-        elif isinstance(element, Shape):
-            base["shape_type"] = element.shape_type.value
-            base["width"] = element.width
-            base["height"] = element.height
-            base["rotation"] = element.rotation
-
-        elif isinstance(element, Text):
-            base["content"] = element.content
-            base["font_size"] = element.font_size
-            base["font_family"] = element.font_family
-
-        elif isinstance(element, Group):
-            base["name"] = element.name
-            base["children"] = [str(child_id) for child_id in element.children]
-            base["locked"] = element.locked
-            base["collapsed"] = element.collapsed
+        dispatch = self._compact_dict_dispatch if compact_points else self._dict_dispatch
+        add_fields = dispatch.get(type(element))
+        if add_fields is not None:
+            add_fields(element, base)
 
         return base
 
+    def _stroke_fields(self, stroke: Stroke, base: dict[str, Any]) -> None:
+        """Add stroke-specific fields to a serialized element."""
+        base["points"] = [
+            {
+                "x": p.x,
+                "y": p.y,
+                "pressure": p.pressure,
+                "timestamp": p.timestamp,
+            }
+            for p in stroke.points
+        ]
+        base["smoothing"] = stroke.smoothing
+
+    def _compact_stroke_fields(self, stroke: Stroke, base: dict[str, Any]) -> None:
+        """Add stroke-specific fields with points as rows ordered by ``points_schema``."""
+        base["points_schema"] = _POINTS_SCHEMA
+        base["points"] = [(p.x, p.y, p.pressure, p.timestamp) for p in stroke.points]
+        base["smoothing"] = stroke.smoothing
+
+    def _shape_fields(self, shape: Shape, base: dict[str, Any]) -> None:
+        """Add shape-specific fields to a serialized element."""
+        base["shape_type"] = shape.shape_type.value
+        base["width"] = shape.width
+        base["height"] = shape.height
+        base["rotation"] = shape.rotation
+
+    def _text_fields(self, text: Text, base: dict[str, Any]) -> None:
+        """Add text-specific fields to a serialized element."""
+        base["content"] = text.content
+        base["font_size"] = text.font_size
+        base["font_family"] = text.font_family
+
+    def _group_fields(self, group: Group, base: dict[str, Any]) -> None:
+        """Add group-specific fields to a serialized element."""
+        base["name"] = group.name
+        base["children"] = [str(child_id) for child_id in group.children]
+        base["locked"] = group.locked
+        base["collapsed"] = group.collapsed
+
     def _element_to_svg(self, element: Element) -> str | None:
-        """Convert an element to SVG markup."""
-        if isinstance(element, Stroke):
-            return self._stroke_to_svg(element)
-        if isinstance(element, Shape):
-            return self._shape_to_svg(element)
-        if isinstance(element, Text):
-            return self._text_to_svg(element)
-        if isinstance(element, Group):
-            # Groups don't have visual representation themselves
-            return None
-        return None
+        """Convert an element to SVG markup.
+
+        Groups have no visual representation themselves, so they (like any
+        unknown element type) produce no markup.
+        """
+        to_svg = self._svg_dispatch.get(type(element))
+        return to_svg(element) if to_svg is not None else None
 
     def _stroke_to_svg(self, stroke: Stroke) -> str:
         """Convert a stroke to SVG path."""
         if not stroke.points:
             return ""
 
-        # Build path data
-        path_parts = []
-        for i, point in enumerate(stroke.points):
-            if i == 0:
-                path_parts.append(f"M {point.x} {point.y}")
-            else:
-                path_parts.append(f"L {point.x} {point.y}")
-
-        path_data = " ".join(path_parts)
+        # Build path data - only the first command differs (move vs line)
+        path_data = "M " + " L ".join(f"{p.x} {p.y}" for p in stroke.points)
 
         style = stroke.style
         stroke_color = style.stroke_color or "#000000"
@@ -362,13 +705,7 @@ class ExportService:
 
     def _escape_xml(self, text: str) -> str:
         """Escape special XML characters."""
-        return (
-            text.replace("&", "&amp;")
-            .replace("<", "&lt;")
-            .replace(">", "&gt;")
-            .replace('"', "&quot;")
-            .replace("'", "&apos;")
-        )
+        return text.translate(_XML_ESCAPE)
 
     def _json_serializer(self, obj: Any) -> Any:
         """Custom JSON serializer for special types."""
@@ -380,3 +717,20 @@ class ExportService:
             return obj.value
         msg = f"Object of type {type(obj)} is not JSON serializable"
         raise TypeError(msg)
+
+
+def _rasterize_tile(
+    elements: list[Element],
+    size: tuple[int, int],
+    bg_color: _Color,
+    scale: float,
+    palette: _Palette,
+    origin: tuple[int, int],
+) -> Image.Image:
+    """Rasterize one tile of a tiled PNG export (runs in a worker process)."""
+    return ExportService()._rasterize(elements, size, bg_color, scale, palette, origin)
+
+
+def _image_mode(color: _Color) -> str:
+    """Pillow image mode matching an RGB or RGBA color tuple."""
+    return "RGBA" if len(color) == 4 else "RGB"
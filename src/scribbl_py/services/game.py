@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
-import random
+import os
 import string
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, ClassVar
 from uuid import UUID
 
 import structlog
 
+from scribbl_py.core.logging import is_debug_enabled
 from scribbl_py.game.models import (
     ChatMessage,
     ChatMessageType,
@@ -22,8 +25,22 @@ from scribbl_py.game.models import (
 )
 from scribbl_py.game.wordbank import WordBank
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
 logger = structlog.get_logger(__name__)
 
+_ROOM_CODE_ALPHABET = (string.ascii_uppercase + string.digits).encode("ascii")
+# Maps every random byte onto the room code alphabet so codes are built with one bytes.translate call
+_ROOM_CODE_TABLE = bytes(_ROOM_CODE_ALPHABET[b % len(_ROOM_CODE_ALPHABET)] for b in range(256))
+
+# Enum members used on every guess, bound once so submit_guess skips the enum attribute lookup
+_DRAWING = GameState.DRAWING
+_CORRECT = GuessResult.CORRECT
+_INVALID = GuessResult.INVALID
+_DRAWER = GuessResult.DRAWER
+_ALREADY_GUESSED = GuessResult.ALREADY_GUESSED
+
 
 class GameNotFoundError(Exception):
     """Raised when a game room is not found."""
@@ -48,6 +65,32 @@ class GameStateError(Exception):
         super().__init__(message)
 
 
+def _correct_message(player: Player, guess_text: str, points: int, time_elapsed: float) -> ChatMessage:
+    """Build the chat message announcing a correct guess."""
+    return ChatMessage(
+        message_type=ChatMessageType.CORRECT,
+        sender_id=player.id,
+        sender_name=player.user_name,
+        content=f"{player.user_name} guessed the word! (+{points} points)",
+        metadata={"points": points, "time": time_elapsed},
+    )
+
+
+def _close_message(player: Player, guess_text: str, points: int, time_elapsed: float) -> ChatMessage:
+    """Build the hint message for a close guess."""
+    return ChatMessage.hint(player.user_name)
+
+
+def _guess_message(player: Player, guess_text: str, points: int, time_elapsed: float) -> ChatMessage:
+    """Build the chat message echoing a regular guess."""
+    return ChatMessage(
+        message_type=ChatMessageType.GUESS,
+        sender_id=player.id,
+        sender_name=player.user_name,
+        content=guess_text,
+    )
+
+
 class GameService:
     """Service for managing game rooms and gameplay logic.
 
@@ -59,6 +102,29 @@ class GameService:
     - Word selection and hints
     """
 
+    __slots__ = (
+        "_indexed_state",
+        "_players_by_user",
+        "_public_rooms",
+        "_rejection_messages",
+        "_room_codes",
+        "_rooms",
+        "_rooms_by_state",
+        "_word_bank",
+    )
+
+    # Chat message builders keyed by guess result; anything else is echoed as a regular guess
+    _MSG_BUILDERS: ClassVar[dict[GuessResult, Callable[[Player, str, int, float], ChatMessage]]] = {
+        GuessResult.CORRECT: _correct_message,
+        GuessResult.CLOSE: _close_message,
+    }
+    # Reply text for guesses that are rejected before being checked
+    _REJECTION_CONTENT: ClassVar[dict[GuessResult, str]] = {
+        GuessResult.INVALID: "Spectators cannot guess!",
+        GuessResult.DRAWER: "Drawer cannot guess!",
+        GuessResult.ALREADY_GUESSED: "{name} has already guessed!",
+    }
+
     def __init__(self, word_bank: WordBank | None = None) -> None:
         """Initialize the game service.
 
@@ -67,6 +133,13 @@ class GameService:
         """
         self._rooms: dict[UUID, GameRoom] = {}
         self._room_codes: dict[str, UUID] = {}  # code -> room_id mapping
+        self._players_by_user: dict[UUID, dict[str, Player]] = {}  # room_id -> user_id -> player
+        # room_id -> (player_id, result) -> shared rejection message
+        self._rejection_messages: dict[UUID, dict[tuple[UUID, GuessResult], ChatMessage]] = {}
+        # Secondary indexes for lobby/spectate listings; kept in sync by _index_state()
+        self._rooms_by_state: dict[GameState, dict[UUID, GameRoom]] = {state: {} for state in GameState}
+        self._indexed_state: dict[UUID, GameState] = {}  # room_id -> state the room is indexed under
+        self._public_rooms: set[UUID] = set()
         self._word_bank = word_bank or WordBank()
 
     # Room Management
@@ -106,11 +179,15 @@ class GameService:
             settings=settings or GameSettings(),
             host_id=host.id,
         )
-        room.players.append(host)
+        room.add_player(host)
 
         # Store room
         self._rooms[room.id] = room
+        self._index_state(room)
+        if room.settings.is_public:
+            self._public_rooms.add(room.id)
         self._room_codes[room_code] = room.id
+        self._players_by_user[room.id] = {host_user_id: host}
 
         logger.info(
             "Game room created",
@@ -133,10 +210,10 @@ class GameService:
         Raises:
             GameNotFoundError: If room doesn't exist.
         """
-        room = self._rooms.get(room_id)
-        if not room:
-            raise GameNotFoundError(room_id)
-        return room
+        try:
+            return self._rooms[room_id]
+        except KeyError:
+            raise GameNotFoundError(room_id) from None
 
     def get_room_by_code(self, code: str) -> GameRoom:
         """Get a game room by join code.
@@ -150,9 +227,11 @@ class GameService:
         Raises:
             GameNotFoundError: If room doesn't exist.
         """
-        room_id = self._room_codes.get(code.upper())
-        if not room_id:
-            raise GameNotFoundError(code)
+        # Codes are generated uppercase and clients usually echo them as-is
+        try:
+            room_id = self._room_codes[code if code.isupper() else code.upper()]
+        except KeyError:
+            raise GameNotFoundError(code) from None
         return self.get_room(room_id)
 
     def delete_room(self, room_id: UUID) -> None:
@@ -164,6 +243,10 @@ class GameService:
         room = self._rooms.pop(room_id, None)
         if room:
             self._room_codes.pop(room.room_code, None)
+            self._players_by_user.pop(room_id, None)
+            self._rejection_messages.pop(room_id, None)
+            self._rooms_by_state[self._indexed_state.pop(room_id)].pop(room_id, None)
+            self._public_rooms.discard(room_id)
             logger.info("Game room deleted", room_id=str(room_id))
 
     # Player Management
@@ -195,9 +278,9 @@ class GameService:
         room = self.get_room(room_id)
 
         # Check if player already in room (reconnect case)
-        existing = next((p for p in room.players if p.user_id == user_id), None)
+        existing = self._players_by_user[room_id].get(user_id)
         if existing:
-            existing.connection_state = PlayerState.CONNECTED
+            room.set_player_state(existing, PlayerState.CONNECTED)
             existing.mark_active()
             logger.info(
                 "Player reconnected",
@@ -216,10 +299,17 @@ class GameService:
             is_spectator=as_spectator,
         )
 
-        try:
-            room.add_player(player)
-        except ValueError as e:
-            raise GameStateError(str(e)) from e
+        if as_spectator:
+            reason = room.can_add_spectator(player)
+            if reason:
+                raise GameStateError(reason)
+            room.add_spectator(player)
+        else:
+            reason = room.can_add_player(player)
+            if reason:
+                raise GameStateError(reason)
+            room.admit_player(player)
+        self._players_by_user[room_id][user_id] = player
 
         logger.info(
             "Player joined room",
@@ -257,7 +347,7 @@ class GameService:
         )
 
         # Delete room if empty
-        if not room.active_players():
+        if room.active_count == 0:
             self.delete_room(room_id)
 
         return True
@@ -304,13 +394,14 @@ class GameService:
         if not player or not player.is_host:
             raise GameStateError("Only the host can start the game")
 
-        try:
-            room.start_game()
-        except ValueError as e:
-            raise GameStateError(str(e)) from e
+        reason = room.can_start_game()
+        if reason:
+            raise GameStateError(reason)
+        room.start_game()
 
         # Create first round
         new_round = room.next_round()
+        self._index_state(room)
 
         # Generate word options for drawer (including custom words from host)
         logger.info(
@@ -319,12 +410,7 @@ class GameService:
             custom_words=room.settings.custom_words,
             custom_words_only=room.settings.custom_words_only,
         )
-        new_round.word_options = self._word_bank.get_word_options(
-            game_id=room.id,
-            count=3,
-            custom_words=room.settings.custom_words if room.settings.custom_words else None,
-            custom_words_only=room.settings.custom_words_only,
-        )
+        new_round.set_word_options(self._word_options(room))
 
         logger.info(
             "Game started",
@@ -361,7 +447,7 @@ class GameService:
             raise GameStateError("Only the drawer can select the word")
 
         # Validate word is one of the options
-        if word.lower() not in [w.lower() for w in room.current_round.word_options]:
+        if not room.current_round.is_word_option(word):
             raise GameStateError("Invalid word selection")
 
         # Mark the selected word as used (so it won't appear in future rounds)
@@ -369,7 +455,7 @@ class GameService:
 
         # Start the round
         room.current_round.start(word)
-        room.game_state = GameState.DRAWING
+        self._set_state(room, GameState.DRAWING)
 
         logger.info(
             "Word selected, round started",
@@ -404,85 +490,44 @@ class GameService:
         if not player:
             raise PlayerNotFoundError(player_id)
 
-        if room.game_state != GameState.DRAWING:
+        if room.game_state != _DRAWING:
             raise GameStateError("Not in drawing phase")
 
-        if not room.current_round:
+        current_round = room.current_round
+        if not current_round:
             raise GameStateError("No active round")
 
-        # Spectators cannot guess
+        # Spectators, the drawer, and players who already guessed cannot guess
         if player.is_spectator:
-            guess = Guess(
-                player_id=player_id,
-                player_name=player.user_name,
-                guess_text=guess_text,
-                result=GuessResult.INVALID,
-            )
-            msg = ChatMessage(
-                message_type=ChatMessageType.SYSTEM,
-                sender_id=player_id,
-                sender_name=player.user_name,
-                content="Spectators cannot guess!",
-            )
-            return guess, msg
-
-        # Drawer cannot guess
-        if room.current_round.drawer_id == player_id:
-            guess = Guess(
-                player_id=player_id,
-                player_name=player.user_name,
-                guess_text=guess_text,
-                result=GuessResult.DRAWER,
-            )
-            msg = ChatMessage(
-                message_type=ChatMessageType.SYSTEM,
-                sender_id=player_id,
-                sender_name=player.user_name,
-                content="Drawer cannot guess!",
-            )
-            return guess, msg
-
-        # Already guessed correctly
+            return self._reject_guess(room_id, player, guess_text, _INVALID)
+        if current_round.drawer_id == player_id:
+            return self._reject_guess(room_id, player, guess_text, _DRAWER)
         if player.has_guessed:
-            guess = Guess(
-                player_id=player_id,
-                player_name=player.user_name,
-                guess_text=guess_text,
-                result=GuessResult.ALREADY_GUESSED,
-            )
-            msg = ChatMessage(
-                message_type=ChatMessageType.SYSTEM,
-                sender_id=player_id,
-                sender_name=player.user_name,
-                content=f"{player.user_name} has already guessed!",
-            )
-            return guess, msg
+            return self._reject_guess(room_id, player, guess_text, _ALREADY_GUESSED)
 
         # Calculate time elapsed
         time_elapsed = 0.0
-        if room.current_round.start_time:
-            from datetime import UTC, datetime
-
-            time_elapsed = (datetime.now(UTC) - room.current_round.start_time).total_seconds()
+        if current_round.start_time:
+            time_elapsed = (datetime.now(UTC) - current_round.start_time).total_seconds()
 
         # Check the guess (returns GuessResult.CORRECT, .CLOSE, or .WRONG)
         result = self._word_bank.check_guess(
-            room.current_round.word,
+            current_round.word,
             guess_text,
         )
 
         points = 0
-        if result == GuessResult.CORRECT:
-            points = room.current_round.calculate_points(time_elapsed)
+        if result == _CORRECT:
+            points = current_round.calculate_points(time_elapsed)
             player.has_guessed = True
             player.guess_time = time_elapsed
-            player.award_points(points)
+            room.award_points(player, points)
 
             # Award drawer points
-            drawer = room.get_player(room.current_round.drawer_id)
+            drawer = room.get_player(current_round.drawer_id)
             if drawer:
                 drawer_points = int(points * room.settings.drawer_points_multiplier)
-                drawer.award_points(drawer_points)
+                room.award_points(drawer, drawer_points)
 
         # Create guess record
         guess = Guess(
@@ -493,38 +538,58 @@ class GameService:
             points_awarded=points,
             time_elapsed=time_elapsed,
         )
-        room.current_round.add_guess(guess)
+        current_round.add_guess(guess)
 
-        # Create chat message
-        if result == GuessResult.CORRECT:
-            msg = ChatMessage(
-                message_type=ChatMessageType.CORRECT,
-                sender_id=player_id,
-                sender_name=player.user_name,
-                content=f"{player.user_name} guessed the word! (+{points} points)",
-                metadata={"points": points, "time": time_elapsed},
-            )
-        elif result == GuessResult.CLOSE:
-            msg = ChatMessage.hint(player.user_name)
-        else:
-            # Regular guess shown to everyone
-            msg = ChatMessage(
-                message_type=ChatMessageType.GUESS,
-                sender_id=player_id,
-                sender_name=player.user_name,
-                content=guess_text,
+        # Create chat message (regular guesses are shown to everyone)
+        msg = self._MSG_BUILDERS.get(result, _guess_message)(player, guess_text, points, time_elapsed)
+
+        current_round.add_chat_message(msg)
+
+        # Guesses are the highest-volume event; skip building the event fields when DEBUG is filtered out
+        if is_debug_enabled():
+            logger.debug(
+                "Guess submitted",
+                room_id=str(room_id),
+                player=player.user_name,
+                result=result.value,
+                points=points,
             )
 
-        room.current_round.add_chat_message(msg)
+        return guess, msg
 
-        logger.debug(
-            "Guess submitted",
-            room_id=str(room_id),
-            player=player.user_name,
-            result=result.value,
-            points=points,
-        )
+    def _reject_guess(
+        self,
+        room_id: UUID,
+        player: Player,
+        guess_text: str,
+        result: GuessResult,
+    ) -> tuple[Guess, ChatMessage]:
+        """Build the reply for a guess the player is not allowed to make.
+
+        The system message only depends on the player and the rejection reason, so it is
+        built once and shared by every later rejection for the same reason. It is never
+        recorded in the round and must not be mutated.
+
+        Args:
+            room_id: The room ID.
+            player: Player who made the guess.
+            guess_text: The guess attempt.
+            result: Rejection reason (INVALID, DRAWER, or ALREADY_GUESSED).
 
+        Returns:
+            Tuple of (Guess result, ChatMessage to send back to the player).
+        """
+        guess = Guess(player_id=player.id, player_name=player.user_name, guess_text=guess_text, result=result)
+        messages = self._rejection_messages.setdefault(room_id, {})
+        msg = messages.get((player.id, result))
+        if msg is None or msg.sender_name != player.user_name:
+            msg = ChatMessage(
+                message_type=ChatMessageType.SYSTEM,
+                sender_id=player.id,
+                sender_name=player.user_name,
+                content=self._REJECTION_CONTENT[result].format(name=player.user_name),
+            )
+            messages[(player.id, result)] = msg
         return guess, msg
 
     def end_round(self, room_id: UUID) -> dict:
@@ -538,12 +603,11 @@ class GameService:
         """
         room = self.get_room(room_id)
 
-        if not room.current_round:
+        current_round = room.current_round
+        if not current_round:
             raise GameStateError("No active round")
 
-        word = room.current_round.word
-        round_number = room.current_round.round_number
-        drawer_id = room.current_round.drawer_id
+        word, round_number, drawer_id = current_round.word, current_round.round_number, current_round.drawer_id
 
         # Get drawer name before moving round to history
         drawer = room.get_player(drawer_id)
@@ -555,6 +619,7 @@ class GameService:
         is_game_over = room.is_game_over()
         if is_game_over:
             room.game_state = GameState.GAME_OVER
+        self._index_state(room)
 
         logger.info(
             "Round ended",
@@ -594,14 +659,12 @@ class GameService:
             new_round = room.next_round()
         except ValueError as e:
             raise GameStateError(str(e)) from e
+        finally:
+            # next_round() moves the room to WORD_SELECTION, or to GAME_OVER when it raises
+            self._index_state(room)
 
         # Generate word options (including custom words from host)
-        new_round.word_options = self._word_bank.get_word_options(
-            game_id=room.id,
-            count=3,
-            custom_words=room.settings.custom_words if room.settings.custom_words else None,
-            custom_words_only=room.settings.custom_words_only,
-        )
+        new_round.set_word_options(self._word_options(room))
 
         logger.info(
             "Next round started",
@@ -638,17 +701,15 @@ class GameService:
         """
         room = self.get_room(room_id)
 
-        room.game_state = GameState.LOBBY
+        self._set_state(room, GameState.LOBBY)
         room.current_round = None
-        room.round_history = []
+        room.round_history.clear()
         room.current_round_number = 0
         room.started_at = None
         room.ended_at = None
 
         # Reset player scores
-        for player in room.players:
-            player.score = 0
-            player.reset_round_state()
+        room.reset_scores()
 
         # Reset word bank used words
         self._word_bank.reset_game_words(room.id)
@@ -659,6 +720,56 @@ class GameService:
 
     # Utility Methods
 
+    def _word_options(self, room: GameRoom, count: int = 3) -> list[str]:
+        """Pick word options for the room's next drawer.
+
+        Custom-words-only rooms draw from their own shuffled pool; other rooms go
+        through the word bank, which mixes in the host's custom words.
+
+        Args:
+            room: The room starting a round.
+            count: Number of options to offer.
+
+        Returns:
+            Word options for the drawer.
+        """
+        settings = room.settings
+        if settings.custom_words_only and settings.custom_words:
+            return room.next_custom_word_options(count)
+        return self._word_bank.get_word_options(
+            game_id=room.id,
+            count=count,
+            custom_words=settings.custom_words or None,
+            custom_words_only=settings.custom_words_only,
+        )
+
+    def _set_state(self, room: GameRoom, state: GameState) -> None:
+        """Move a room to a new game state and update the state index.
+
+        Args:
+            room: The room to update.
+            state: The new game state.
+        """
+        room.game_state = state
+        self._index_state(room)
+
+    def _index_state(self, room: GameRoom) -> None:
+        """Re-file a room under its current game state in the state index.
+
+        Must be called after anything that may change ``room.game_state``, including
+        the GameRoom lifecycle methods.
+
+        Args:
+            room: The room whose state may have changed.
+        """
+        previous = self._indexed_state.get(room.id)
+        if previous == room.game_state:
+            return
+        if previous is not None:
+            self._rooms_by_state[previous].pop(room.id, None)
+        self._rooms_by_state[room.game_state][room.id] = room
+        self._indexed_state[room.id] = room.game_state
+
     def _generate_room_code(self, length: int = 6) -> str:
         """Generate a unique room join code.
 
@@ -669,7 +780,7 @@ class GameService:
             Unique alphanumeric code.
         """
         while True:
-            code = "".join(random.choices(string.ascii_uppercase + string.digits, k=length))
+            code = os.urandom(length).translate(_ROOM_CODE_TABLE).decode("ascii")
             if code not in self._room_codes:
                 return code
 
@@ -691,10 +802,7 @@ class GameService:
         Returns:
             List of rooms in LOBBY state.
         """
-        rooms = [r for r in self._rooms.values() if r.game_state == GameState.LOBBY]
-        if public_only:
-            rooms = [r for r in rooms if r.settings.is_public]
-        return rooms
+        return self._indexed_rooms((GameState.LOBBY,), public_only=public_only)
 
     def get_active_games(self, *, public_only: bool = True) -> list[GameRoom]:
         """Get rooms with games in progress (available for spectating).
@@ -705,8 +813,25 @@ class GameService:
         Returns:
             List of rooms in DRAWING, WORD_SELECTION, or ROUND_END state.
         """
-        active_states = {GameState.DRAWING, GameState.WORD_SELECTION, GameState.ROUND_END}
-        rooms = [r for r in self._rooms.values() if r.game_state in active_states]
-        if public_only:
-            rooms = [r for r in rooms if r.settings.is_public]
-        return rooms
+        return self._indexed_rooms(
+            (GameState.WORD_SELECTION, GameState.DRAWING, GameState.ROUND_END),
+            public_only=public_only,
+        )
+
+    def _indexed_rooms(self, states: tuple[GameState, ...], *, public_only: bool) -> list[GameRoom]:
+        """Collect rooms in the given states from the state index.
+
+        Args:
+            states: Game states to include.
+            public_only: If True, only include public rooms.
+
+        Returns:
+            Matching rooms.
+        """
+        public = self._public_rooms
+        return [
+            room
+            for state in states
+            for room_id, room in self._rooms_by_state[state].items()
+            if not public_only or room_id in public
+        ]
@@ -7,20 +7,40 @@ Can optionally integrate with external services like Sentry, PostHog, or Grafana
 from __future__ import annotations
 
 import os
-from dataclasses import dataclass, field
-from datetime import UTC, datetime, timedelta
+import queue
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field, fields
+from datetime import UTC, datetime
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any
 from uuid import UUID
 
 import structlog
 
+from scribbl_py.core.logging import is_debug_enabled
+
 if TYPE_CHECKING:
     from collections.abc import Callable
 
 logger = structlog.get_logger(__name__)
 
+# Bound on PostHog events waiting for the background sender; further events are dropped
+_POSTHOG_QUEUE_SIZE = 4096
+_POSTHOG_BATCH_SIZE = 100
+
+# Hard cap on events kept for rate calculations, so a burst cannot grow the window without bound
+_RECENT_EVENTS_MAX = 100_000
+
 
-@dataclass
+@lru_cache(maxsize=4096)
+def _uuid_str(value: UUID) -> str:
+    """Return the string form of a UUID, memoized for long-lived room and player ids."""
+    return str(value)
+
+
+@dataclass(slots=True)
 class TelemetryStats:
     """Current telemetry statistics snapshot."""
 
@@ -46,6 +66,9 @@ class TelemetryStats:
     started_at: datetime = field(default_factory=lambda: datetime.now(UTC))
 
 
+_STATS_FIELD_NAMES = tuple(f.name for f in fields(TelemetryStats))
+
+
 class TelemetryService:
     """Service for tracking and reporting telemetry data.
 
@@ -65,15 +88,21 @@ class TelemetryService:
     def __init__(self) -> None:
         """Initialize the telemetry service."""
         self._started_at = datetime.now(UTC)
+        self._started_monotonic = time.monotonic()
         self._stats = TelemetryStats(started_at=self._started_at)
 
-        # Track recent events for rate calculations
-        self._recent_events: list[tuple[datetime, str, dict[str, Any]]] = []
-        self._recent_window = timedelta(minutes=5)
+        # Track recent events for rate calculations (payloads are not retained)
+        self._recent_events: deque[tuple[float, str]] = deque(maxlen=_RECENT_EVENTS_MAX)
+        self._recent_window = 300.0  # seconds
+
+        # Logging is configured before services are created, so the debug check is read once
+        self._debug_enabled = is_debug_enabled()
 
         # External integrations
         self._sentry_enabled = False
-        self._posthog_enabled = False
+        self._posthog_capture: Callable[[str, str, dict[str, Any]], Any] | None = None
+        self._posthog_queue: queue.Queue[tuple[str, str, dict[str, Any]]] = queue.Queue(maxsize=_POSTHOG_QUEUE_SIZE)
+        self._posthog_dropped = 0
         self._callbacks: list[Callable[[str, dict[str, Any]], None]] = []
 
         self._init_integrations()
@@ -106,7 +135,8 @@ class TelemetryService:
 
                 posthog.project_api_key = posthog_key
                 posthog.host = posthog_host
-                self._posthog_enabled = True
+                self._posthog_capture = posthog.capture
+                threading.Thread(target=self._posthog_worker, name="telemetry-posthog", daemon=True).start()
                 logger.info("PostHog integration enabled")
             except ImportError:
                 logger.debug("PostHog SDK not installed, skipping integration")
@@ -126,36 +156,78 @@ class TelemetryService:
             event: Event name.
             data: Event data.
         """
-        now = datetime.now(UTC)
-
-        # Track recent events
-        self._recent_events.append((now, event, data))
-        self._cleanup_recent_events()
-
-        # Log the event
-        logger.debug("Telemetry event", telemetry_event=event, **data)
-
-        # Send to PostHog if enabled
-        if self._posthog_enabled:
+        # Track recent events, reading the clock once for both cleanup and the new entry
+        now = time.monotonic()
+        self._cleanup_recent_events(now)
+        if len(self._recent_events) == _RECENT_EVENTS_MAX:
+            # Evict explicitly so the recent counters stay in step with the window
+            self._drop_oldest_event()
+        self._recent_events.append((now, event))
+
+        # Log the event; skip spreading the payload when DEBUG is filtered out
+        debug = self._debug_enabled
+        if debug:
+            logger.debug("Telemetry event", telemetry_event=event, **data)
+
+        # Hand off to the PostHog sender thread if enabled
+        if self._posthog_capture is not None:
+            distinct_id = data.get("user_id") or data.get("player_id") or "anonymous"
             try:
-                import posthog
-
-                distinct_id = data.get("user_id") or data.get("player_id") or "anonymous"
-                posthog.capture(distinct_id, event, data)
-            except Exception as e:
-                logger.debug("PostHog capture failed", error=str(e))
+                self._posthog_queue.put_nowait((distinct_id, event, dict(data)))
+            except queue.Full:
+                self._posthog_dropped += 1
 
         # Call registered callbacks
         for callback in self._callbacks:
             try:
                 callback(event, data)
             except Exception as e:
-                logger.debug("Telemetry callback failed", error=str(e))
+                if debug:
+                    logger.debug("Telemetry callback failed", error=str(e))
+
+    def _posthog_worker(self) -> None:
+        """Send queued events to PostHog in batches, off the request path."""
+        capture = self._posthog_capture
+        if capture is None:
+            return
+        q = self._posthog_queue
+        while True:
+            batch = [q.get()]
+            while len(batch) < _POSTHOG_BATCH_SIZE:
+                try:
+                    batch.append(q.get_nowait())
+                except queue.Empty:
+                    break
+            for distinct_id, event, data in batch:
+                try:
+                    capture(distinct_id, event, data)
+                except Exception as e:
+                    if self._debug_enabled:
+                        logger.debug("PostHog capture failed", error=str(e))
+
+    def _cleanup_recent_events(self, now: float | None = None) -> None:
+        """Remove events older than the recent window.
+
+        Events are appended in time order, so stale entries are always at the head.
 
-    def _cleanup_recent_events(self) -> None:
-        """Remove events older than the recent window."""
-        cutoff = datetime.now(UTC) - self._recent_window
-        self._recent_events = [(ts, ev, data) for ts, ev, data in self._recent_events if ts > cutoff]
+        Args:
+            now: Current monotonic time, if the caller has already read it.
+        """
+        events = self._recent_events
+        if not events:
+            # Idle server: nothing to expire, skip the clock read
+            return
+        cutoff = (time.monotonic() if now is None else now) - self._recent_window
+        while events and events[0][0] <= cutoff:
+            self._drop_oldest_event()
+
+    def _drop_oldest_event(self) -> None:
+        """Remove the oldest recent event and update the recent counters."""
+        _, event = self._recent_events.popleft()
+        if event == "game_started":
+            self._stats.recent_games_started -= 1
+        elif event == "guess_made":
+            self._stats.recent_guesses -= 1
 
     # === Connection Tracking ===
 
@@ -175,8 +247,8 @@ class TelemetryService:
         Args:
             connection_type: Type of connection.
         """
-        if connection_type == "websocket":
-            self._stats.active_websocket_connections = max(0, self._stats.active_websocket_connections - 1)
+        if connection_type == "websocket" and self._stats.active_websocket_connections > 0:
+            self._stats.active_websocket_connections -= 1
         self._emit_event("connection_closed", {"type": connection_type})
 
     # === Game Room Tracking ===
@@ -189,7 +261,7 @@ class TelemetryService:
             is_public: Whether the room is public.
         """
         self._stats.active_game_rooms += 1
-        self._emit_event("room_created", {"room_id": str(room_id), "is_public": is_public})
+        self._emit_event("room_created", {"room_id": _uuid_str(room_id), "is_public": is_public})
 
     def track_room_closed(self, room_id: UUID) -> None:
         """Track a game room closed.
@@ -197,8 +269,9 @@ class TelemetryService:
         Args:
             room_id: Room identifier.
         """
-        self._stats.active_game_rooms = max(0, self._stats.active_game_rooms - 1)
-        self._emit_event("room_closed", {"room_id": str(room_id)})
+        if self._stats.active_game_rooms > 0:
+            self._stats.active_game_rooms -= 1
+        self._emit_event("room_closed", {"room_id": _uuid_str(room_id)})
 
     def track_player_joined(self, room_id: UUID, player_id: UUID, is_spectator: bool = False) -> None:
         """Track a player joining a room.
@@ -214,7 +287,7 @@ class TelemetryService:
             self._stats.active_players_in_games += 1
         self._emit_event(
             "player_joined",
-            {"room_id": str(room_id), "player_id": str(player_id), "is_spectator": is_spectator},
+            {"room_id": _uuid_str(room_id), "player_id": _uuid_str(player_id), "is_spectator": is_spectator},
         )
 
     def track_player_left(self, room_id: UUID, player_id: UUID, is_spectator: bool = False) -> None:
@@ -226,12 +299,13 @@ class TelemetryService:
             is_spectator: Whether was a spectator.
         """
         if is_spectator:
-            self._stats.spectators = max(0, self._stats.spectators - 1)
-        else:
-            self._stats.active_players_in_games = max(0, self._stats.active_players_in_games - 1)
+            if self._stats.spectators > 0:
+                self._stats.spectators -= 1
+        elif self._stats.active_players_in_games > 0:
+            self._stats.active_players_in_games -= 1
         self._emit_event(
             "player_left",
-            {"room_id": str(room_id), "player_id": str(player_id), "is_spectator": is_spectator},
+            {"room_id": _uuid_str(room_id), "player_id": _uuid_str(player_id), "is_spectator": is_spectator},
         )
 
     # === Game Event Tracking ===
@@ -244,7 +318,7 @@ class TelemetryService:
             player_count: Number of players.
         """
         self._stats.recent_games_started += 1
-        self._emit_event("game_started", {"room_id": str(room_id), "player_count": player_count})
+        self._emit_event("game_started", {"room_id": _uuid_str(room_id), "player_count": player_count})
 
     def track_round_started(self, room_id: UUID, round_number: int, drawer_id: UUID) -> None:
         """Track a round starting.
@@ -257,7 +331,7 @@ class TelemetryService:
         self._stats.total_rounds_played += 1
         self._emit_event(
             "round_started",
-            {"room_id": str(room_id), "round_number": round_number, "drawer_id": str(drawer_id)},
+            {"room_id": _uuid_str(room_id), "round_number": round_number, "drawer_id": _uuid_str(drawer_id)},
         )
 
     def track_guess(
@@ -282,8 +356,8 @@ class TelemetryService:
         self._emit_event(
             "guess_made",
             {
-                "room_id": str(room_id),
-                "player_id": str(player_id),
+                "room_id": _uuid_str(room_id),
+                "player_id": _uuid_str(player_id),
                 "correct": correct,
                 "time_ms": time_ms,
             },
@@ -300,7 +374,7 @@ class TelemetryService:
         self._stats.total_drawings += 1
         self._emit_event(
             "drawing_completed",
-            {"room_id": str(room_id), "drawer_id": str(drawer_id), "was_guessed": was_guessed},
+            {"room_id": _uuid_str(room_id), "drawer_id": _uuid_str(drawer_id), "was_guessed": was_guessed},
         )
 
     def track_game_ended(
@@ -322,8 +396,8 @@ class TelemetryService:
         self._emit_event(
             "game_ended",
             {
-                "room_id": str(room_id),
-                "winner_id": str(winner_id) if winner_id else None,
+                "room_id": _uuid_str(room_id),
+                "winner_id": _uuid_str(winner_id) if winner_id else None,
                 "player_count": player_count,
                 "rounds_played": rounds_played,
             },
@@ -337,18 +411,11 @@ class TelemetryService:
         Returns:
             Current stats snapshot.
         """
+        # Recent counts are maintained as events enter and leave the window
         self._cleanup_recent_events()
 
-        # Update recent counts
-        now = datetime.now(UTC)
-        cutoff = now - self._recent_window
-        self._stats.recent_games_started = sum(
-            1 for ts, ev, _ in self._recent_events if ev == "game_started" and ts > cutoff
-        )
-        self._stats.recent_guesses = sum(1 for ts, ev, _ in self._recent_events if ev == "guess_made" and ts > cutoff)
-
         # Update uptime
-        self._stats.uptime_seconds = (now - self._started_at).total_seconds()
+        self._stats.uptime_seconds = time.monotonic() - self._started_monotonic
 
         return self._stats
 
@@ -359,25 +426,14 @@ class TelemetryService:
             Stats as dict.
         """
         stats = self.get_stats()
-        return {
-            "active_websocket_connections": stats.active_websocket_connections,
-            "active_game_rooms": stats.active_game_rooms,
-            "active_players_in_games": stats.active_players_in_games,
-            "spectators": stats.spectators,
-            "total_games_played": stats.total_games_played,
-            "total_rounds_played": stats.total_rounds_played,
-            "total_guesses": stats.total_guesses,
-            "total_correct_guesses": stats.total_correct_guesses,
-            "total_drawings": stats.total_drawings,
-            "recent_games_started": stats.recent_games_started,
-            "recent_guesses": stats.recent_guesses,
-            "uptime_seconds": stats.uptime_seconds,
-            "started_at": stats.started_at.isoformat(),
-        }
+        data = {name: getattr(stats, name) for name in _STATS_FIELD_NAMES}
+        data["started_at"] = stats.started_at.isoformat()
+        return data
 
 
 # Global telemetry service instance
 _telemetry: TelemetryService | None = None
+_telemetry_lock = threading.Lock()
 
 
 def get_telemetry() -> TelemetryService:
@@ -387,6 +443,10 @@ def get_telemetry() -> TelemetryService:
         TelemetryService instance.
     """
     global _telemetry
-    if _telemetry is None:
-        _telemetry = TelemetryService()
-    return _telemetry
+    telemetry = _telemetry
+    if telemetry is not None:
+        return telemetry
+    with _telemetry_lock:
+        if _telemetry is None:
+            _telemetry = TelemetryService()
+        return _telemetry
@@ -18,6 +18,8 @@ def __getattr__(name: str) -> object:
     if name == "DatabaseStorage":
         from scribbl_py.storage.db import DatabaseStorage
 
+        # Cache on the module so later lookups skip __getattr__
+        globals()[name] = DatabaseStorage
         return DatabaseStorage
     msg = f"module {__name__!r} has no attribute {name!r}"
     raise AttributeError(msg)
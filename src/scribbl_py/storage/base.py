@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Protocol, runtime_checkable
+from typing import TYPE_CHECKING, Protocol
 
 if TYPE_CHECKING:
     from uuid import UUID
@@ -10,7 +10,6 @@ if TYPE_CHECKING:
     from scribbl_py.core.models import Canvas, Element
 
 
-@runtime_checkable
 class StorageProtocol(Protocol):
     """Protocol defining the storage interface for scribbl-py.
 
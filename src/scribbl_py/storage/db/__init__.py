@@ -6,6 +6,7 @@ Requires the `db` optional dependency: `pip install scribbl-py[db]`
 
 from __future__ import annotations
 
+import importlib
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -27,39 +28,30 @@ __all__ = [
 ]
 
 
-def __getattr__(name: str) -> object:
-    """Lazy import database components to avoid import errors without db extra."""
-    if name == "DatabaseStorage":
-        from scribbl_py.storage.db.storage import DatabaseStorage
-
-        return DatabaseStorage
-    if name == "CanvasModel":
-        from scribbl_py.storage.db.models import CanvasModel
-
-        return CanvasModel
-    if name == "ElementModel":
-        from scribbl_py.storage.db.models import ElementModel
-
-        return ElementModel
-    if name == "DatabaseManager":
-        from scribbl_py.storage.db.setup import DatabaseManager
+# Attribute name -> defining module, imported on first access
+_LAZY_IMPORTS = {
+    "AuthDatabaseStorage": "scribbl_py.storage.db.auth_storage",
+    "CanvasModel": "scribbl_py.storage.db.models",
+    "DatabaseManager": "scribbl_py.storage.db.setup",
+    "DatabaseStorage": "scribbl_py.storage.db.storage",
+    "ElementModel": "scribbl_py.storage.db.models",
+    "SessionModel": "scribbl_py.storage.db.auth_models",
+    "UserModel": "scribbl_py.storage.db.auth_models",
+    "UserStatsModel": "scribbl_py.storage.db.auth_models",
+}
 
-        return DatabaseManager
-    if name == "AuthDatabaseStorage":
-        from scribbl_py.storage.db.auth_storage import AuthDatabaseStorage
 
-        return AuthDatabaseStorage
-    if name == "UserModel":
-        from scribbl_py.storage.db.auth_models import UserModel
-
-        return UserModel
-    if name == "SessionModel":
-        from scribbl_py.storage.db.auth_models import SessionModel
-
-        return SessionModel
-    if name == "UserStatsModel":
-        from scribbl_py.storage.db.auth_models import UserStatsModel
-
-        return UserStatsModel
-    msg = f"module {__name__!r} has no attribute {name!r}"
-    raise AttributeError(msg)
+def __getattr__(name: str) -> object:
+    """Lazy import database components to avoid import errors without db extra.
+
+    Resolved attributes are cached in the module namespace, so later lookups
+    never reach this function.
+    """
+    try:
+        module_name = _LAZY_IMPORTS[name]
+    except KeyError:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg) from None
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
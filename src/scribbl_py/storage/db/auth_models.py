@@ -3,37 +3,65 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 from uuid import UUID
 
 from advanced_alchemy.base import UUIDAuditBase
-from sqlalchemy import BigInteger, Boolean, DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy import (
+    BigInteger,
+    Boolean,
+    Computed,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    inspect,
+    text,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
+from scribbl_py.auth.models import OAuthProvider, Session, User, UserStats
+
 if TYPE_CHECKING:
-    from scribbl_py.auth.models import Session, User, UserStats
+    from collections.abc import Mapping
+
+
+# Drawer success rate; NULL for users who never drew
+_DRAWER_SUCCESS_PCT_SQL = (
+    "CASE WHEN drawings_completed > 0 THEN drawings_guessed * 100.0 / drawings_completed ELSE NULL END"
+)
 
 
 class UserModel(UUIDAuditBase):
     """SQLAlchemy model for User entities."""
 
     __tablename__ = "users"
+    __table_args__ = (
+        # OAuth logins always look up by provider and provider-side id together,
+        # and each provider identity belongs to exactly one user
+        Index("ix_users_oauth", "oauth_provider", "oauth_id", unique=True),
+    )
 
     username: Mapped[str] = mapped_column(String(100), default="Anonymous")
     email: Mapped[str | None] = mapped_column(String(255), nullable=True, index=True)
     avatar_url: Mapped[str | None] = mapped_column(Text, nullable=True)
     oauth_provider: Mapped[str | None] = mapped_column(String(20), nullable=True)
-    oauth_id: Mapped[str | None] = mapped_column(String(255), nullable=True, index=True)
+    oauth_id: Mapped[str | None] = mapped_column(String(255), nullable=True)
     is_active: Mapped[bool] = mapped_column(Boolean, default=True)
     is_admin: Mapped[bool] = mapped_column(Boolean, default=False)
     last_login: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
 
     # Relationships
+    # Lazy loads can't run under an async session; load explicitly with selectinload
     stats: Mapped[UserStatsModel | None] = relationship(
         "UserStatsModel",
         back_populates="user",
         uselist=False,
         cascade="all, delete-orphan",
+        lazy="raise",
     )
     sessions: Mapped[list[SessionModel]] = relationship(
         "SessionModel",
@@ -46,6 +74,38 @@ class UserStatsModel(UUIDAuditBase):
     """SQLAlchemy model for UserStats entities."""
 
     __tablename__ = "user_stats"
+    __table_args__ = (
+        # One partial index per leaderboard ordering, limited to users who have played.
+        # user_id is the second key column because pages sort and seek on (sort key, user_id).
+        Index(
+            "ix_user_stats_wins",
+            text("games_won DESC"),
+            text("user_id DESC"),
+            postgresql_where=text("games_played > 0"),
+            sqlite_where=text("games_played > 0"),
+        ),
+        Index(
+            "ix_user_stats_games",
+            text("games_played DESC"),
+            text("user_id DESC"),
+            postgresql_where=text("games_played > 0"),
+            sqlite_where=text("games_played > 0"),
+        ),
+        Index(
+            "ix_user_stats_fastest",
+            text("fastest_guess_ms"),
+            text("user_id ASC"),
+            postgresql_where=text("games_played > 0"),
+            sqlite_where=text("games_played > 0"),
+        ),
+        Index(
+            "ix_user_stats_drawer_pct",
+            text("drawer_success_pct DESC"),
+            text("user_id DESC"),
+            postgresql_where=text("games_played > 0 AND drawer_success_pct IS NOT NULL"),
+            sqlite_where=text("games_played > 0 AND drawer_success_pct IS NOT NULL"),
+        ),
+    )
 
     user_id: Mapped[UUID] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"), unique=True, index=True)
     games_played: Mapped[int] = mapped_column(Integer, default=0)
@@ -60,6 +120,12 @@ class UserStatsModel(UUIDAuditBase):
     best_game_score: Mapped[int] = mapped_column(Integer, default=0)
     current_win_streak: Mapped[int] = mapped_column(Integer, default=0)
     best_win_streak: Mapped[int] = mapped_column(Integer, default=0)
+    # Drawer leaderboard key, maintained by the database so it can be indexed
+    drawer_success_pct: Mapped[float | None] = mapped_column(
+        Float,
+        Computed(_DRAWER_SUCCESS_PCT_SQL, persisted=True),
+        nullable=True,
+    )
 
     # Relationship
     user: Mapped[UserModel] = relationship("UserModel", back_populates="stats")
@@ -76,9 +142,10 @@ class SessionModel(UUIDAuditBase):
     session_token: Mapped[str] = mapped_column(String(64), unique=True, index=True)
     user_id: Mapped[UUID | None] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"), nullable=True, index=True)
     guest_name: Mapped[str] = mapped_column(String(100), default="Anonymous")
-    expires_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
-    ip_address: Mapped[str | None] = mapped_column(String(45), nullable=True)  # IPv6 max length
-    user_agent: Mapped[str | None] = mapped_column(Text, nullable=True)
+    expires_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True, index=True)
+    # Audit-only columns, deferred so token lookups don't fetch them
+    ip_address: Mapped[str | None] = mapped_column(String(45), nullable=True, deferred=True)  # IPv6 max length
+    user_agent: Mapped[str | None] = mapped_column(Text, nullable=True, deferred=True)
 
     # Relationship
     user: Mapped[UserModel | None] = relationship("UserModel", back_populates="sessions")
@@ -103,8 +170,6 @@ def user_to_model(user: User) -> UserModel:
 
 def user_from_model(model: UserModel) -> User:
     """Convert UserModel to domain User."""
-    from scribbl_py.auth.models import OAuthProvider, User
-
     return User(
         id=model.id,
         username=model.username,
@@ -141,8 +206,6 @@ def stats_to_model(stats: UserStats) -> UserStatsModel:
 
 def stats_from_model(model: UserStatsModel) -> UserStats:
     """Convert UserStatsModel to domain UserStats."""
-    from scribbl_py.auth.models import UserStats
-
     return UserStats(
         user_id=model.user_id,
         games_played=model.games_played,
@@ -161,6 +224,37 @@ def stats_from_model(model: UserStatsModel) -> UserStats:
     )
 
 
+# Columns selected for leaderboard rows: just what's displayed, no ORM entities
+LEADERBOARD_COLUMNS = (
+    UserModel.username,
+    UserModel.avatar_url,
+    UserStatsModel.user_id,
+    UserStatsModel.games_played,
+    UserStatsModel.games_won,
+    UserStatsModel.total_score,
+    UserStatsModel.correct_guesses,
+    UserStatsModel.total_guesses,
+    UserStatsModel.total_guess_time_ms,
+    UserStatsModel.fastest_guess_ms,
+    UserStatsModel.drawings_completed,
+    UserStatsModel.drawings_guessed,
+    UserStatsModel.best_game_score,
+    UserStatsModel.current_win_streak,
+    UserStatsModel.best_win_streak,
+    UserStatsModel.updated_at,
+)
+
+
+def leaderboard_entry_from_row(row: Mapping[str, Any]) -> tuple[User, UserStats]:
+    """Convert a ``LEADERBOARD_COLUMNS`` row to a domain (User, UserStats) pair.
+
+    The user only carries the public fields shown on the leaderboard.
+    """
+    user = User(id=row["user_id"], username=row["username"], avatar_url=row["avatar_url"])
+    stats = UserStats(**{column.key: row[column.key] for column in LEADERBOARD_COLUMNS[2:]})
+    return user, stats
+
+
 def session_to_model(session: Session) -> SessionModel:
     """Convert domain Session to SessionModel."""
     return SessionModel(
@@ -175,15 +269,18 @@ def session_to_model(session: Session) -> SessionModel:
 
 
 def session_from_model(model: SessionModel) -> Session:
-    """Convert SessionModel to domain Session."""
-    from scribbl_py.auth.models import Session
+    """Convert SessionModel to domain Session.
 
+    Deferred audit columns that were not loaded are left as ``None`` rather than
+    triggering a lazy load, which is not possible under an async session.
+    """
+    unloaded = inspect(model).unloaded
     return Session(
         id=model.session_token,
         user_id=model.user_id,
         guest_name=model.guest_name,
         created_at=model.created_at,
         expires_at=model.expires_at,
-        ip_address=model.ip_address,
-        user_agent=model.user_agent,
+        ip_address=None if "ip_address" in unloaded else model.ip_address,
+        user_agent=None if "user_agent" in unloaded else model.user_agent,
     )
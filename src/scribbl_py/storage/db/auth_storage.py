@@ -2,16 +2,19 @@
 
 from __future__ import annotations
 
-from datetime import UTC, datetime
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 from uuid import UUID
 
-from sqlalchemy import delete, select
+from sqlalchemy import delete, func, lambda_stmt, select, tuple_, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import selectinload, undefer
 
 from scribbl_py.storage.db.auth_models import (
+    LEADERBOARD_COLUMNS,
     SessionModel,
     UserModel,
     UserStatsModel,
+    leaderboard_entry_from_row,
     session_from_model,
     session_to_model,
     stats_from_model,
@@ -21,13 +24,25 @@ from scribbl_py.storage.db.auth_models import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Sequence
+
     from sqlalchemy.ext.asyncio import AsyncSession
 
     from scribbl_py.auth.models import Session, User, UserStats
 
+# Dialects with INSERT ... ON CONFLICT support, used for stats upserts
+_UPSERT_INSERTS = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+
+# (sort key value, user_id) of the last row on a leaderboard page
+LeaderboardCursor = tuple[Any, UUID]
+
 
 class AuthDatabaseStorage:
-    """Database storage for auth entities (User, Session, UserStats)."""
+    """Database storage for auth entities (User, Session, UserStats).
+
+    The per-request lookups (session token, email, OAuth identity) are built with
+    ``lambda_stmt`` so SQLAlchemy caches both the statement and its compiled SQL.
+    """
 
     def __init__(self, session: AsyncSession) -> None:
         """Initialize with database session.
@@ -40,25 +55,57 @@ class AuthDatabaseStorage:
     # === User Operations ===
 
     async def create_user(self, user: User) -> User:
-        """Create a new user."""
+        """Create a new user.
+
+        Column defaults are filled in on the instance by the INSERT, so no refresh is needed.
+        """
         model = user_to_model(user)
         self._session.add(model)
         await self._session.flush()
-        await self._session.refresh(model)
         return user_from_model(model)
 
+    async def create_user_with_stats(self, user: User, stats: UserStats) -> tuple[User, UserStats]:
+        """Create a new user together with their initial stats in one flush.
+
+        Column defaults are filled in on the instances by the INSERT, so no refresh is needed.
+        """
+        user_model = user_to_model(user)
+        stats_model = stats_to_model(stats)
+        self._session.add_all([user_model, stats_model])
+        await self._session.flush()
+        return user_from_model(user_model), stats_from_model(stats_model)
+
     async def get_user(self, user_id: UUID) -> User | None:
-        """Get user by ID."""
-        stmt = select(UserModel).where(UserModel.id == user_id)
-        result = await self._session.execute(stmt)
-        model = result.scalar_one_or_none()
+        """Get user by ID.
+
+        Goes through ``Session.get`` so a user already loaded in this session is
+        served from the identity map without a query.
+        """
+        model = await self._session.get(UserModel, user_id)
         return user_from_model(model) if model else None
 
+    async def get_users_with_stats(self, user_ids: Sequence[UUID]) -> list[tuple[User, UserStats | None]]:
+        """Get users and their stats without a separate stats query per user.
+
+        Args:
+            user_ids: IDs of the users to load.
+
+        Returns:
+            (User, UserStats) pairs in the order of ``user_ids``; unknown IDs are skipped.
+        """
+        stmt = select(UserModel).where(UserModel.id.in_(user_ids)).options(selectinload(UserModel.stats))
+        result = await self._session.execute(stmt)
+        models = {model.id: model for model in result.scalars()}
+        return [
+            (user_from_model(model), stats_from_model(model.stats) if model.stats else None)
+            for user_id in user_ids
+            if (model := models.get(user_id)) is not None
+        ]
+
     async def get_user_by_oauth(self, provider: str, oauth_id: str) -> User | None:
         """Get user by OAuth provider and ID."""
-        stmt = select(UserModel).where(
-            UserModel.oauth_provider == provider,
-            UserModel.oauth_id == oauth_id,
+        stmt = lambda_stmt(
+            lambda: select(UserModel).where(UserModel.oauth_provider == provider, UserModel.oauth_id == oauth_id)
         )
         result = await self._session.execute(stmt)
         model = result.scalar_one_or_none()
@@ -66,42 +113,44 @@ class AuthDatabaseStorage:
 
     async def get_user_by_email(self, email: str) -> User | None:
         """Get user by email."""
-        stmt = select(UserModel).where(UserModel.email == email)
+        stmt = lambda_stmt(lambda: select(UserModel).where(UserModel.email == email))
         result = await self._session.execute(stmt)
         model = result.scalar_one_or_none()
         return user_from_model(model) if model else None
 
     async def update_user(self, user: User) -> User:
         """Update user data."""
-        stmt = select(UserModel).where(UserModel.id == user.id)
+        stmt = (
+            update(UserModel)
+            .where(UserModel.id == user.id)
+            .values(
+                username=user.username,
+                email=user.email,
+                avatar_url=user.avatar_url,
+                is_active=user.is_active,
+                is_admin=user.is_admin,
+                last_login=user.last_login,
+            )
+            .returning(UserModel)
+            .execution_options(populate_existing=True)
+        )
         result = await self._session.execute(stmt)
         model = result.scalar_one_or_none()
         if model is None:
             msg = f"User {user.id} not found"
             raise ValueError(msg)
-
-        model.username = user.username
-        model.email = user.email
-        model.avatar_url = user.avatar_url
-        model.is_active = user.is_active
-        model.is_admin = user.is_admin
-        model.last_login = user.last_login
-
-        await self._session.flush()
-        await self._session.refresh(model)
         return user_from_model(model)
 
     async def delete_user(self, user_id: UUID) -> bool:
-        """Delete user by ID."""
-        stmt = select(UserModel).where(UserModel.id == user_id)
-        result = await self._session.execute(stmt)
-        model = result.scalar_one_or_none()
-        if model is None:
-            return False
+        """Delete user by ID.
 
-        await self._session.delete(model)
-        await self._session.flush()
-        return True
+        Stats and sessions are removed by the ``ON DELETE CASCADE`` foreign keys.
+        The deleted user is evicted from the identity map so ``get_user`` can't
+        return it afterwards.
+        """
+        stmt = delete(UserModel).where(UserModel.id == user_id).execution_options(synchronize_session="evaluate")
+        result = await self._session.execute(stmt)
+        return result.rowcount > 0
 
     # === Session Operations ===
 
@@ -110,56 +159,96 @@ class AuthDatabaseStorage:
         model = session_to_model(session)
         self._session.add(model)
         await self._session.flush()
-        await self._session.refresh(model)
+        # No refresh: the instance already holds what was written, client details included
         return session_from_model(model)
 
     async def get_session(self, session_token: str) -> Session | None:
         """Get session by token."""
-        stmt = select(SessionModel).where(SessionModel.session_token == session_token)
+        stmt = lambda_stmt(lambda: select(SessionModel).where(SessionModel.session_token == session_token))
         result = await self._session.execute(stmt)
         model = result.scalar_one_or_none()
         return session_from_model(model) if model else None
 
+    async def get_sessions(self, session_tokens: Sequence[str]) -> dict[str, Session]:
+        """Get several sessions by token in one query.
+
+        Args:
+            session_tokens: Tokens of the sessions to load.
+
+        Returns:
+            Sessions keyed by token; unknown tokens are left out.
+        """
+        stmt = select(SessionModel).where(SessionModel.session_token.in_(session_tokens))
+        result = await self._session.execute(stmt)
+        return {model.session_token: session_from_model(model) for model in result.scalars()}
+
     async def delete_session(self, session_token: str) -> bool:
         """Delete session by token."""
-        stmt = select(SessionModel).where(SessionModel.session_token == session_token)
+        stmt = (
+            delete(SessionModel)
+            .where(SessionModel.session_token == session_token)
+            .execution_options(synchronize_session=False)
+        )
         result = await self._session.execute(stmt)
-        model = result.scalar_one_or_none()
-        if model is None:
-            return False
+        return result.rowcount > 0
 
-        await self._session.delete(model)
-        await self._session.flush()
-        return True
+    async def delete_expired_sessions(self, batch_size: int | None = None) -> int:
+        """Delete expired sessions.
 
-    async def delete_expired_sessions(self) -> int:
-        """Delete all expired sessions.
+        Args:
+            batch_size: Delete at most this many sessions, so a large backlog can be
+                cleared in short transactions. Deletes all expired sessions if None.
 
         Returns:
             Number of sessions deleted.
         """
-        now = datetime.now(UTC)
-        stmt = delete(SessionModel).where(SessionModel.expires_at < now)
+        # The database clock decides expiry, so every worker agrees on it
+        # Counting RETURNING rows doesn't depend on the driver reporting rowcount
+        if batch_size is None:
+            stmt = lambda_stmt(
+                lambda: delete(SessionModel).where(SessionModel.expires_at < func.now()).returning(SessionModel.id)
+            )
+        else:
+            expired_ids = select(SessionModel.id).where(SessionModel.expires_at < func.now()).limit(batch_size)
+            stmt = (
+                delete(SessionModel)
+                .where(SessionModel.id.in_(expired_ids.scalar_subquery()))
+                .returning(SessionModel.id)
+            )
         result = await self._session.execute(stmt)
-        await self._session.flush()
-        return result.rowcount
+        return len(result.all())
 
-    async def get_user_sessions(self, user_id: UUID) -> list[Session]:
-        """Get all sessions for a user."""
-        stmt = select(SessionModel).where(SessionModel.user_id == user_id)
-        result = await self._session.execute(stmt)
-        models = result.scalars().all()
-        return [session_from_model(m) for m in models]
+    async def iter_user_sessions(self, user_id: UUID) -> AsyncIterator[Session]:
+        """Iterate over all sessions for a user, including their client details.
+
+        Rows are streamed in batches rather than loaded all at once, so memory
+        stays flat for users with many sessions.
+
+        Args:
+            user_id: ID of the user whose sessions to load.
+
+        Yields:
+            The user's sessions.
+        """
+        stmt = (
+            select(SessionModel)
+            .where(SessionModel.user_id == user_id)
+            .options(undefer(SessionModel.ip_address), undefer(SessionModel.user_agent))
+            .execution_options(yield_per=100)
+        )
+        result = await self._session.stream_scalars(stmt)
+        async for model in result:
+            yield session_from_model(model)
 
     # === Stats Operations ===
 
     async def create_stats(self, stats: UserStats) -> UserStats:
-        """Create stats for a user."""
-        model = stats_to_model(stats)
-        self._session.add(model)
-        await self._session.flush()
-        await self._session.refresh(model)
-        return stats_from_model(model)
+        """Create stats for a user.
+
+        Same upsert as :meth:`update_stats`, so creating stats that already
+        exist overwrites them instead of failing.
+        """
+        return await self.update_stats(stats)
 
     async def get_stats(self, user_id: UUID) -> UserStats | None:
         """Get stats for a user."""
@@ -169,31 +258,54 @@ class AuthDatabaseStorage:
         return stats_from_model(model) if model else None
 
     async def update_stats(self, stats: UserStats) -> UserStats:
-        """Update user stats."""
-        stmt = select(UserStatsModel).where(UserStatsModel.user_id == stats.user_id)
-        result = await self._session.execute(stmt)
-        model = result.scalar_one_or_none()
-        if model is None:
-            # Create if doesn't exist
-            return await self.create_stats(stats)
-
-        model.games_played = stats.games_played
-        model.games_won = stats.games_won
-        model.total_score = stats.total_score
-        model.correct_guesses = stats.correct_guesses
-        model.total_guesses = stats.total_guesses
-        model.total_guess_time_ms = stats.total_guess_time_ms
-        model.fastest_guess_ms = stats.fastest_guess_ms
-        model.drawings_completed = stats.drawings_completed
-        model.drawings_guessed = stats.drawings_guessed
-        model.best_game_score = stats.best_game_score
-        model.current_win_streak = stats.current_win_streak
-        model.best_win_streak = stats.best_win_streak
-        model.updated_at = datetime.now(UTC)
+        """Create or update user stats in a single round trip.
 
-        await self._session.flush()
-        await self._session.refresh(model)
-        return stats_from_model(model)
+        On PostgreSQL and SQLite this is an ``INSERT ... ON CONFLICT (user_id) DO
+        UPDATE``, which also avoids two concurrent first writes racing to create
+        the row. Other databases update and fall back to an insert.
+        """
+        values = {
+            "games_played": stats.games_played,
+            "games_won": stats.games_won,
+            "total_score": stats.total_score,
+            "correct_guesses": stats.correct_guesses,
+            "total_guesses": stats.total_guesses,
+            "total_guess_time_ms": stats.total_guess_time_ms,
+            "fastest_guess_ms": stats.fastest_guess_ms,
+            "drawings_completed": stats.drawings_completed,
+            "drawings_guessed": stats.drawings_guessed,
+            "best_game_score": stats.best_game_score,
+            "current_win_streak": stats.current_win_streak,
+            "best_win_streak": stats.best_win_streak,
+            "updated_at": func.now(),
+        }
+
+        insert = _UPSERT_INSERTS.get(self._session.get_bind().dialect.name)
+        if insert is None:
+            stmt = (
+                update(UserStatsModel)
+                .where(UserStatsModel.user_id == stats.user_id)
+                .values(**values)
+                .returning(UserStatsModel)
+                .execution_options(populate_existing=True)
+            )
+            model = (await self._session.execute(stmt)).scalar_one_or_none()
+            if model is None:
+                model = UserStatsModel(user_id=stats.user_id, **values)
+                self._session.add(model)
+                await self._session.flush()
+                # updated_at was set by the database, so read it back
+                await self._session.refresh(model)
+            return stats_from_model(model)
+
+        stmt = insert(UserStatsModel).values(user_id=stats.user_id, **values)
+        stmt = (
+            stmt.on_conflict_do_update(index_elements=[UserStatsModel.user_id], set_=values)
+            .returning(UserStatsModel)
+            .execution_options(populate_existing=True)
+        )
+        result = await self._session.execute(stmt)
+        return stats_from_model(result.scalar_one())
 
     async def get_leaderboard(
         self,
@@ -209,29 +321,66 @@ class AuthDatabaseStorage:
         Returns:
             List of (User, UserStats) tuples sorted by category.
         """
-        # Build order clause based on category
-        if category == "wins":
-            order_by = UserStatsModel.games_won.desc()
-        elif category == "fastest":
-            order_by = UserStatsModel.fastest_guess_ms.asc().nullslast()
+        entries, _ = await self.get_leaderboard_page(category, limit)
+        return entries
+
+    async def get_leaderboard_page(
+        self,
+        category: str = "wins",
+        limit: int = 10,
+        after: LeaderboardCursor | None = None,
+    ) -> tuple[list[tuple[User, UserStats]], LeaderboardCursor | None]:
+        """Get one page of leaderboard entries using keyset pagination.
+
+        Each page continues from the previous page's last row instead of using
+        an OFFSET, so later pages cost the same as the first.
+
+        Args:
+            category: Leaderboard category (wins, fastest, drawer, games).
+            limit: Maximum entries to return.
+            after: Cursor returned with the previous page, or None for the first page.
+
+        Returns:
+            The entries sorted by category, and the cursor for the next page
+            (None when this page is empty).
+        """
+        # Only include users who have played
+        conditions = [UserStatsModel.games_played > 0]
+
+        # Pick the sort key based on category; user_id breaks ties so pages are stable
+        descending = True
+        if category == "fastest":
+            sort_key = UserStatsModel.fastest_guess_ms
+            descending = False
+            conditions.append(sort_key.is_not(None))
         elif category == "drawer":
-            # Calculate success rate - need to handle division
-            order_by = (UserStatsModel.drawings_guessed * 100 / UserStatsModel.drawings_completed).desc().nullslast()
+            # Rank by the stored success rate; users who never drew have none
+            sort_key = UserStatsModel.drawer_success_pct
+            conditions.append(sort_key.is_not(None))
         elif category == "games":
-            order_by = UserStatsModel.games_played.desc()
+            sort_key = UserStatsModel.games_played
         else:
-            order_by = UserStatsModel.games_won.desc()
+            sort_key = UserStatsModel.games_won
 
-        # Join users and stats
+        if descending:
+            order_by = (sort_key.desc(), UserStatsModel.user_id.desc())
+            if after is not None:
+                conditions.append(tuple_(sort_key, UserStatsModel.user_id) < after)
+        else:
+            order_by = (sort_key.asc(), UserStatsModel.user_id.asc())
+            if after is not None:
+                conditions.append(tuple_(sort_key, UserStatsModel.user_id) > after)
+
+        # Join users and stats, selecting plain columns since rows are display-only
         stmt = (
-            select(UserModel, UserStatsModel)
+            select(*LEADERBOARD_COLUMNS, sort_key.label("sort_key"))
             .join(UserStatsModel, UserModel.id == UserStatsModel.user_id)
-            .where(UserStatsModel.games_played > 0)  # Only include users who have played
-            .order_by(order_by)
+            .where(*conditions)
+            .order_by(*order_by)
             .limit(limit)
         )
 
         result = await self._session.execute(stmt)
-        rows = result.all()
-
-        return [(user_from_model(user), stats_from_model(stats)) for user, stats in rows]
+        rows = result.mappings().all()
+        cursor = (rows[-1]["sort_key"], rows[-1]["user_id"]) if rows else None
+        return [leaderboard_entry_from_row(row) for row in rows], cursor
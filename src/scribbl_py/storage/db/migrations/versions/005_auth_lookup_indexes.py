@@ -0,0 +1,60 @@
+"""Index auth tables for their lookup patterns.
+
+Revision ID: 005_auth_indexes
+Revises: 004_layer_state
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import sqlalchemy as sa
+from alembic import op
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+# revision identifiers, used by Alembic.
+revision: str = "005_auth_indexes"
+down_revision: str | None = "004_layer_state"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def _check_duplicate_oauth_identities() -> None:
+    """Fail with a clear message if any OAuth identity belongs to more than one user."""
+    duplicates = (
+        op.get_bind()
+        .execute(
+            sa.text(
+                "SELECT oauth_provider, oauth_id, COUNT(*) FROM users "
+                "WHERE oauth_id IS NOT NULL "
+                "GROUP BY oauth_provider, oauth_id HAVING COUNT(*) > 1"
+            )
+        )
+        .all()
+    )
+    if duplicates:
+        listed = ", ".join(f"{provider}:{oauth_id} ({count} users)" for provider, oauth_id, count in duplicates[:10])
+        msg = (
+            f"Cannot make ix_users_oauth unique: {len(duplicates)} OAuth identities are shared by "
+            f"several users ({listed}). Merge or delete the duplicate users and run the migration again."
+        )
+        raise RuntimeError(msg)
+
+
+def upgrade() -> None:
+    """Replace the oauth_id index with a unique provider/id index and index session expiry."""
+    _check_duplicate_oauth_identities()
+    op.drop_index("ix_users_oauth_id", "users")
+    op.create_index("ix_users_oauth", "users", ["oauth_provider", "oauth_id"], unique=True)
+    op.create_index("ix_sessions_expires_at", "sessions", ["expires_at"])
+
+
+def downgrade() -> None:
+    """Restore the single-column oauth_id index."""
+    op.drop_index("ix_sessions_expires_at", "sessions")
+    op.drop_index("ix_users_oauth", "users")
+    op.create_index("ix_users_oauth_id", "users", ["oauth_id"])
@@ -0,0 +1,53 @@
+"""Add partial indexes for each leaderboard ordering.
+
+Revision ID: 006_leaderboard_indexes
+Revises: 005_auth_indexes
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import sqlalchemy as sa
+from alembic import op
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+# revision identifiers, used by Alembic.
+revision: str = "006_leaderboard_indexes"
+down_revision: str | None = "005_auth_indexes"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+_PLAYED = "games_played > 0"
+_DREW = "games_played > 0 AND drawings_completed > 0"
+
+# (index name, indexed expression, partial index predicate)
+_LEADERBOARD_INDEXES = (
+    ("ix_user_stats_wins", "games_won DESC", _PLAYED),
+    ("ix_user_stats_games", "games_played DESC", _PLAYED),
+    ("ix_user_stats_fastest", "fastest_guess_ms", _PLAYED),
+    ("ix_user_stats_drawer", "(drawings_guessed * 100 / drawings_completed) DESC", _DREW),
+)
+
+
+def upgrade() -> None:
+    """Create one partial index per leaderboard category."""
+    for name, expression, where in _LEADERBOARD_INDEXES:
+        op.create_index(
+            name,
+            "user_stats",
+            [sa.text(expression)],
+            postgresql_where=sa.text(where),
+            postgresql_include=["user_id"],
+            sqlite_where=sa.text(where),
+        )
+
+
+def downgrade() -> None:
+    """Drop the leaderboard indexes."""
+    for name, _, _ in reversed(_LEADERBOARD_INDEXES):
+        op.drop_index(name, "user_stats")
@@ -0,0 +1,62 @@
+"""Make the OAuth identity index unique.
+
+005_auth_indexes now creates the index unique, so this only rebuilds it on
+databases that ran the earlier, non-unique version of 005.
+
+Revision ID: 007_unique_oauth
+Revises: 006_leaderboard_indexes
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import sqlalchemy as sa
+from alembic import op
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+# revision identifiers, used by Alembic.
+revision: str = "007_unique_oauth"
+down_revision: str | None = "006_leaderboard_indexes"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def _check_duplicate_oauth_identities() -> None:
+    """Fail with a clear message if any OAuth identity belongs to more than one user."""
+    duplicates = (
+        op.get_bind()
+        .execute(
+            sa.text(
+                "SELECT oauth_provider, oauth_id, COUNT(*) FROM users "
+                "WHERE oauth_id IS NOT NULL "
+                "GROUP BY oauth_provider, oauth_id HAVING COUNT(*) > 1"
+            )
+        )
+        .all()
+    )
+    if duplicates:
+        listed = ", ".join(f"{provider}:{oauth_id} ({count} users)" for provider, oauth_id, count in duplicates[:10])
+        msg = (
+            f"Cannot make ix_users_oauth unique: {len(duplicates)} OAuth identities are shared by "
+            f"several users ({listed}). Merge or delete the duplicate users and run the migration again."
+        )
+        raise RuntimeError(msg)
+
+
+def upgrade() -> None:
+    """Recreate the provider/id index as unique unless it already is."""
+    indexes = sa.inspect(op.get_bind()).get_indexes("users")
+    if any(index["name"] == "ix_users_oauth" and index["unique"] for index in indexes):
+        return
+    _check_duplicate_oauth_identities()
+    op.drop_index("ix_users_oauth", "users")
+    op.create_index("ix_users_oauth", "users", ["oauth_provider", "oauth_id"], unique=True)
+
+
+def downgrade() -> None:
+    """Leave the index unique; 005_auth_indexes owns it and drops it on its own downgrade."""
@@ -0,0 +1,62 @@
+"""Store the drawer success rate as an indexed generated column.
+
+Revision ID: 008_drawer_success_pct
+Revises: 007_unique_oauth
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import sqlalchemy as sa
+from alembic import op
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+# revision identifiers, used by Alembic.
+revision: str = "008_drawer_success_pct"
+down_revision: str | None = "007_unique_oauth"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+_DRAWER_SUCCESS_PCT_SQL = (
+    "CASE WHEN drawings_completed > 0 THEN drawings_guessed * 100.0 / drawings_completed ELSE NULL END"
+)
+_DRAWER_WHERE = "games_played > 0 AND drawer_success_pct IS NOT NULL"
+
+
+def upgrade() -> None:
+    """Add drawer_success_pct and index it in place of the expression index."""
+    # SQLite can only add virtual generated columns to an existing table; both can be indexed
+    persisted = op.get_bind().dialect.name != "sqlite"
+    op.add_column(
+        "user_stats",
+        sa.Column("drawer_success_pct", sa.Float(), sa.Computed(_DRAWER_SUCCESS_PCT_SQL, persisted=persisted)),
+    )
+    op.drop_index("ix_user_stats_drawer", "user_stats")
+    op.create_index(
+        "ix_user_stats_drawer_pct",
+        "user_stats",
+        [sa.text("drawer_success_pct DESC")],
+        postgresql_where=sa.text(_DRAWER_WHERE),
+        postgresql_include=["user_id"],
+        sqlite_where=sa.text(_DRAWER_WHERE),
+    )
+
+
+def downgrade() -> None:
+    """Restore the expression index and drop the generated column."""
+    op.drop_index("ix_user_stats_drawer_pct", "user_stats")
+    where = "games_played > 0 AND drawings_completed > 0"
+    op.create_index(
+        "ix_user_stats_drawer",
+        "user_stats",
+        [sa.text("(drawings_guessed * 100 / drawings_completed) DESC")],
+        postgresql_where=sa.text(where),
+        postgresql_include=["user_id"],
+        sqlite_where=sa.text(where),
+    )
+    op.drop_column("user_stats", "drawer_success_pct")
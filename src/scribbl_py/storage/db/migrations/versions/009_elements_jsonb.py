@@ -0,0 +1,54 @@
+"""Store element JSON as JSONB on PostgreSQL.
+
+Revision ID: 009_elements_jsonb
+Revises: 008_drawer_success_pct
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+# revision identifiers, used by Alembic.
+revision: str = "009_elements_jsonb"
+down_revision: str | None = "008_drawer_success_pct"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+_COLUMNS = ("style_data", "element_data")
+
+
+def upgrade() -> None:
+    """Convert the element JSON columns to JSONB; other databases keep JSON."""
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    for column in _COLUMNS:
+        op.alter_column(
+            "elements",
+            column,
+            type_=postgresql.JSONB(),
+            existing_type=sa.JSON(),
+            postgresql_using=f"{column}::jsonb",
+        )
+
+
+def downgrade() -> None:
+    """Convert the element JSON columns back to JSON."""
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    for column in _COLUMNS:
+        op.alter_column(
+            "elements",
+            column,
+            type_=sa.JSON(),
+            existing_type=postgresql.JSONB(),
+            postgresql_using=f"{column}::json",
+        )
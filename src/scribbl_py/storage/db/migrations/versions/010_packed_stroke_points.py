@@ -0,0 +1,64 @@
+"""Add a packed binary column for stroke points.
+
+Revision ID: 010_packed_points
+Revises: 009_elements_jsonb
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+
+from __future__ import annotations
+
+import math
+import sys
+from array import array
+from typing import TYPE_CHECKING
+
+import sqlalchemy as sa
+from alembic import op
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+# revision identifiers, used by Alembic.
+revision: str = "010_packed_points"
+down_revision: str | None = "009_elements_jsonb"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add point_data; existing strokes keep reading their points from element_data."""
+    op.add_column("elements", sa.Column("point_data", sa.LargeBinary(), nullable=True))
+
+
+def downgrade() -> None:
+    """Move packed points back into element_data, then drop point_data."""
+    bind = op.get_bind()
+    elements = sa.table(
+        "elements",
+        sa.column("id"),
+        sa.column("element_data", sa.JSON()),
+        sa.column("point_data", sa.LargeBinary()),
+    )
+    rows = bind.execute(
+        sa.select(elements.c.id, elements.c.element_data, elements.c.point_data).where(
+            elements.c.point_data.is_not(None)
+        )
+    ).all()
+    for row in rows:
+        values = array("d")
+        values.frombytes(row.point_data)
+        if sys.byteorder == "big":
+            values.byteswap()
+        it = iter(values)
+        points = [
+            {"x": x, "y": y, "pressure": p, "timestamp": None if math.isnan(t) else t}
+            for x, y, p, t in zip(it, it, it, it, strict=True)
+        ]
+        bind.execute(
+            elements.update()
+            .where(elements.c.id == row.id)
+            .values(element_data={**(row.element_data or {}), "points": points})
+        )
+
+    op.drop_column("elements", "point_data")
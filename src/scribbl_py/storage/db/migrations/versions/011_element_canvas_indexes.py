@@ -0,0 +1,38 @@
+"""Replace the single-column element indexes with per-canvas composites.
+
+Revision ID: 011_element_canvas_indexes
+Revises: 010_packed_points
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from alembic import op
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+# revision identifiers, used by Alembic.
+revision: str = "011_element_canvas_indexes"
+down_revision: str | None = "010_packed_points"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Index elements by (canvas_id, created_at) and (canvas_id, z_index)."""
+    op.create_index("ix_elements_canvas_created", "elements", ["canvas_id", "created_at"])
+    op.create_index("ix_elements_canvas_zindex", "elements", ["canvas_id", "z_index"])
+    op.drop_index("ix_elements_canvas_id", "elements")
+    op.drop_index("ix_elements_z_index", "elements")
+
+
+def downgrade() -> None:
+    """Restore the single-column canvas_id and z_index indexes."""
+    op.create_index("ix_elements_z_index", "elements", ["z_index"])
+    op.create_index("ix_elements_canvas_id", "elements", ["canvas_id"])
+    op.drop_index("ix_elements_canvas_zindex", "elements")
+    op.drop_index("ix_elements_canvas_created", "elements")
@@ -0,0 +1,65 @@
+"""Add user_id as a key column of the leaderboard indexes.
+
+Leaderboard pages sort by ``(sort_key, user_id)`` and continue from a
+``(sort_key, user_id)`` row comparison, so user_id has to be part of the index
+key rather than an INCLUDE column for the index to serve both.
+
+Revision ID: 012_leaderboard_keyset
+Revises: 011_element_canvas_indexes
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import sqlalchemy as sa
+from alembic import op
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+# revision identifiers, used by Alembic.
+revision: str = "012_leaderboard_keyset"
+down_revision: str | None = "011_element_canvas_indexes"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+_PLAYED = "games_played > 0"
+_DREW = "games_played > 0 AND drawer_success_pct IS NOT NULL"
+
+# (index name, sort column expression, user_id direction, partial index predicate)
+_LEADERBOARD_INDEXES = (
+    ("ix_user_stats_wins", "games_won DESC", "DESC", _PLAYED),
+    ("ix_user_stats_games", "games_played DESC", "DESC", _PLAYED),
+    ("ix_user_stats_fastest", "fastest_guess_ms", "ASC", _PLAYED),
+    ("ix_user_stats_drawer_pct", "drawer_success_pct DESC", "DESC", _DREW),
+)
+
+
+def upgrade() -> None:
+    """Rebuild the leaderboard indexes keyed on (sort column, user_id)."""
+    for name, expression, user_id_order, where in _LEADERBOARD_INDEXES:
+        op.drop_index(name, "user_stats")
+        op.create_index(
+            name,
+            "user_stats",
+            [sa.text(expression), sa.text(f"user_id {user_id_order}")],
+            postgresql_where=sa.text(where),
+            sqlite_where=sa.text(where),
+        )
+
+
+def downgrade() -> None:
+    """Restore the leaderboard indexes with user_id as an INCLUDE column."""
+    for name, expression, _, where in reversed(_LEADERBOARD_INDEXES):
+        op.drop_index(name, "user_stats")
+        op.create_index(
+            name,
+            "user_stats",
+            [sa.text(expression)],
+            postgresql_where=sa.text(where),
+            postgresql_include=["user_id"],
+            sqlite_where=sa.text(where),
+        )
@@ -2,13 +2,30 @@
 
 from __future__ import annotations
 
-from typing import Any
+import math
+import sys
+from array import array
+from typing import TYPE_CHECKING, Any
 from uuid import UUID
 
 from advanced_alchemy.base import UUIDAuditBase
-from sqlalchemy import JSON, Boolean, Float, ForeignKey, Integer, String
+from sqlalchemy import JSON, Boolean, Float, ForeignKey, Index, Integer, LargeBinary, String
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
+from scribbl_py.core.models import Canvas, Group, Point, Shape, Stroke
+from scribbl_py.core.models import Text as TextElement
+from scribbl_py.core.style import ElementStyle
+from scribbl_py.core.types import ElementType, ShapeType
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from sqlalchemy import Row
+
+# Binary JSONB on PostgreSQL, plain JSON elsewhere
+JSONType = JSON().with_variant(JSONB(), "postgresql")
+
 
 class CanvasModel(UUIDAuditBase):
     """SQLAlchemy model for Canvas entities.
@@ -56,14 +73,21 @@ class ElementModel(UUIDAuditBase):
         z_index: Layer ordering (higher values rendered on top).
         group_id: Parent group ID if this element is grouped.
         style_data: JSON blob for ElementStyle fields.
-        element_data: JSON blob for type-specific data (points, shape_type, content, etc.).
+        element_data: JSON blob for type-specific data (shape_type, content, etc.).
+        point_data: Packed stroke points (see ``pack_points``); None for other types.
         created_at: Creation timestamp (from UUIDAuditBase).
         updated_at: Last update timestamp (from UUIDAuditBase).
     """
 
     __tablename__ = "elements"
+    # Elements are always read per canvas, so canvas_id leads both indexes; these also
+    # serve the foreign key, replacing single-column canvas_id and z_index indexes
+    __table_args__ = (
+        Index("ix_elements_canvas_created", "canvas_id", "created_at"),
+        Index("ix_elements_canvas_zindex", "canvas_id", "z_index"),
+    )
 
-    canvas_id: Mapped[UUID] = mapped_column(ForeignKey("canvases.id", ondelete="CASCADE"), index=True)
+    canvas_id: Mapped[UUID] = mapped_column(ForeignKey("canvases.id", ondelete="CASCADE"))
     element_type: Mapped[str] = mapped_column(String(20), index=True)
 
     # Position fields
@@ -72,24 +96,67 @@ class ElementModel(UUIDAuditBase):
     position_pressure: Mapped[float] = mapped_column(Float, default=1.0)
 
     # Layer ordering and state
-    z_index: Mapped[int] = mapped_column(Integer, default=0, index=True)
+    z_index: Mapped[int] = mapped_column(Integer, default=0)
     group_id: Mapped[UUID | None] = mapped_column(ForeignKey("elements.id", ondelete="SET NULL"), nullable=True)
     visible: Mapped[bool] = mapped_column(Boolean, default=True)
     locked: Mapped[bool] = mapped_column(Boolean, default=False)
 
     # Style stored as JSON for flexibility
-    style_data: Mapped[dict[str, Any]] = mapped_column(JSON, default=dict)
+    style_data: Mapped[dict[str, Any]] = mapped_column(JSONType, default=dict)
 
     # Type-specific data stored as JSON
-    # For Stroke: {"points": [...], "smoothing": 0.5}
+    # For Stroke: {"smoothing": 0.5} (points are in point_data; older rows have "points" here)
     # For Shape: {"shape_type": "rectangle", "width": 100, "height": 75, "rotation": 0}
     # For Text: {"content": "...", "font_size": 16, "font_family": "sans-serif"}
     # For Group: {"name": "...", "children": [...], "locked": false, "collapsed": false}
-    element_data: Mapped[dict[str, Any]] = mapped_column(JSON, default=dict)
+    element_data: Mapped[dict[str, Any]] = mapped_column(JSONType, default=dict)
+
+    # Stroke points packed as little-endian float64 (x, y, pressure, timestamp) quadruples
+    point_data: Mapped[bytes | None] = mapped_column(LargeBinary, nullable=True)
 
     canvas: Mapped[CanvasModel] = relationship("CanvasModel", back_populates="elements")
 
 
+def pack_points(points: list[Any]) -> bytes:
+    """Pack stroke points into bytes for ``ElementModel.point_data``.
+
+    Each point is four little-endian float64 values (x, y, pressure, timestamp),
+    with a missing timestamp stored as NaN.
+
+    Args:
+        points: Domain Point instances.
+
+    Returns:
+        The packed points.
+    """
+    values = array("d")
+    for p in points:
+        values.extend((p.x, p.y, p.pressure, math.nan if p.timestamp is None else p.timestamp))
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values.tobytes()
+
+
+def unpack_points(data: bytes) -> list[Any]:
+    """Unpack stroke points packed by ``pack_points``.
+
+    Args:
+        data: The packed points.
+
+    Returns:
+        Domain Point instances.
+    """
+    values = array("d")
+    values.frombytes(data)
+    if sys.byteorder == "big":
+        values.byteswap()
+    it = iter(values)
+    return [
+        Point(x=x, y=y, pressure=p, timestamp=None if math.isnan(t) else t)
+        for x, y, p, t in zip(it, it, it, it, strict=True)
+    ]
+
+
 def canvas_to_model(canvas: Any) -> CanvasModel:
     """Convert a domain Canvas to a CanvasModel.
 
@@ -120,8 +187,6 @@ def canvas_from_model(model: CanvasModel, include_elements: bool = True) -> Any:
     Returns:
         Domain Canvas dataclass instance.
     """
-    from scribbl_py.core.models import Canvas
-
     elements = []
     if include_elements and model.elements:
         elements = [element_from_model(e) for e in model.elements]
@@ -148,8 +213,6 @@ def element_to_model(element: Any, canvas_id: UUID) -> ElementModel:
     Returns:
         ElementModel instance ready for database insertion.
     """
-    from scribbl_py.core.types import ElementType
-
     # Build style data
     style_data = {
         "stroke_color": element.style.stroke_color,
@@ -160,11 +223,10 @@ def element_to_model(element: Any, canvas_id: UUID) -> ElementModel:
 
     # Build type-specific data
     element_data: dict[str, Any] = {}
+    point_data = None
     if element.element_type == ElementType.STROKE:
-        element_data = {
-            "points": [{"x": p.x, "y": p.y, "pressure": p.pressure, "timestamp": p.timestamp} for p in element.points],
-            "smoothing": element.smoothing,
-        }
+        element_data = {"smoothing": element.smoothing}
+        point_data = pack_points(element.points)
     elif element.element_type == ElementType.SHAPE:
         element_data = {
             "shape_type": element.shape_type.value,
@@ -199,43 +261,42 @@ def element_to_model(element: Any, canvas_id: UUID) -> ElementModel:
         locked=element.locked,
         style_data=style_data,
         element_data=element_data,
+        point_data=point_data,
         created_at=element.created_at,
     )
 
 
-def element_from_model(model: ElementModel) -> Any:
-    """Convert an ElementModel to a domain Element.
-
-    Args:
-        model: SQLAlchemy ElementModel instance.
-
-    Returns:
-        Domain Element (Stroke, Shape, Text, or Group) dataclass instance.
-    """
-    from scribbl_py.core.models import Group, Point, Shape, Stroke
-    from scribbl_py.core.models import Text as TextElement
-    from scribbl_py.core.style import ElementStyle
-    from scribbl_py.core.types import ElementType, ShapeType
-
-    # Reconstruct position
-    position = Point(
-        x=model.position_x,
-        y=model.position_y,
-        pressure=model.position_pressure,
-    )
-
-    # Reconstruct style
-    style = ElementStyle(
-        stroke_color=model.style_data.get("stroke_color", "#000000"),
-        fill_color=model.style_data.get("fill_color"),
-        stroke_width=model.style_data.get("stroke_width", 2.0),
-        opacity=model.style_data.get("opacity", 1.0),
+# Plain dict lookup instead of ShapeType(value), which goes through EnumType.__call__ per row
+_SHAPE_TYPES: dict[str, ShapeType] = {shape_type.value: shape_type for shape_type in ShapeType}
+
+
+# Columns element_from_model reads, for Core selects that skip building ElementModel instances
+ELEMENT_COLUMNS = tuple(
+    ElementModel.__table__.c[name]
+    for name in (
+        "id",
+        "element_type",
+        "position_x",
+        "position_y",
+        "position_pressure",
+        "z_index",
+        "group_id",
+        "visible",
+        "locked",
+        "style_data",
+        "element_data",
+        "point_data",
+        "created_at",
     )
+)
 
-    element_type = ElementType(model.element_type)
-    data = model.element_data
 
-    if element_type == ElementType.STROKE:
+def _stroke_kwargs(model: ElementModel | Row[Any], data: dict[str, Any]) -> dict[str, Any]:
+    """Build the Stroke-specific constructor arguments."""
+    if model.point_data is not None:
+        points = unpack_points(model.point_data)
+    else:
+        # Rows written before point_data existed keep their points in the JSON
         points = [
             Point(
                 x=p["x"],
@@ -245,66 +306,90 @@ def element_from_model(model: ElementModel) -> Any:
             )
             for p in data.get("points", [])
         ]
-        element = Stroke(
-            id=model.id,
-            position=position,
-            style=style,
-            z_index=model.z_index,
-            group_id=model.group_id,
-            visible=model.visible,
-            locked=model.locked,
-            points=points,
-            smoothing=data.get("smoothing", 0.5),
-        )
-        element.created_at = model.created_at
-        return element
-
-    if element_type == ElementType.SHAPE:
-        element = Shape(
-            id=model.id,
-            position=position,
-            style=style,
-            z_index=model.z_index,
-            group_id=model.group_id,
-            visible=model.visible,
-            locked=model.locked,
-            shape_type=ShapeType(data.get("shape_type", "rectangle")),
-            width=data.get("width", 0.0),
-            height=data.get("height", 0.0),
-            rotation=data.get("rotation", 0.0),
-        )
-        element.created_at = model.created_at
-        return element
-
-    if element_type == ElementType.TEXT:
-        element = TextElement(
-            id=model.id,
-            position=position,
-            style=style,
-            z_index=model.z_index,
-            group_id=model.group_id,
-            visible=model.visible,
-            locked=model.locked,
-            content=data.get("content", ""),
-            font_size=data.get("font_size", 16),
-            font_family=data.get("font_family", "sans-serif"),
-        )
-        element.created_at = model.created_at
-        return element
-
-    # ElementType.GROUP
-    children = [UUID(child_id) for child_id in data.get("children", [])]
-    element = Group(
+    return {"points": points, "smoothing": data.get("smoothing", 0.5)}
+
+
+def _shape_kwargs(model: ElementModel | Row[Any], data: dict[str, Any]) -> dict[str, Any]:
+    """Build the Shape-specific constructor arguments.
+
+    Raises:
+        ValueError: If the stored shape type is unknown.
+    """
+    stored_type = data.get("shape_type", "rectangle")
+    try:
+        shape_type = _SHAPE_TYPES[stored_type]
+    except KeyError:
+        msg = f"{stored_type!r} is not a valid ShapeType"
+        raise ValueError(msg) from None
+    return {
+        "shape_type": shape_type,
+        "width": data.get("width", 0.0),
+        "height": data.get("height", 0.0),
+        "rotation": data.get("rotation", 0.0),
+    }
+
+
+def _text_kwargs(model: ElementModel | Row[Any], data: dict[str, Any]) -> dict[str, Any]:
+    """Build the Text-specific constructor arguments."""
+    return {
+        "content": data.get("content", ""),
+        "font_size": data.get("font_size", 16),
+        "font_family": data.get("font_family", "sans-serif"),
+    }
+
+
+def _group_kwargs(model: ElementModel | Row[Any], data: dict[str, Any]) -> dict[str, Any]:
+    """Build the Group-specific constructor arguments."""
+    return {
+        "name": data.get("name", ""),
+        "children": [UUID(child_id) for child_id in data.get("children", [])],
+        "collapsed": data.get("collapsed", False),
+    }
+
+
+# element_type column value -> (domain class, type-specific argument builder).
+# ElementType is a StrEnum, so the raw column string looks these up directly.
+_ELEMENT_DECODERS: dict[str, tuple[type, Callable[[ElementModel | Row[Any], dict[str, Any]], dict[str, Any]]]] = {
+    ElementType.STROKE: (Stroke, _stroke_kwargs),
+    ElementType.SHAPE: (Shape, _shape_kwargs),
+    ElementType.TEXT: (TextElement, _text_kwargs),
+    ElementType.GROUP: (Group, _group_kwargs),
+}
+
+
+def element_from_model(model: ElementModel | Row[Any]) -> Any:
+    """Convert an ElementModel to a domain Element.
+
+    Args:
+        model: SQLAlchemy ElementModel instance, or a Core row selecting the
+            same columns (see ``ELEMENT_COLUMNS``).
+
+    Returns:
+        Domain Element (Stroke, Shape, Text, or Group) dataclass instance.
+
+    Raises:
+        ValueError: If the element type is unknown.
+    """
+    try:
+        element_cls, build_kwargs = _ELEMENT_DECODERS[model.element_type]
+    except KeyError:
+        msg = f"{model.element_type!r} is not a valid ElementType"
+        raise ValueError(msg) from None
+
+    style_data = model.style_data
+    return element_cls(
         id=model.id,
-        position=position,
-        style=style,
+        position=Point(x=model.position_x, y=model.position_y, pressure=model.position_pressure),
+        style=ElementStyle(
+            stroke_color=style_data.get("stroke_color", "#000000"),
+            fill_color=style_data.get("fill_color"),
+            stroke_width=style_data.get("stroke_width", 2.0),
+            opacity=style_data.get("opacity", 1.0),
+        ),
         z_index=model.z_index,
         group_id=model.group_id,
         visible=model.visible,
         locked=model.locked,
-        name=data.get("name", ""),
-        children=children,
-        collapsed=data.get("collapsed", False),
+        created_at=model.created_at,
+        **build_kwargs(model, model.element_data),
     )
-    element.created_at = model.created_at
-    return element
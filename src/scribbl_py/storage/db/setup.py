@@ -6,8 +6,9 @@ import os
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
+import msgspec
 from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
@@ -15,6 +16,28 @@ if TYPE_CHECKING:
     from sqlalchemy.ext.asyncio import AsyncEngine
 
 
+_json_encoder = msgspec.json.Encoder()
+
+# Applied to every new SQLite connection. WAL lets readers run alongside the single
+# writer and, with synchronous=NORMAL, fsyncs at checkpoints rather than every commit
+# (a power loss can drop the last transactions but won't corrupt the file).
+# busy_timeout makes a second writer wait for the lock instead of failing at once.
+_SQLITE_PRAGMAS = (
+    "foreign_keys=ON",
+    "journal_mode=WAL",
+    "synchronous=NORMAL",
+    "temp_store=MEMORY",
+    "mmap_size=67108864",
+    "cache_size=-65536",
+    "busy_timeout=5000",
+)
+
+
+def _json_serializer(obj: Any) -> str:
+    """Serialize JSON column values with msgspec instead of the stdlib json module."""
+    return _json_encoder.encode(obj).decode()
+
+
 def get_database_url() -> str:
     """Get database URL from environment or default to SQLite.
 
@@ -62,22 +85,40 @@ def create_database_engine(url: str | None = None) -> AsyncEngine:
 
     # SQLite-specific settings
     connect_args = {}
+    pool_args: dict[str, Any] = {}
     if "sqlite" in database_url:
         connect_args["check_same_thread"] = False
+    else:
+        # Size the pool for concurrent requests so sessions don't queue on connection checkout
+        pool_args = {
+            "pool_size": int(os.environ.get("DATABASE_POOL_SIZE", "20")),
+            "max_overflow": int(os.environ.get("DATABASE_MAX_OVERFLOW", "40")),
+            "pool_recycle": int(os.environ.get("DATABASE_POOL_RECYCLE", "3600")),
+            # The liveness check costs a round trip per checkout; deployments with a
+            # stable database and pool_recycle below its idle timeout can turn it off
+            "pool_pre_ping": os.environ.get("DATABASE_POOL_PRE_PING", "true").lower() != "false",
+        }
 
     engine = create_async_engine(
         database_url,
         echo=os.environ.get("DATABASE_ECHO", "").lower() == "true",
         connect_args=connect_args,
+        # Element JSON (stroke points) is the bulk of what's read and written
+        json_serializer=_json_serializer,
+        json_deserializer=msgspec.json.decode,
+        # Room for every distinct statement the storage layers issue, so none get evicted
+        query_cache_size=1200,
+        **pool_args,
     )
 
-    # Enable foreign keys for SQLite
+    # Enable foreign keys for SQLite and tune it for concurrent web traffic
     if "sqlite" in database_url:
 
         @event.listens_for(engine.sync_engine, "connect")
         def set_sqlite_pragma(dbapi_connection, connection_record):
             cursor = dbapi_connection.cursor()
-            cursor.execute("PRAGMA foreign_keys=ON")
+            for pragma in _SQLITE_PRAGMAS:
+                cursor.execute(f"PRAGMA {pragma}")
             cursor.close()
 
     return engine
@@ -135,6 +176,9 @@ class DatabaseManager:
 
         Args:
             url: Database URL. If None, uses environment variable or SQLite default.
+
+        Pool sizing for server databases can be tuned with ``DATABASE_POOL_SIZE``,
+        ``DATABASE_MAX_OVERFLOW`` and ``DATABASE_POOL_RECYCLE``.
         """
         self._url = url
         self._engine: AsyncEngine | None = None
@@ -161,6 +205,11 @@ class DatabaseManager:
             raise RuntimeError(msg)
         return self._engine
 
+    @property
+    def pool_status(self) -> str:
+        """Get a summary of the connection pool's checked-in and checked-out connections."""
+        return self.engine.pool.status()
+
     @asynccontextmanager
     async def session(self) -> AsyncGenerator[AsyncSession, None]:
         """Get a database session context manager.
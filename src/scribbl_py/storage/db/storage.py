@@ -5,10 +5,12 @@ from __future__ import annotations
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import select
+from sqlalchemy import delete, exists, select, update
+from sqlalchemy.orm import raiseload, selectinload
 
 from scribbl_py.core.exceptions import CanvasNotFoundError, ElementNotFoundError
 from scribbl_py.storage.db.models import (
+    ELEMENT_COLUMNS,
     CanvasModel,
     ElementModel,
     canvas_from_model,
@@ -18,6 +20,7 @@ from scribbl_py.storage.db.models import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
     from uuid import UUID
 
     from sqlalchemy.ext.asyncio import AsyncSession
@@ -31,6 +34,11 @@ class DatabaseStorage:
     This storage backend persists canvases and elements to a relational database
     using SQLAlchemy's async session. It implements the StorageProtocol interface.
 
+    ``get_canvas`` loads a canvas's elements with one extra SELECT, while
+    ``list_canvases`` returns canvases without elements. Callers that need the
+    elements of many canvases should use ``list_canvases_with_elements`` rather
+    than calling ``get_canvas`` per canvas.
+
     Attributes:
         _session: SQLAlchemy async session for database operations.
     """
@@ -54,8 +62,8 @@ class DatabaseStorage:
         """
         model = canvas_to_model(canvas)
         self._session.add(model)
+        # The INSERT fills in column defaults; a refresh would also selectin-load the (empty) elements
         await self._session.flush()
-        await self._session.refresh(model)
         return canvas_from_model(model, include_elements=False)
 
     async def get_canvas(self, canvas_id: UUID) -> Canvas | None:
@@ -67,6 +75,7 @@ class DatabaseStorage:
         Returns:
             The canvas if found, None otherwise.
         """
+        # Not session.get(): an identity-map hit would miss elements added since the canvas was loaded
         stmt = select(CanvasModel).where(CanvasModel.id == canvas_id)
         result = await self._session.execute(stmt)
         model = result.scalar_one_or_none()
@@ -80,11 +89,26 @@ class DatabaseStorage:
         Returns:
             A list of all canvases, ordered by creation date (newest first).
         """
-        stmt = select(CanvasModel).order_by(CanvasModel.created_at.desc())
+        # Elements aren't returned here, so skip the selectin load of every canvas's elements
+        stmt = select(CanvasModel).options(raiseload(CanvasModel.elements)).order_by(CanvasModel.created_at.desc())
         result = await self._session.execute(stmt)
         models = result.scalars().all()
         return [canvas_from_model(m, include_elements=False) for m in models]
 
+    async def list_canvases_with_elements(self) -> list[Canvas]:
+        """List all canvases in the database together with their elements.
+
+        All elements are fetched in a single ``WHERE canvas_id IN (...)`` query
+        instead of one query per canvas.
+
+        Returns:
+            A list of all canvases with elements, ordered by creation date (newest first).
+        """
+        stmt = select(CanvasModel).options(selectinload(CanvasModel.elements)).order_by(CanvasModel.created_at.desc())
+        result = await self._session.execute(stmt)
+        models = result.scalars().all()
+        return [canvas_from_model(m) for m in models]
+
     async def update_canvas(self, canvas: Canvas) -> Canvas:
         """Update an existing canvas in the database.
 
@@ -97,9 +121,7 @@ class DatabaseStorage:
         Raises:
             CanvasNotFoundError: If the canvas does not exist.
         """
-        stmt = select(CanvasModel).where(CanvasModel.id == canvas.id)
-        result = await self._session.execute(stmt)
-        model = result.scalar_one_or_none()
+        model = await self._session.get(CanvasModel, canvas.id)
         if model is None:
             raise CanvasNotFoundError(str(canvas.id))
 
@@ -110,7 +132,8 @@ class DatabaseStorage:
         model.updated_at = datetime.now(UTC)
 
         await self._session.flush()
-        await self._session.refresh(model)
+        # Column values are all set client-side; only the elements may have changed under the session
+        await self._session.refresh(model, attribute_names=["elements"])
         return canvas_from_model(model)
 
     async def delete_canvas(self, canvas_id: UUID) -> bool:
@@ -122,15 +145,12 @@ class DatabaseStorage:
         Returns:
             True if the canvas was deleted, False if it did not exist.
         """
-        stmt = select(CanvasModel).where(CanvasModel.id == canvas_id)
+        # Delete the elements through the ORM first so the session forgets them too;
+        # the ON DELETE CASCADE alone would leave them in the identity map for get_element()
+        await self._session.execute(delete(ElementModel).where(ElementModel.canvas_id == canvas_id))
+        stmt = delete(CanvasModel).where(CanvasModel.id == canvas_id)
         result = await self._session.execute(stmt)
-        model = result.scalar_one_or_none()
-        if model is None:
-            return False
-
-        await self._session.delete(model)
-        await self._session.flush()
-        return True
+        return result.rowcount > 0
 
     async def add_element(self, canvas_id: UUID, element: Element) -> Element:
         """Add an element to a canvas.
@@ -145,23 +165,13 @@ class DatabaseStorage:
         Raises:
             CanvasNotFoundError: If the canvas does not exist.
         """
-        # Verify canvas exists
-        stmt = select(CanvasModel.id).where(CanvasModel.id == canvas_id)
-        result = await self._session.execute(stmt)
-        if result.scalar_one_or_none() is None:
-            raise CanvasNotFoundError(str(canvas_id))
+        await self._touch_canvas(canvas_id)
 
         model = element_to_model(element, canvas_id)
         self._session.add(model)
 
-        # Update canvas timestamp
-        canvas_stmt = select(CanvasModel).where(CanvasModel.id == canvas_id)
-        canvas_result = await self._session.execute(canvas_stmt)
-        canvas_model = canvas_result.scalar_one()
-        canvas_model.updated_at = datetime.now(UTC)
-
+        # All column defaults are client-side, so the flushed model is already complete
         await self._session.flush()
-        await self._session.refresh(model)
         return element_from_model(model)
 
     async def get_element(self, canvas_id: UUID, element_id: UUID) -> Element | None:
@@ -177,19 +187,10 @@ class DatabaseStorage:
         Raises:
             CanvasNotFoundError: If the canvas does not exist.
         """
-        # Verify canvas exists
-        canvas_stmt = select(CanvasModel.id).where(CanvasModel.id == canvas_id)
-        result = await self._session.execute(canvas_stmt)
-        if result.scalar_one_or_none() is None:
-            raise CanvasNotFoundError(str(canvas_id))
-
-        stmt = select(ElementModel).where(
-            ElementModel.canvas_id == canvas_id,
-            ElementModel.id == element_id,
-        )
-        result = await self._session.execute(stmt)
-        model = result.scalar_one_or_none()
+        model = await self._get_element_model(canvas_id, element_id)
         if model is None:
+            # Only a miss needs to tell a missing element from a missing canvas
+            await self._check_canvas_exists(canvas_id)
             return None
         return element_from_model(model)
 
@@ -207,20 +208,9 @@ class DatabaseStorage:
             CanvasNotFoundError: If the canvas does not exist.
             ElementNotFoundError: If the element does not exist.
         """
-        # Verify canvas exists
-        canvas_stmt = select(CanvasModel).where(CanvasModel.id == canvas_id)
-        result = await self._session.execute(canvas_stmt)
-        canvas_model = result.scalar_one_or_none()
-        if canvas_model is None:
-            raise CanvasNotFoundError(str(canvas_id))
+        await self._touch_canvas(canvas_id)
 
-        # Find the element
-        stmt = select(ElementModel).where(
-            ElementModel.canvas_id == canvas_id,
-            ElementModel.id == element.id,
-        )
-        result = await self._session.execute(stmt)
-        model = result.scalar_one_or_none()
+        model = await self._get_element_model(canvas_id, element.id)
         if model is None:
             raise ElementNotFoundError(str(element.id), str(canvas_id))
 
@@ -232,13 +222,10 @@ class DatabaseStorage:
         model.position_pressure = updated.position_pressure
         model.style_data = updated.style_data
         model.element_data = updated.element_data
+        model.point_data = updated.point_data
         model.updated_at = datetime.now(UTC)
 
-        # Update canvas timestamp
-        canvas_model.updated_at = datetime.now(UTC)
-
         await self._session.flush()
-        await self._session.refresh(model)
         return element_from_model(model)
 
     async def delete_element(self, canvas_id: UUID, element_id: UUID) -> bool:
@@ -254,29 +241,15 @@ class DatabaseStorage:
         Raises:
             CanvasNotFoundError: If the canvas does not exist.
         """
-        # Verify canvas exists
-        canvas_stmt = select(CanvasModel).where(CanvasModel.id == canvas_id)
-        result = await self._session.execute(canvas_stmt)
-        canvas_model = result.scalar_one_or_none()
-        if canvas_model is None:
-            raise CanvasNotFoundError(str(canvas_id))
-
-        # Find the element
-        stmt = select(ElementModel).where(
-            ElementModel.canvas_id == canvas_id,
-            ElementModel.id == element_id,
-        )
-        result = await self._session.execute(stmt)
-        model = result.scalar_one_or_none()
+        model = await self._get_element_model(canvas_id, element_id)
         if model is None:
+            # Nothing changed, so only check the canvas rather than bumping updated_at
+            await self._check_canvas_exists(canvas_id)
             return False
 
         await self._session.delete(model)
-
-        # Update canvas timestamp
-        canvas_model.updated_at = datetime.now(UTC)
-
         await self._session.flush()
+        await self._touch_canvas(canvas_id)
         return True
 
     async def list_elements(self, canvas_id: UUID) -> list[Element]:
@@ -291,13 +264,93 @@ class DatabaseStorage:
         Raises:
             CanvasNotFoundError: If the canvas does not exist.
         """
-        # Verify canvas exists
-        canvas_stmt = select(CanvasModel.id).where(CanvasModel.id == canvas_id)
-        result = await self._session.execute(canvas_stmt)
+        # Plain rows: the elements are converted straight away, so building ORM instances
+        # and adding them to the identity map would be wasted work
+        stmt = select(*ELEMENT_COLUMNS).where(ElementModel.canvas_id == canvas_id).order_by(ElementModel.created_at)
+        result = await self._session.execute(stmt)
+        rows = result.all()
+        if not rows:
+            # An empty result is either an empty canvas or a missing one
+            await self._check_canvas_exists(canvas_id)
+        return [element_from_model(row) for row in rows]
+
+    async def iter_elements(self, canvas_id: UUID) -> AsyncIterator[Element]:
+        """Iterate over all elements on a canvas.
+
+        Rows are streamed in batches rather than loaded all at once, so memory
+        stays flat for canvases with many elements.
+
+        Args:
+            canvas_id: The unique identifier of the canvas.
+
+        Yields:
+            The canvas's elements, ordered by creation date.
+
+        Raises:
+            CanvasNotFoundError: If the canvas does not exist.
+        """
+        stmt = (
+            select(*ELEMENT_COLUMNS)
+            .where(ElementModel.canvas_id == canvas_id)
+            .order_by(ElementModel.created_at)
+            .execution_options(yield_per=1000)
+        )
+        result = await self._session.stream(stmt)
+        found = False
+        async for row in result:
+            found = True
+            yield element_from_model(row)
+        if not found:
+            await self._check_canvas_exists(canvas_id)
+
+    async def _get_element_model(self, canvas_id: UUID, element_id: UUID) -> ElementModel | None:
+        """Look up an element by primary key and check it belongs to the canvas.
+
+        ``session.get`` returns an element already in the identity map without a query.
+
+        Args:
+            canvas_id: The unique identifier of the canvas.
+            element_id: The unique identifier of the element.
+
+        Returns:
+            The element model if found on this canvas, None otherwise.
+        """
+        model = await self._session.get(ElementModel, element_id)
+        if model is None or model.canvas_id != canvas_id:
+            return None
+        return model
+
+    async def _touch_canvas(self, canvas_id: UUID) -> None:
+        """Bump a canvas's updated_at, which also checks that it exists.
+
+        One ``UPDATE ... RETURNING`` replaces a separate existence check and load.
+
+        Args:
+            canvas_id: The unique identifier of the canvas.
+
+        Raises:
+            CanvasNotFoundError: If the canvas does not exist.
+        """
+        stmt = (
+            update(CanvasModel)
+            .where(CanvasModel.id == canvas_id)
+            .values(updated_at=datetime.now(UTC))
+            .returning(CanvasModel.id)
+        )
+        result = await self._session.execute(stmt)
         if result.scalar_one_or_none() is None:
             raise CanvasNotFoundError(str(canvas_id))
 
-        stmt = select(ElementModel).where(ElementModel.canvas_id == canvas_id).order_by(ElementModel.created_at)
+    async def _check_canvas_exists(self, canvas_id: UUID) -> None:
+        """Raise if a canvas does not exist.
+
+        Args:
+            canvas_id: The unique identifier of the canvas.
+
+        Raises:
+            CanvasNotFoundError: If the canvas does not exist.
+        """
+        stmt = select(exists().where(CanvasModel.id == canvas_id))
         result = await self._session.execute(stmt)
-        models = result.scalars().all()
-        return [element_from_model(m) for m in models]
+        if not result.scalar():
+            raise CanvasNotFoundError(str(canvas_id))
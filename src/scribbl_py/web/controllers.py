@@ -6,6 +6,7 @@ from typing import TYPE_CHECKING, ClassVar
 from uuid import UUID
 
 from litestar import Controller, delete, get, patch, post
+from litestar.concurrency import sync_to_thread
 from litestar.response import Response
 from litestar.status_codes import HTTP_204_NO_CONTENT
 
@@ -219,7 +220,8 @@ class CanvasController(Controller):
             ImportError: If cairosvg is not installed.
         """
         canvas = await service.get_canvas(canvas_id)
-        png_content = export_service.to_png(canvas, scale=scale)
+        # Rasterizing is CPU-bound; keep it off the event loop
+        png_content = await sync_to_thread(export_service.to_png, canvas, scale=scale)
         return Response(
             content=png_content,
             media_type="image/png",
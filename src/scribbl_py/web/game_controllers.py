@@ -17,7 +17,7 @@ from scribbl_py.services.game import (
     GameService,
     PlayerNotFoundError,
 )
-from scribbl_py.services.telemetry import get_telemetry
+from scribbl_py.services.telemetry import TelemetryService  # noqa: TC001
 
 logger = structlog.get_logger(__name__)
 
@@ -115,7 +115,7 @@ def room_to_response(room: Any) -> RoomResponseDTO:
         name=room.name,
         state=room.game_state.value,
         host_id=str(room.host_id) if room.host_id else None,
-        player_count=len(room.active_players()),
+        player_count=room.active_count,
         max_players=room.settings.max_players,
         current_round=room.current_display_round(),
         total_rounds=room.settings.rounds_per_game,
@@ -180,6 +180,7 @@ class GameRoomController(Controller):
         data: CreateRoomDTO,
         game_service: GameService,
         game_ws_handler: Any,
+        telemetry: TelemetryService,
         request: Request,
     ) -> RoomDetailDTO:
         """Create a new game room.
@@ -188,6 +189,7 @@ class GameRoomController(Controller):
             data: Room creation data.
             game_service: Game service instance (injected).
             game_ws_handler: WebSocket handler for broadcasting (injected).
+            telemetry: Telemetry service (injected).
             request: The request object.
 
         Returns:
@@ -214,7 +216,6 @@ class GameRoomController(Controller):
         )
 
         # Track room creation telemetry
-        telemetry = get_telemetry()
         telemetry.track_room_created(room.id, is_public=data.is_public)
 
         # Notify lobby browsers about the new room (only if public)
@@ -180,7 +180,7 @@ class HealthController(Controller):
             return ComponentHealth(
                 name="database",
                 status=HealthStatus.HEALTHY,
-                message="Database connection successful",
+                message=f"Database connection successful ({db_manager.pool_status})",
                 latency_ms=round(latency, 2),
             )
         except Exception as e:  # noqa: BLE001
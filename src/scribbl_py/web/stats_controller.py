@@ -6,7 +6,7 @@ from typing import Any, ClassVar
 
 from litestar import Controller, get
 
-from scribbl_py.services.telemetry import get_telemetry
+from scribbl_py.services.telemetry import TelemetryService  # noqa: TC001
 
 
 class StatsController(Controller):
@@ -16,12 +16,14 @@ class StatsController(Controller):
     tags: ClassVar[list[str]] = ["Stats"]
 
     @get("/")
-    async def get_stats(self) -> dict[str, Any]:
+    async def get_stats(self, telemetry: TelemetryService) -> dict[str, Any]:
         """Get current server statistics.
 
+        Args:
+            telemetry: Telemetry service (injected).
+
         Returns:
             Current telemetry statistics including active connections,
             games, players, and cumulative counts.
         """
-        telemetry = get_telemetry()
         return telemetry.get_stats_dict()
@@ -618,3 +618,18 @@ class TestCompleteWorkflow:
         # 8. Verify update
         final_canvas = client.get(f"/api/canvases/{canvas_id}").json()
         assert final_canvas["name"] == "Updated Drawing"
+
+
+class TestStatsAPI:
+    """Tests for the stats endpoint."""
+
+    def test_stats_reflect_created_room(self, client: TestClient[Litestar]) -> None:
+        """Test that room creation is tracked by the injected telemetry service."""
+        before = client.get("/stats").json()["active_game_rooms"]
+
+        response = client.post("/canvas-clash/rooms", json={"name": "Stats Room", "host_name": "Host"})
+        assert response.status_code == 201
+
+        response = client.get("/stats")
+        assert response.status_code == 200
+        assert response.json()["active_game_rooms"] == before + 1
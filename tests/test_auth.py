@@ -3,9 +3,10 @@
 from __future__ import annotations
 
 from datetime import UTC, datetime, timedelta
-from uuid import uuid4
+from uuid import UUID, uuid4
 
-from scribbl_py.auth.models import OAuthProvider, Session, UserStats
+from scribbl_py.auth.db_service import DatabaseAuthService
+from scribbl_py.auth.models import GameResult, OAuthProvider, Session, UserStats
 from scribbl_py.auth.service import AuthService
 
 
@@ -208,6 +209,43 @@ class TestAuthServiceStats:
         assert stats.current_win_streak == 0
 
 
+class TestDatabaseAuthServiceGameResults:
+    """Tests for recording a finished game for several users."""
+
+    async def test_record_game_results_batch(self) -> None:
+        """Test that each user's stats are updated and unknown users are skipped."""
+        service = DatabaseAuthService()
+        winner = await service.create_user(username="winner")
+        loser = await service.create_user(username="loser")
+
+        def result(user_id: UUID, score: int, *, won: bool) -> GameResult:
+            return GameResult(
+                user_id=user_id,
+                score=score,
+                won=won,
+                correct_guesses=1,
+                total_guesses=2,
+                total_guess_time_ms=3000,
+                fastest_guess_ms=3000,
+                drawings_completed=1,
+                drawings_guessed=1,
+            )
+
+        updated = await service.record_game_results(
+            [result(winner.id, 900, won=True), result(loser.id, 400, won=False), result(uuid4(), 100, won=False)],
+        )
+
+        assert [stats.user_id for stats in updated] == [winner.id, loser.id]
+        winner_stats = await service.get_user_stats(winner.id)
+        assert winner_stats is not None
+        assert winner_stats.games_won == 1
+        assert winner_stats.best_game_score == 900
+        loser_stats = await service.get_user_stats(loser.id)
+        assert loser_stats is not None
+        assert loser_stats.games_played == 1
+        assert loser_stats.current_win_streak == 0
+
+
 class TestAuthServiceLeaderboard:
     """Tests for leaderboards."""
 
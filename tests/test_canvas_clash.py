@@ -3,11 +3,13 @@
 from __future__ import annotations
 
 from typing import TYPE_CHECKING
+from uuid import uuid4
 
 import pytest
 
-from scribbl_py.game.models import GameState, GuessResult
-from scribbl_py.services.game import GameService
+from scribbl_py.game.exceptions import InsufficientWordsError
+from scribbl_py.game.models import GameRoom, GameSettings, GameState, GuessResult, Player, PlayerState
+from scribbl_py.services.game import GameNotFoundError, GameService, GameStateError
 
 if TYPE_CHECKING:
     pass
@@ -83,6 +85,94 @@ class TestGameService:
         assert player1_reconnected.id == original_id
         assert len(room.players) == 2  # Not duplicated
 
+    def test_rejoin_after_leave_reuses_player(self, game_service: GameService) -> None:
+        """Test that a player who left is reconnected rather than recreated."""
+        room = game_service.create_room(
+            host_user_id="host-123",
+            host_name="Host",
+            room_name="Test Room",
+        )
+        player = game_service.join_room(room_id=room.id, user_id="player-456", user_name="Player 2")
+
+        assert game_service.leave_room(room.id, player.id) is True
+        assert player.connection_state == PlayerState.LEFT
+
+        rejoined = game_service.join_room(room_id=room.id, user_id="player-456", user_name="Player 2")
+
+        assert rejoined is player
+        assert rejoined.connection_state == PlayerState.CONNECTED
+        assert len(room.players) == 2
+
+    def test_active_count_tracks_connections(self, game_service: GameService) -> None:
+        """Test that active_count follows joins, kicks, reconnects and leaves."""
+        room = game_service.create_room(host_user_id="host-123", host_name="Host")
+        host = room.players[0]
+        player = game_service.join_room(room.id, "player-456", "Player 2")
+        game_service.join_room(room.id, "viewer-789", "Viewer", as_spectator=True)
+        assert room.active_count == 3
+
+        room.kick_player(host.id, player.id)
+        assert room.active_count == 2
+
+        game_service.join_room(room.id, "player-456", "Player 2")
+        assert room.active_count == 3
+        assert room.active_count == len(room.active_players())
+
+    def test_room_deleted_when_last_player_leaves(self, game_service: GameService) -> None:
+        """Test that the room is removed once no connected players remain."""
+        room = game_service.create_room(host_user_id="host-123", host_name="Host")
+        player = game_service.join_room(room.id, "player-456", "Player 2")
+
+        game_service.leave_room(room.id, room.players[0].id)
+        assert game_service.get_room(room.id) is room
+
+        game_service.leave_room(room.id, player.id)
+        with pytest.raises(GameNotFoundError):
+            game_service.get_room(room.id)
+
+    def test_join_full_room_raises_state_error(self, game_service: GameService) -> None:
+        """Test that joining a full room reports the reason without adding the player."""
+        room = game_service.create_room("host-123", "Host", settings=GameSettings(max_players=2))
+        game_service.join_room(room.id, "player-456", "Player 2")
+        late = Player(user_id="player-789", user_name="Player 3")
+
+        assert room.can_add_player(late) == "Room is full"
+        with pytest.raises(GameStateError, match="Room is full"):
+            game_service.join_room(room.id, "player-789", "Player 3")
+        assert len(room.players) == 2
+
+    def test_spectator_joins_game_in_progress(self, game_service: GameService) -> None:
+        """Test that spectators can join mid-game but not once the game is over."""
+        room = game_service.create_room("host-123", "Host")
+        game_service.join_room(room.id, "player-456", "Player 2")
+        game_service.start_game(room.id, room.players[0].id)
+
+        spectator = game_service.join_room(room.id, "viewer-1", "Viewer", as_spectator=True)
+        assert spectator.is_spectator is True
+        assert spectator.is_host is False
+        assert room.get_player(spectator.id) is spectator
+        assert room.active_count == 3
+
+        room.game_state = GameState.GAME_OVER
+        with pytest.raises(GameStateError, match="game is over"):
+            game_service.join_room(room.id, "viewer-2", "Viewer 2", as_spectator=True)
+
+    def test_get_player_after_players_replaced(self) -> None:
+        """Test that replacing players, even with a list of the same length, rebuilds derived state."""
+        old = Player(user_id="old", user_name="Old", score=10)
+        new = Player(user_id="new", user_name="New", score=20)
+        left = Player(user_id="left", user_name="Left", connection_state=PlayerState.DISCONNECTED)
+        room = GameRoom(players=[old])
+        assert room.get_player(old.id) is old
+        assert room.get_leaderboard() == [(old, 10)]
+
+        room.replace_players([new, left])
+
+        assert room.get_player(new.id) is new
+        assert room.get_player(old.id) is None
+        assert room.active_count == 1
+        assert room.get_leaderboard() == [(new, 20)]
+
     def test_start_game_requires_min_players(self, game_service: GameService) -> None:
         """Test that starting game requires at least 2 players."""
         room = game_service.create_room(
@@ -134,6 +224,24 @@ class TestGameService:
         assert current_round.word == word
         assert room.game_state == GameState.DRAWING
 
+    def test_select_word_validates_options(self, game_service: GameService) -> None:
+        """Test that word selection is case-insensitive and rejects other words."""
+        room = game_service.create_room(
+            host_user_id="host-123",
+            host_name="Host",
+            room_name="Test Room",
+        )
+        game_service.join_room(room.id, "player-456", "Player 2")
+        first_round = game_service.start_game(room.id, room.players[0].id)
+
+        with pytest.raises(GameStateError):
+            game_service.select_word(room.id, first_round.drawer_id, "not-an-option-xyz")
+
+        word = first_round.word_options[0]
+        current_round = game_service.select_word(room.id, first_round.drawer_id, word.upper())
+
+        assert current_round.word == word.lower()
+
     def test_guess_correct(self, game_service: GameService) -> None:
         """Test correct guess awards points."""
         room = game_service.create_room(
@@ -178,10 +286,13 @@ class TestGameService:
         guesser = player2 if player2.id != drawer.id else room.players[0]
 
         # Submit wrong guess
-        guess, _ = game_service.submit_guess(room.id, guesser.id, "wrong_word_xyz")
+        guess, msg = game_service.submit_guess(room.id, guesser.id, "wrong_word_xyz")
 
         assert guess.result == GuessResult.WRONG
         assert guess.points_awarded == 0
+        # Per-guess records are slotted to keep busy rounds light
+        assert not hasattr(guess, "__dict__")
+        assert not hasattr(msg, "__dict__")
 
     def test_guess_not_allowed_in_word_selection(self, game_service: GameService) -> None:
         """Test that guessing is not allowed during word selection phase."""
@@ -224,6 +335,35 @@ class TestGameService:
         assert guess.result == GuessResult.DRAWER
         assert "drawer cannot guess" in msg.content.lower()
 
+    def test_already_guessed_reuses_rejection_message(self, game_service: GameService) -> None:
+        """Test that repeated rejected guesses share the system message but not the guess."""
+        room = game_service.create_room(
+            host_user_id="host-123",
+            host_name="Host",
+            room_name="Test Room",
+        )
+        player2 = game_service.join_room(room.id, "player-456", "Player 2")
+        first_round = game_service.start_game(room.id, room.players[0].id)
+        word = first_round.word_options[0]
+        game_service.select_word(room.id, first_round.drawer_id, word)
+        guesser = player2 if player2.id != first_round.drawer_id else room.players[0]
+        game_service.submit_guess(room.id, guesser.id, word)
+
+        guess1, msg1 = game_service.submit_guess(room.id, guesser.id, "again")
+        guess2, msg2 = game_service.submit_guess(room.id, guesser.id, "once more")
+
+        assert guess1.result == GuessResult.ALREADY_GUESSED
+        assert guess2.guess_text == "once more"
+        assert msg1 is msg2
+        assert msg1.content == f"{guesser.user_name} has already guessed!"
+
+    def test_generated_room_codes_are_alphanumeric(self, game_service: GameService) -> None:
+        """Test that generated room codes are uppercase alphanumeric and unique."""
+        codes = {game_service.create_room(f"host-{i}", "Host").room_code for i in range(50)}
+
+        assert len(codes) == 50
+        assert all(len(code) == 6 and code.isalnum() and code == code.upper() for code in codes)
+
     def test_get_room_by_code(self, game_service: GameService) -> None:
         """Test retrieving room by code."""
         room = game_service.create_room(
@@ -234,6 +374,14 @@ class TestGameService:
 
         retrieved = game_service.get_room_by_code(room.room_code)
         assert retrieved.id == room.id
+        assert game_service.get_room_by_code(room.room_code.lower()) is retrieved
+
+    def test_missing_room_raises_not_found(self, game_service: GameService) -> None:
+        """Test that unknown room IDs and codes raise GameNotFoundError."""
+        with pytest.raises(GameNotFoundError):
+            game_service.get_room(uuid4())
+        with pytest.raises(GameNotFoundError):
+            game_service.get_room_by_code("zzzzzz")
 
     def test_multiple_rooms_created(self, game_service: GameService) -> None:
         """Test creating and managing multiple rooms."""
@@ -303,6 +451,31 @@ class TestGameFlow:
         assert room1.game_state == GameState.WORD_SELECTION
         assert room2.game_state == GameState.LOBBY
 
+    def test_room_listings_follow_state(self, game_service: GameService) -> None:
+        """Test that lobby and active game listings track state changes and visibility."""
+        public = game_service.create_room("host-1", "Host 1", "Public", settings=GameSettings(is_public=True))
+        private = game_service.create_room("host-2", "Host 2", "Private")
+        game_service.join_room(public.id, "p1", "Player 1")
+
+        assert game_service.get_lobby_rooms() == [public]
+        assert game_service.get_lobby_rooms(public_only=False) == [public, private]
+        assert game_service.get_active_games() == []
+
+        first_round = game_service.start_game(public.id, public.players[0].id)
+        assert game_service.get_lobby_rooms() == []
+        assert game_service.get_active_games() == [public]
+
+        game_service.select_word(public.id, first_round.drawer_id, first_round.word_options[0])
+        game_service.end_round(public.id)
+        assert game_service.get_active_games() == [public]
+
+        game_service.reset_game(public.id)
+        assert game_service.get_lobby_rooms() == [public]
+        assert game_service.get_active_games() == []
+
+        game_service.delete_room(public.id)
+        assert game_service.get_lobby_rooms(public_only=False) == [private]
+
 
 class TestWordBank:
     """Test word bank functionality."""
@@ -331,6 +504,39 @@ class TestWordBank:
         hint = room.current_round.word_hint
         assert "_" in hint
 
+    def test_custom_words_only_cycles_through_pool(self, game_service: GameService) -> None:
+        """Test that custom-words-only rooms offer every custom word before repeating."""
+        words = ["apple", "banana", "cherry", "grape", "lemon", "mango", "peach"]
+        settings = GameSettings(custom_words=list(words), custom_words_only=True)
+        room = game_service.create_room("host-123", "Host", "Test Room", settings=settings)
+        game_service.join_room(room.id, "player-456", "Player 2")
+
+        first_round = game_service.start_game(room.id, room.players[0].id)
+        offered = list(first_round.word_options)
+        offered += room.next_custom_word_options()
+        third = room.next_custom_word_options()
+
+        assert set(offered) <= set(words)
+        assert len(set(offered)) == 6
+        assert len(set(third)) == 3
+        assert (set(words) - set(offered)) <= set(third)
+
+    def test_custom_word_pool_follows_settings(self) -> None:
+        """Test that replacing the custom words rebuilds the pool."""
+        room = GameRoom(settings=GameSettings(custom_words=["one", "two", "three"], custom_words_only=True))
+        assert set(room.next_custom_word_options()) == {"one", "two", "three"}
+
+        room.settings.custom_words = ["red", "green", "blue"]
+        assert set(room.next_custom_word_options()) == {"red", "green", "blue"}
+
+        # In-place edits that keep the length are picked up too
+        room.settings.custom_words[0] = "cyan"
+        assert set(room.next_custom_word_options()) == {"cyan", "green", "blue"}
+
+        room.settings.custom_words = ["solo"]
+        with pytest.raises(InsufficientWordsError):
+            room.next_custom_word_options()
+
 
 class TestRoundTransitions:
     """Test round transition functionality."""
@@ -354,6 +560,43 @@ class TestRoundTransitions:
         assert "leaderboard" in results
         assert results["is_game_over"] is False
 
+    def test_reset_game_clears_scores_and_history(self, game_service: GameService) -> None:
+        """Test that resetting a game clears scores, guesses and round history."""
+        room = game_service.create_room("host-123", "Host", "Test Room")
+        player2 = game_service.join_room(room.id, "player-456", "Player 2")
+        first_round = game_service.start_game(room.id, room.players[0].id)
+        word = first_round.word_options[0]
+        game_service.select_word(room.id, first_round.drawer_id, word)
+        guesser = player2 if player2.id != first_round.drawer_id else room.players[0]
+        game_service.submit_guess(room.id, guesser.id, word)
+        game_service.end_round(room.id)
+
+        game_service.reset_game(room.id)
+
+        assert room.game_state == GameState.LOBBY
+        assert room.round_history == []
+        assert all(p.score == 0 and not p.has_guessed and p.guess_time is None for p in room.players)
+
+    def test_leaderboard_refreshes_after_scoring(self, game_service: GameService) -> None:
+        """Test that the cached leaderboard picks up awarded points and resets."""
+        room = game_service.create_room("host-123", "Host", "Test Room")
+        player2 = game_service.join_room(room.id, "player-456", "Player 2")
+        first_round = game_service.start_game(room.id, room.players[0].id)
+        assert [score for _, score in room.get_leaderboard()] == [0, 0]
+
+        word = first_round.word_options[0]
+        game_service.select_word(room.id, first_round.drawer_id, word)
+        guesser = player2 if player2.id != first_round.drawer_id else room.players[0]
+        guess, _ = game_service.submit_guess(room.id, guesser.id, word)
+
+        leaderboard = game_service.end_round(room.id)["leaderboard"]
+        assert leaderboard[0] == (guesser, guess.points_awarded)
+        assert room.get_leaderboard() == leaderboard
+        assert room.get_leaderboard() is not room.get_leaderboard()
+
+        game_service.reset_game(room.id)
+        assert [score for _, score in room.get_leaderboard()] == [0, 0]
+
     def test_next_round_increments_round_number(self, game_service: GameService) -> None:
         """Test that next_round properly advances the round."""
         room = game_service.create_room("host-123", "Host", "Test Room")
@@ -475,6 +475,24 @@ class TestElementGrouping:
         with pytest.raises(ElementNotFoundError):
             await service.ungroup_elements(canvas.id, uuid4())
 
+    @pytest.mark.asyncio
+    async def test_undo_redo_ungroup_empty_group(
+        self, service: CanvasService, storage: InMemoryStorage, sample_canvas: Canvas
+    ) -> None:
+        """Test undo/redo of ungrouping a group with no children."""
+        canvas = await service.create_canvas(sample_canvas)
+        group = await storage.add_element(canvas.id, Group(name="Empty"))
+
+        assert await service.ungroup_elements(canvas.id, group.id) == []
+
+        assert await service.undo(canvas.id)
+        restored = await service.get_element(canvas.id, group.id)
+        assert isinstance(restored, Group)
+
+        assert await service.redo(canvas.id)
+        with pytest.raises(ElementNotFoundError):
+            await service.get_element(canvas.id, group.id)
+
 
 # Copy/Paste Tests
 
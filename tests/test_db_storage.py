@@ -5,11 +5,15 @@ These tests use an in-memory SQLite database for fast test execution.
 
 from __future__ import annotations
 
-from typing import Any
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING, Any
 from uuid import uuid4
 
 import pytest
 from sqlalchemy import event
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 
@@ -18,11 +22,17 @@ from scribbl_py.core.models import Canvas, Point, Shape, Stroke, Text
 from scribbl_py.core.style import ElementStyle
 from scribbl_py.core.types import ShapeType
 
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
 # Skip all tests in this module if db dependencies are not installed
 pytest.importorskip("advanced_alchemy")
 pytest.importorskip("sqlalchemy.ext.asyncio")
 
-from scribbl_py.storage.db.models import CanvasModel, ElementModel
+from scribbl_py.auth.db_service import DatabaseAuthService, SessionDataloader
+from scribbl_py.auth.models import GameResult, OAuthProvider, Session, User, UserStats
+from scribbl_py.storage.db.auth_storage import AuthDatabaseStorage
+from scribbl_py.storage.db.models import CanvasModel, ElementModel, element_from_model, pack_points, unpack_points
 from scribbl_py.storage.db.storage import DatabaseStorage
 
 
@@ -61,6 +71,26 @@ def db_storage(db_session: AsyncSession) -> DatabaseStorage:
     return DatabaseStorage(session=db_session)
 
 
+@pytest.fixture
+def auth_storage(db_session: AsyncSession) -> AuthDatabaseStorage:
+    """Create an AuthDatabaseStorage instance with the test session."""
+    return AuthDatabaseStorage(session=db_session)
+
+
+@pytest.fixture
+async def db_auth_service() -> DatabaseAuthService:
+    """Create a DatabaseAuthService backed by an in-memory SQLite database."""
+    pytest.importorskip("aiosqlite")
+
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:", echo=False)
+    async with engine.begin() as conn:
+        await conn.run_sync(CanvasModel.metadata.create_all)
+
+    yield DatabaseAuthService(session_factory=sessionmaker(engine, class_=AsyncSession, expire_on_commit=False))
+
+    await engine.dispose()
+
+
 @pytest.fixture
 def sample_canvas() -> Canvas:
     """Create a sample canvas for testing."""
@@ -126,6 +156,46 @@ class TestDatabaseStorageCanvas:
         names = {c.name for c in canvases}
         assert names == {"Canvas 1", "Canvas 2", "Canvas 3"}
 
+    @pytest.mark.asyncio
+    async def test_get_canvas_after_list_loads_elements(
+        self,
+        db_storage: DatabaseStorage,
+        db_session: AsyncSession,
+        sample_canvas: Canvas,
+        sample_stroke: Stroke,
+    ) -> None:
+        """Test that listing canvases without elements doesn't hide them from get_canvas."""
+        canvas = await db_storage.create_canvas(sample_canvas)
+        await db_storage.add_element(canvas.id, sample_stroke)
+        db_session.expunge_all()
+
+        await db_storage.list_canvases()
+        fetched = await db_storage.get_canvas(canvas.id)
+
+        assert fetched is not None
+        assert [e.id for e in fetched.elements] == [sample_stroke.id]
+
+    @pytest.mark.asyncio
+    async def test_list_canvases_with_elements(
+        self,
+        db_storage: DatabaseStorage,
+        db_session: AsyncSession,
+        sample_stroke: Stroke,
+    ) -> None:
+        """Test that listing canvases with elements loads every canvas's elements."""
+        first = await db_storage.create_canvas(Canvas(name="First"))
+        second = await db_storage.create_canvas(Canvas(name="Second"))
+        await db_storage.add_element(first.id, sample_stroke)
+        db_session.expunge_all()
+
+        await db_storage.list_canvases()
+        canvases = await db_storage.list_canvases_with_elements()
+
+        by_name = {c.name: c for c in canvases}
+        assert [e.id for e in by_name["First"].elements] == [sample_stroke.id]
+        assert by_name["Second"].elements == []
+        assert second.id in {c.id for c in canvases}
+
     @pytest.mark.asyncio
     async def test_list_canvases_empty(self, db_storage: DatabaseStorage) -> None:
         """Test listing canvases when none exist."""
@@ -147,6 +217,22 @@ class TestDatabaseStorageCanvas:
         assert updated.background_color == "#ff0000"
         assert updated.created_at == original_created_at
 
+    @pytest.mark.asyncio
+    async def test_update_canvas_returns_current_elements(
+        self,
+        db_storage: DatabaseStorage,
+        sample_canvas: Canvas,
+        sample_stroke: Stroke,
+    ) -> None:
+        """Test that an updated canvas includes elements added in the same session."""
+        created = await db_storage.create_canvas(sample_canvas)
+        await db_storage.add_element(created.id, sample_stroke)
+
+        created.name = "Updated Name"
+        updated = await db_storage.update_canvas(created)
+
+        assert [e.id for e in updated.elements] == [sample_stroke.id]
+
     @pytest.mark.asyncio
     async def test_update_nonexistent_canvas(self, db_storage: DatabaseStorage) -> None:
         """Test updating a canvas that doesn't exist."""
@@ -208,6 +294,24 @@ class TestDatabaseStorageElements:
 
         assert str(nonexistent_id) in str(exc_info.value)
 
+    @pytest.mark.asyncio
+    async def test_add_element_touches_canvas(
+        self,
+        db_storage: DatabaseStorage,
+        db_session: AsyncSession,
+        sample_canvas: Canvas,
+        sample_stroke: Stroke,
+    ) -> None:
+        """Test that adding an element bumps the canvas updated_at."""
+        canvas = await db_storage.create_canvas(sample_canvas)
+
+        await db_storage.add_element(canvas.id, sample_stroke)
+        db_session.expunge_all()
+
+        stored = await db_storage.get_canvas(canvas.id)
+        assert stored is not None
+        assert stored.updated_at > canvas.updated_at
+
     @pytest.mark.asyncio
     async def test_add_multiple_element_types(
         self,
@@ -265,6 +369,23 @@ class TestDatabaseStorageElements:
         result = await db_storage.get_element(canvas.id, nonexistent_id)
         assert result is None
 
+    @pytest.mark.asyncio
+    async def test_get_element_from_other_canvas(
+        self,
+        db_storage: DatabaseStorage,
+        sample_canvas: Canvas,
+        sample_stroke: Stroke,
+    ) -> None:
+        """Test that an element isn't found through a canvas it doesn't belong to."""
+        canvas = await db_storage.create_canvas(sample_canvas)
+        other = await db_storage.create_canvas(Canvas(name="Other"))
+        added = await db_storage.add_element(canvas.id, sample_stroke)
+
+        assert await db_storage.get_element(other.id, added.id) is None
+        with pytest.raises(ElementNotFoundError):
+            await db_storage.update_element(other.id, added)
+        assert await db_storage.delete_element(other.id, added.id) is False
+
     @pytest.mark.asyncio
     async def test_get_element_from_nonexistent_canvas(self, db_storage: DatabaseStorage) -> None:
         """Test retrieving an element from a canvas that doesn't exist."""
@@ -346,6 +467,23 @@ class TestDatabaseStorageElements:
         deleted = await db_storage.delete_element(canvas.id, nonexistent_id)
         assert deleted is False
 
+    @pytest.mark.asyncio
+    async def test_delete_nonexistent_element_keeps_updated_at(
+        self,
+        db_storage: DatabaseStorage,
+        db_session: AsyncSession,
+        sample_canvas: Canvas,
+    ) -> None:
+        """Test that deleting a missing element leaves the canvas updated_at alone."""
+        canvas = await db_storage.create_canvas(sample_canvas)
+
+        assert await db_storage.delete_element(canvas.id, uuid4()) is False
+        db_session.expunge_all()
+
+        stored = await db_storage.get_canvas(canvas.id)
+        assert stored is not None
+        assert stored.updated_at == canvas.updated_at
+
     @pytest.mark.asyncio
     async def test_delete_element_from_nonexistent_canvas(self, db_storage: DatabaseStorage) -> None:
         """Test deleting an element from a canvas that doesn't exist."""
@@ -376,6 +514,25 @@ class TestDatabaseStorageElements:
         elements = await db_storage.list_elements(canvas.id)
         assert len(elements) == 3
 
+    @pytest.mark.asyncio
+    async def test_list_elements_matches_get_element(
+        self,
+        db_storage: DatabaseStorage,
+        db_session: AsyncSession,
+        sample_canvas: Canvas,
+    ) -> None:
+        """Test that elements listed from plain rows decode the same as ORM-loaded ones."""
+        canvas = await db_storage.create_canvas(sample_canvas)
+        stroke = Stroke(position=Point(x=1, y=2), points=[Point(x=1, y=2, pressure=0.5, timestamp=3.0)])
+        await db_storage.add_element(canvas.id, stroke)
+        await db_storage.add_element(canvas.id, Shape(group_id=stroke.id, width=5.0))
+        db_session.expunge_all()
+
+        listed = await db_storage.list_elements(canvas.id)
+
+        assert listed == [await db_storage.get_element(canvas.id, e.id) for e in listed]
+        assert listed[1].group_id == stroke.id
+
     @pytest.mark.asyncio
     async def test_list_elements_empty_canvas(self, db_storage: DatabaseStorage, sample_canvas: Canvas) -> None:
         """Test listing elements on a canvas with no elements."""
@@ -383,6 +540,23 @@ class TestDatabaseStorageElements:
         elements = await db_storage.list_elements(canvas.id)
         assert elements == []
 
+    @pytest.mark.asyncio
+    async def test_iter_elements(self, db_storage: DatabaseStorage, sample_canvas: Canvas) -> None:
+        """Test streaming elements matches listing them."""
+        canvas = await db_storage.create_canvas(sample_canvas)
+        for i in range(3):
+            await db_storage.add_element(canvas.id, Shape(position=Point(x=float(i), y=0.0)))
+
+        streamed = [element async for element in db_storage.iter_elements(canvas.id)]
+
+        assert [e.id for e in streamed] == [e.id for e in await db_storage.list_elements(canvas.id)]
+
+    @pytest.mark.asyncio
+    async def test_iter_elements_from_nonexistent_canvas(self, db_storage: DatabaseStorage) -> None:
+        """Test streaming elements from a canvas that doesn't exist."""
+        with pytest.raises(CanvasNotFoundError):
+            [element async for element in db_storage.iter_elements(uuid4())]
+
     @pytest.mark.asyncio
     async def test_list_elements_from_nonexistent_canvas(self, db_storage: DatabaseStorage) -> None:
         """Test listing elements from a canvas that doesn't exist."""
@@ -419,6 +593,22 @@ class TestDatabaseStorageCascade:
         result = await db_session.execute(stmt)
         assert result.scalars().first() is None
 
+    @pytest.mark.asyncio
+    async def test_get_element_after_canvas_delete(
+        self,
+        db_storage: DatabaseStorage,
+        sample_canvas: Canvas,
+        sample_stroke: Stroke,
+    ) -> None:
+        """Test that elements removed by the cascade aren't served from the session."""
+        canvas = await db_storage.create_canvas(sample_canvas)
+        added = await db_storage.add_element(canvas.id, sample_stroke)
+
+        await db_storage.delete_canvas(canvas.id)
+
+        with pytest.raises(CanvasNotFoundError):
+            await db_storage.get_element(canvas.id, added.id)
+
 
 @pytest.mark.db
 class TestDatabaseStorageModelConversion:
@@ -514,3 +704,404 @@ class TestDatabaseStorageModelConversion:
         assert retrieved.content == "Hello, World!"
         assert retrieved.font_size == 24
         assert retrieved.font_family == "monospace"
+
+    def test_packed_points_round_trip(self) -> None:
+        """Test that packed points keep their values and missing timestamps."""
+        points = [Point(x=1.5, y=-2.0, pressure=0.25, timestamp=1234.5), Point(x=3.0, y=4.0)]
+
+        packed = pack_points(points)
+
+        assert len(packed) == 2 * 4 * 8
+        assert unpack_points(packed) == points
+        assert unpack_points(pack_points([])) == []
+
+    def test_stroke_with_json_points_still_loads(self) -> None:
+        """Test that strokes stored before point_data read their points from the JSON."""
+        model = ElementModel(
+            id=uuid4(),
+            canvas_id=uuid4(),
+            element_type="stroke",
+            position_x=0.0,
+            position_y=0.0,
+            position_pressure=1.0,
+            z_index=0,
+            visible=True,
+            locked=False,
+            style_data={},
+            element_data={"points": [{"x": 1, "y": 2, "pressure": 0.5}], "smoothing": 0.3},
+            point_data=None,
+        )
+
+        element = element_from_model(model)
+
+        assert isinstance(element, Stroke)
+        assert element.points == [Point(x=1, y=2, pressure=0.5)]
+        assert element.smoothing == 0.3
+
+    @pytest.mark.parametrize(
+        ("element_type", "element_data"),
+        [("sticker", {}), ("shape", {"shape_type": "hexagon"})],
+    )
+    def test_unknown_stored_types_raise_value_error(self, element_type: str, element_data: dict[str, Any]) -> None:
+        """Test that unknown element and shape types both surface as ValueError."""
+        model = ElementModel(
+            id=uuid4(),
+            canvas_id=uuid4(),
+            element_type=element_type,
+            position_x=0.0,
+            position_y=0.0,
+            position_pressure=1.0,
+            z_index=0,
+            visible=True,
+            locked=False,
+            style_data={},
+            element_data=element_data,
+        )
+
+        with pytest.raises(ValueError, match="is not a valid"):
+            element_from_model(model)
+
+
+@pytest.mark.db
+class TestAuthDatabaseStorageSessions:
+    """Tests for session storage with deferred client details."""
+
+    @pytest.mark.asyncio
+    async def test_session_client_details(
+        self,
+        auth_storage: AuthDatabaseStorage,
+        db_session: AsyncSession,
+    ) -> None:
+        """Test that client details are stored but only loaded where requested."""
+        user = await auth_storage.create_user(User(username="Alice"))
+        created = await auth_storage.create_session(
+            Session(id="token-1", user_id=user.id, ip_address="10.0.0.1", user_agent="pytest"),
+        )
+        assert created.ip_address == "10.0.0.1"
+        assert created.user_agent == "pytest"
+        db_session.expunge_all()
+
+        # Token lookups skip the deferred audit columns
+        session = await auth_storage.get_session("token-1")
+        assert session is not None
+        assert session.user_id == user.id
+        assert session.ip_address is None
+        db_session.expunge_all()
+
+        sessions = [s async for s in auth_storage.iter_user_sessions(user.id)]
+        assert [(s.ip_address, s.user_agent) for s in sessions] == [("10.0.0.1", "pytest")]
+
+    @pytest.mark.asyncio
+    async def test_delete_expired_sessions_in_batches(self, auth_storage: AuthDatabaseStorage) -> None:
+        """Test that expired sessions can be deleted a batch at a time."""
+        past = datetime.now(UTC) - timedelta(hours=1)
+        future = datetime.now(UTC) + timedelta(hours=1)
+        for i in range(3):
+            await auth_storage.create_session(Session(id=f"expired-{i}", expires_at=past))
+        await auth_storage.create_session(Session(id="live", expires_at=future))
+
+        assert await auth_storage.delete_expired_sessions(batch_size=2) == 2
+        assert await auth_storage.delete_expired_sessions(batch_size=2) == 1
+        assert await auth_storage.delete_expired_sessions(batch_size=2) == 0
+        assert await auth_storage.get_session("live") is not None
+
+
+@pytest.mark.db
+class TestAuthDatabaseStorageStats:
+    """Tests for user stats storage."""
+
+    @pytest.mark.asyncio
+    async def test_update_stats_round_trip(
+        self,
+        auth_storage: AuthDatabaseStorage,
+        db_session: AsyncSession,
+    ) -> None:
+        """Test that updated stats are returned and persisted."""
+        user = await auth_storage.create_user(User(username="Bob"))
+        await auth_storage.create_stats(UserStats(user_id=user.id))
+
+        updated = await auth_storage.update_stats(
+            UserStats(user_id=user.id, games_played=3, games_won=2, fastest_guess_ms=850),
+        )
+        assert updated.games_played == 3
+        assert updated.fastest_guess_ms == 850
+        db_session.expunge_all()
+
+        stored = await auth_storage.get_stats(user.id)
+        assert stored is not None
+        assert stored.games_won == 2
+        assert stored.fastest_guess_ms == 850
+
+    @pytest.mark.asyncio
+    async def test_update_stats_creates_missing_row(self, auth_storage: AuthDatabaseStorage) -> None:
+        """Test that updating stats a user doesn't have yet creates them."""
+        user = await auth_storage.create_user(User(username="Eve"))
+
+        created = await auth_storage.update_stats(UserStats(user_id=user.id, games_played=1))
+        updated = await auth_storage.update_stats(UserStats(user_id=user.id, games_played=2))
+
+        assert created.games_played == 1
+        assert updated.games_played == 2
+        stored = await auth_storage.get_stats(user.id)
+        assert stored is not None
+        assert stored.games_played == 2
+
+    @pytest.mark.asyncio
+    async def test_leaderboard_pages_follow_cursor(self, auth_storage: AuthDatabaseStorage) -> None:
+        """Test that keyset pages cover every ranked user once, ties included."""
+        for name, wins in [("A", 5), ("B", 3), ("C", 3), ("D", 1)]:
+            user = User(username=name)
+            await auth_storage.create_user_with_stats(user, UserStats(user_id=user.id, games_played=5, games_won=wins))
+
+        names: list[str] = []
+        entries, cursor = await auth_storage.get_leaderboard_page("wins", limit=2)
+        names += [user.username for user, _ in entries]
+        # The B/C tie is split across the page boundary
+        entries, cursor = await auth_storage.get_leaderboard_page("wins", limit=2, after=cursor)
+        names += [user.username for user, _ in entries]
+
+        assert names[0] == "A"
+        assert sorted(names[1:3]) == ["B", "C"]
+        assert names[3:] == ["D"]
+        entries, cursor = await auth_storage.get_leaderboard_page("wins", limit=2, after=cursor)
+        assert entries == []
+        assert cursor is None
+
+    @pytest.mark.asyncio
+    async def test_fastest_leaderboard_pages_ascending(self, auth_storage: AuthDatabaseStorage) -> None:
+        """Test that the fastest board pages upward and skips users without a time."""
+        for name, fastest in [("Slow", 900), ("Quick", 300), ("None", None)]:
+            user = User(username=name)
+            stats = UserStats(user_id=user.id, games_played=1, fastest_guess_ms=fastest)
+            await auth_storage.create_user_with_stats(user, stats)
+
+        first, cursor = await auth_storage.get_leaderboard_page("fastest", limit=1)
+        second, _ = await auth_storage.get_leaderboard_page("fastest", limit=5, after=cursor)
+
+        assert [user.username for user, _ in first] == ["Quick"]
+        assert [user.username for user, _ in second] == ["Slow"]
+
+
+@pytest.mark.db
+class TestDatabaseAuthServiceLeaderboard:
+    """Tests for the cached database leaderboard."""
+
+    @staticmethod
+    def _result(user: User, score: int, *, won: bool, drawings_completed: int = 1) -> GameResult:
+        return GameResult(
+            user_id=user.id,
+            score=score,
+            won=won,
+            correct_guesses=1,
+            total_guesses=1,
+            total_guess_time_ms=1000,
+            fastest_guess_ms=1000,
+            drawings_completed=drawings_completed,
+            drawings_guessed=min(drawings_completed, 1),
+        )
+
+    @pytest.mark.asyncio
+    async def test_leaderboard_refreshes_after_stats_change(self, db_auth_service: DatabaseAuthService) -> None:
+        """Test that a cached leaderboard is dropped when stats are recorded."""
+        alice = await db_auth_service.create_user(username="Alice")
+        bob = await db_auth_service.create_user(username="Bob")
+        await db_auth_service.record_game_results(
+            [self._result(alice, 500, won=True), self._result(bob, 100, won=False)]
+        )
+
+        first = await db_auth_service.get_leaderboard("wins")
+        assert [user.username for user, _ in first] == ["Alice", "Bob"]
+        assert first[0][0].id == alice.id
+        assert (first[0][1].games_won, first[0][1].total_score) == (1, 500)
+        assert await db_auth_service.get_leaderboard("wins") == first
+
+        await db_auth_service.record_game_results([self._result(bob, 900, won=True)])
+        await db_auth_service.record_game_results([self._result(bob, 900, won=True)])
+
+        updated = await db_auth_service.get_leaderboard("wins")
+        assert [user.username for user, _ in updated] == ["Bob", "Alice"]
+
+    @pytest.mark.asyncio
+    async def test_leaderboard_read_racing_a_write_is_not_cached(
+        self,
+        db_auth_service: DatabaseAuthService,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that a refresh overlapping a stats write doesn't keep its rows in the cache."""
+        alice = await db_auth_service.create_user(username="Alice")
+        await db_auth_service.record_game_results([self._result(alice, 500, won=True)])
+
+        get_storage = db_auth_service._get_storage
+
+        def racing_storage(db_session: AsyncSession) -> AuthDatabaseStorage:
+            storage = get_storage(db_session)
+            read = storage.get_leaderboard
+
+            async def get_leaderboard(*args: Any) -> Any:
+                entries = await read(*args)
+                # Another request commits stats after this read but before it is cached
+                await db_auth_service.record_game_results([self._result(alice, 100, won=True)])
+                return entries
+
+            monkeypatch.setattr(storage, "get_leaderboard", get_leaderboard)
+            return storage
+
+        monkeypatch.setattr(db_auth_service, "_get_storage", racing_storage)
+        await db_auth_service.get_leaderboard("wins")
+        monkeypatch.setattr(db_auth_service, "_get_storage", get_storage)
+
+        entries = await db_auth_service.get_leaderboard("wins")
+        assert entries[0][1].games_won == 2
+
+    @pytest.mark.asyncio
+    async def test_drawer_leaderboard_skips_users_without_drawings(
+        self,
+        db_auth_service: DatabaseAuthService,
+    ) -> None:
+        """Test that the drawer ranking only includes users who have drawn, in both backends."""
+        for service in (db_auth_service, DatabaseAuthService()):
+            alice = await service.create_user(username="Alice")
+            bob = await service.create_user(username="Bob")
+            await service.record_game_results(
+                [self._result(alice, 500, won=True), self._result(bob, 100, won=False, drawings_completed=0)],
+            )
+
+            entries = await service.get_leaderboard("drawer")
+
+            assert [user.username for user, _ in entries] == ["Alice"]
+
+
+@pytest.mark.db
+class TestDatabaseAuthServiceSessions:
+    """Tests for the cached database session lookups."""
+
+    @pytest.mark.asyncio
+    async def test_session_cache_follows_writes(self, db_auth_service: DatabaseAuthService) -> None:
+        """Test that cached sessions reflect updates and logouts."""
+        session = await db_auth_service.create_session(guest_name="Guest")
+        user = await db_auth_service.create_user(username="Ivy")
+
+        fetched = await db_auth_service.get_session(session.id)
+        assert fetched is not None
+        assert fetched.user_id is None
+
+        await db_auth_service.update_session_user(session.id, user)
+        fetched = await db_auth_service.get_session(session.id)
+        assert fetched is not None
+        assert fetched.user_id == user.id
+
+        assert await db_auth_service.delete_session(session.id) is True
+        assert await db_auth_service.get_session(session.id) is None
+
+
+class TestSessionDataloader:
+    """Tests for coalescing concurrent session lookups."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_loads_share_one_query(self) -> None:
+        """Test that lookups from one loop iteration are loaded together."""
+        known = {"a": Session(id="a"), "b": Session(id="b")}
+        batches: list[list[str]] = []
+
+        class FakeStorage:
+            async def get_sessions(self, tokens: list[str]) -> dict[str, Session]:
+                batches.append(sorted(tokens))
+                return {token: known[token] for token in tokens if token in known}
+
+        @asynccontextmanager
+        async def session_factory() -> AsyncIterator[None]:
+            yield None
+
+        loader = SessionDataloader(session_factory, lambda _: FakeStorage())
+
+        results = await asyncio.gather(loader.load("a"), loader.load("b"), loader.load("a"), loader.load("zzz"))
+
+        assert [r.id if r else None for r in results] == ["a", "b", "a", None]
+        assert batches == [["a", "b", "zzz"]]
+
+        assert await loader.load("b") is known["b"]
+        assert len(batches) == 2
+
+
+@pytest.mark.db
+class TestAuthDatabaseStorageWrites:
+    """Tests for single-statement user and session writes."""
+
+    @pytest.mark.asyncio
+    async def test_update_user(self, auth_storage: AuthDatabaseStorage) -> None:
+        """Test that updating a user returns the new values."""
+        user = await auth_storage.create_user(User(username="Carol"))
+        user.username = "Caroline"
+        user.avatar_url = "https://example.com/a.png"
+
+        updated = await auth_storage.update_user(user)
+
+        assert updated.username == "Caroline"
+        assert updated.avatar_url == "https://example.com/a.png"
+        fetched = await auth_storage.get_user(user.id)
+        assert fetched is not None
+        assert fetched.username == "Caroline"
+
+    @pytest.mark.asyncio
+    async def test_update_missing_user_raises(self, auth_storage: AuthDatabaseStorage) -> None:
+        """Test that updating an unknown user raises ValueError."""
+        with pytest.raises(ValueError, match="not found"):
+            await auth_storage.update_user(User(username="Ghost"))
+
+    @pytest.mark.asyncio
+    async def test_delete_user_cascades(self, auth_storage: AuthDatabaseStorage) -> None:
+        """Test that deleting a user removes their stats and sessions."""
+        user = await auth_storage.create_user(User(username="Dave"))
+        await auth_storage.create_stats(UserStats(user_id=user.id))
+        await auth_storage.create_session(Session(id="token-dave", user_id=user.id))
+
+        assert await auth_storage.delete_user(user.id) is True
+        assert await auth_storage.delete_user(user.id) is False
+        assert await auth_storage.get_user(user.id) is None
+        assert await auth_storage.get_stats(user.id) is None
+        assert await auth_storage.get_session("token-dave") is None
+
+    @pytest.mark.asyncio
+    async def test_delete_session(self, auth_storage: AuthDatabaseStorage) -> None:
+        """Test that deleting a session reports whether it existed."""
+        await auth_storage.create_session(Session(id="token-guest"))
+
+        assert await auth_storage.delete_session("token-guest") is True
+        assert await auth_storage.delete_session("token-guest") is False
+
+    @pytest.mark.asyncio
+    async def test_create_user_with_stats(self, auth_storage: AuthDatabaseStorage) -> None:
+        """Test that a user and their stats are created together."""
+        new_user = User(username="Erin")
+        user, stats = await auth_storage.create_user_with_stats(new_user, UserStats(user_id=new_user.id))
+
+        assert user.username == "Erin"
+        assert user.created_at is not None
+        assert stats.games_played == 0
+        fetched = await auth_storage.get_stats(user.id)
+        assert fetched is not None
+
+    @pytest.mark.asyncio
+    async def test_get_users_with_stats(self, auth_storage: AuthDatabaseStorage) -> None:
+        """Test that users and stats load together, in request order."""
+        fay = User(username="Fay")
+        first, _ = await auth_storage.create_user_with_stats(fay, UserStats(user_id=fay.id))
+        second = await auth_storage.create_user(User(username="Gus"))
+
+        found = await auth_storage.get_users_with_stats([second.id, uuid4(), first.id])
+
+        assert [(user.username, stats is not None) for user, stats in found] == [("Gus", False), ("Fay", True)]
+
+    @pytest.mark.asyncio
+    async def test_oauth_identity_is_unique(self, auth_storage: AuthDatabaseStorage) -> None:
+        """Test that an OAuth identity maps to one user while guests may share NULLs."""
+        await auth_storage.create_user(User(username="Guest 1"))
+        await auth_storage.create_user(User(username="Guest 2"))
+        await auth_storage.create_user(User(username="Hal", oauth_provider=OAuthProvider.GITHUB, oauth_id="42"))
+
+        found = await auth_storage.get_user_by_oauth("github", "42")
+        assert found is not None
+        assert found.username == "Hal"
+
+        with pytest.raises(IntegrityError):
+            await auth_storage.create_user(User(username="Hal 2", oauth_provider=OAuthProvider.GITHUB, oauth_id="42"))
@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
+import io
 import json
+from dataclasses import replace
+from datetime import timedelta
 from unittest.mock import MagicMock, patch
 
 import pytest
 from litestar import Litestar
 from litestar.testing import TestClient
+from PIL import Image, ImageChops
 
 from scribbl_py.core.models import Canvas, Group, Point, Shape, Stroke, Text
 from scribbl_py.core.style import ElementStyle
@@ -119,6 +123,18 @@ class TestExportServiceJSON:
         assert len(stroke_data["points"]) == 1
         assert stroke_data["points"][0]["pressure"] == 0.5
 
+    def test_compact_stroke_points_json(self, export_service: ExportService) -> None:
+        """Test stroke points serialize to JSON arrays when compact points are requested."""
+        canvas = Canvas(name="Test", width=100, height=100)
+        canvas.elements.append(Stroke(points=[Point(x=1, y=2), Point(x=3, y=4, pressure=0.5)]))
+
+        assert "points_schema" not in export_service.to_dict(canvas)["elements"][0]
+        stroke_data = json.loads(export_service.to_json(canvas, compact_points=True))["elements"][0]
+
+        assert stroke_data["element_type"] == "stroke"
+        assert stroke_data["points_schema"] == ["x", "y", "pressure", "timestamp"]
+        assert stroke_data["points"] == [[1, 2, 1.0, None], [3, 4, 0.5, None]]
+
     def test_shape_serialization(self, export_service: ExportService) -> None:
         """Test shape element serialization."""
         canvas = Canvas(name="Test", width=100, height=100)
@@ -399,6 +415,49 @@ class TestExportServiceSVG:
         assert "<svg" in result
 
 
+class TestExportServiceCache:
+    """Tests for export caching keyed on canvas version."""
+
+    def test_svg_cached_per_version(self, export_service: ExportService) -> None:
+        """Test repeated SVG exports of an unchanged canvas reuse the cached result."""
+        canvas = Canvas(name="Cached")
+
+        assert export_service.to_svg(canvas) is export_service.to_svg(canvas)
+
+    def test_dict_cached_per_version(self, export_service: ExportService) -> None:
+        """Test to_dict and to_json share the cached dictionary."""
+        canvas = Canvas(name="Cached")
+
+        first = export_service.to_dict(canvas)
+
+        assert export_service.to_dict(canvas) is first
+        assert json.loads(export_service.to_json(canvas))["name"] == "Cached"
+
+    def test_updated_at_invalidates(self, export_service: ExportService) -> None:
+        """Test a newer updated_at produces a fresh export."""
+        canvas = Canvas(name="Before")
+        export_service.to_svg(canvas)
+
+        updated = replace(canvas, name="After", updated_at=canvas.updated_at + timedelta(seconds=1))
+
+        assert "After" in export_service.to_svg(updated)
+        assert export_service.to_dict(updated)["name"] == "After"
+
+    def test_cache_evicts_least_recently_used(self) -> None:
+        """Test the cache is bounded by cache_size."""
+        export_service = ExportService(cache_size=2)
+        first, second, third = Canvas(name="1"), Canvas(name="2"), Canvas(name="3")
+
+        first_svg = export_service.to_svg(first)
+        export_service.to_svg(second)
+        export_service.to_svg(first)
+        export_service.to_svg(third)
+
+        assert export_service.to_svg(first) is first_svg
+        assert len(export_service._svg_cache) == 2
+        assert (second.id, second.updated_at) not in export_service._svg_cache
+
+
 class TestExportServicePNG:
     """Tests for PNG export functionality."""
 
@@ -428,6 +487,150 @@ class TestExportServicePNG:
         assert b"svg" in call_kwargs["bytestring"]
 
 
+class TestExportServicePNGRendering:
+    """Tests for the Pillow and OpenCV PNG rasterization backends."""
+
+    @pytest.fixture(params=["pillow", "opencv"])
+    def backend(self, request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> str:
+        """Run each test against both rasterization backends."""
+        if request.param == "pillow":
+            monkeypatch.setattr("scribbl_py.services.export.cv2", None)
+        else:
+            pytest.importorskip("cv2")
+        return request.param
+
+    def _render(self, export_service: ExportService, canvas: Canvas, scale: float = 1.0) -> Image.Image:
+        return Image.open(io.BytesIO(export_service.to_png(canvas, scale=scale))).convert("RGBA")
+
+    def test_to_png_background(self, export_service: ExportService, backend: str) -> None:
+        """Test PNG export fills the background color at the scaled size."""
+        canvas = Canvas(name="Test", width=40, height=30, background_color="#102030")
+
+        image = self._render(export_service, canvas, scale=2.0)
+
+        assert image.size == (80, 60)
+        assert image.getpixel((0, 0)) == (16, 32, 48, 255)
+
+    def test_to_png_stroke(self, export_service: ExportService, backend: str) -> None:
+        """Test PNG export rasterizes strokes."""
+        canvas = Canvas(name="Test", width=100, height=100)
+        canvas.elements.append(
+            Stroke(
+                points=[Point(x=10, y=50), Point(x=90, y=50)],
+                style=ElementStyle(stroke_color="#ff0000", stroke_width=6.0),
+            )
+        )
+
+        image = self._render(export_service, canvas)
+
+        assert image.getpixel((50, 50)) == (255, 0, 0, 255)
+        assert image.getpixel((50, 10)) == (255, 255, 255, 255)
+
+    def test_to_png_opaque_uses_rgb(self, export_service: ExportService, backend: str) -> None:
+        """Test fully opaque exports are encoded without an alpha channel."""
+        canvas = Canvas(name="Test", width=20, height=20)
+        canvas.elements.append(Stroke(points=[Point(x=0, y=0), Point(x=10, y=10)]))
+
+        assert Image.open(io.BytesIO(export_service.to_png(canvas))).mode == "RGB"
+
+    def test_to_png_alpha_uses_rgba(self, export_service: ExportService, backend: str) -> None:
+        """Test translucent backgrounds or colors keep the alpha channel."""
+        translucent_bg = Canvas(name="Test", width=20, height=20, background_color="#ffffff80")
+        translucent_stroke = Canvas(name="Test", width=20, height=20)
+        translucent_stroke.elements.append(
+            Stroke(points=[Point(x=0, y=0), Point(x=10, y=10)], style=ElementStyle(stroke_color="#ff000080"))
+        )
+
+        assert Image.open(io.BytesIO(export_service.to_png(translucent_bg))).mode == "RGBA"
+        assert Image.open(io.BytesIO(export_service.to_png(translucent_stroke))).mode == "RGBA"
+
+    def test_to_png_compression(self, export_service: ExportService, backend: str) -> None:
+        """Test PNG compression level trades size without changing pixels."""
+        canvas = Canvas(name="Test", width=200, height=200, background_color="#336699")
+
+        fast = export_service.to_png(canvas, compression=0)
+        small = export_service.to_png(canvas, compression=9)
+
+        assert len(small) < len(fast)
+        assert Image.open(io.BytesIO(fast)).tobytes() == Image.open(io.BytesIO(small)).tobytes()
+
+    def test_to_png_z_order(self, export_service: ExportService, backend: str) -> None:
+        """Test PNG export layers strokes and shapes by z_index."""
+        canvas = Canvas(name="Test", width=100, height=100)
+        canvas.elements.append(
+            Shape(
+                shape_type=ShapeType.RECTANGLE,
+                position=Point(x=0, y=0),
+                width=100.0,
+                height=100.0,
+                style=ElementStyle(stroke_color="#0000ff", fill_color="#0000ff"),
+                z_index=2,
+            )
+        )
+        canvas.elements.append(
+            Stroke(
+                points=[Point(x=10, y=50), Point(x=90, y=50)],
+                style=ElementStyle(stroke_color="#ff0000", stroke_width=6.0),
+                z_index=1,
+            )
+        )
+
+        image = self._render(export_service, canvas)
+
+        assert image.getpixel((50, 50)) == (0, 0, 255, 255)
+
+
+class TestExportServicePNGTiled:
+    """Tests for tiled, process-parallel PNG rasterization."""
+
+    def test_tiled_matches_single_pass(self, canvas_with_elements: Canvas) -> None:
+        """Test tiles stitched together match a single-pass render.
+
+        Rasterizers clip lines against the buffer they draw into, so
+        anti-aliased edges may differ by a handful of pixels.
+        """
+        canvas_with_elements.elements.append(
+            Stroke(
+                points=[Point(x=5, y=590), Point(x=400, y=300), Point(x=795, y=5)],
+                style=ElementStyle(stroke_color="#aa00aa", stroke_width=9.0),
+                z_index=3,
+            )
+        )
+        single = ExportService().to_png(canvas_with_elements)
+        service = ExportService(parallel_threshold=1, tile_size=128, max_workers=2)
+        try:
+            tiled = service.to_png(canvas_with_elements)
+        finally:
+            service.shutdown()
+
+        diff = ImageChops.difference(Image.open(io.BytesIO(tiled)), Image.open(io.BytesIO(single)))
+        differing = sum(1 for pixel in diff.convert("L").getdata() if pixel)
+        assert differing < 0.01 * diff.width * diff.height
+
+    def test_pool_is_reused_across_exports(self, canvas_with_elements: Canvas) -> None:
+        """Test tiled exports share one worker pool until the service shuts down."""
+        service = ExportService(parallel_threshold=1, tile_size=128, max_workers=1)
+
+        with patch("scribbl_py.services.export.ProcessPoolExecutor") as pool:
+            pool.return_value.submit.side_effect = lambda fn, *args: MagicMock(result=lambda: fn(*args))
+            service.to_png(canvas_with_elements)
+            service.to_png(canvas_with_elements, scale=2.0)
+            service.shutdown()
+
+        pool.assert_called_once()
+        assert pool.call_args.kwargs["mp_context"].get_start_method() == "spawn"
+        pool.return_value.shutdown.assert_called_once()
+
+    def test_below_threshold_skips_pool(self, canvas_with_elements: Canvas) -> None:
+        """Test small canvases are rasterized without a process pool."""
+        service = ExportService(parallel_threshold=1000)
+
+        with patch("scribbl_py.services.export.ProcessPoolExecutor") as pool:
+            service.to_png(canvas_with_elements)
+
+        pool.assert_not_called()
+
+
 class TestExportAPI:
     """Tests for export API endpoints."""
 
@@ -241,6 +241,12 @@ class TestCheckGuess:
         # Single deletion
         assert wb.check_guess("coat", "cat") == GuessResult.CLOSE
 
+        # Insertion at either end, but not two edits
+        assert wb._is_single_char_difference("cat", "cats")
+        assert wb._is_single_char_difference("cat", "scat")
+        assert not wb._is_single_char_difference("cat", "cta")
+        assert not wb._is_single_char_difference("cat", "cast!")
+
     def test_close_match_similarity_threshold(self) -> None:
         """Test that similarity threshold affects close matches."""
         # Low threshold - more lenient
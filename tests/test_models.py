@@ -89,6 +89,12 @@ class TestStroke:
         assert len(stroke.points) == 2
         assert isinstance(stroke.id, UUID)
 
+    def test_stroke_created_at_iso(self) -> None:
+        """Test created_at_iso matches created_at and is cached on the instance."""
+        stroke = Stroke(position=Point(x=0, y=0), points=[])
+        assert stroke.created_at_iso == stroke.created_at.isoformat()
+        assert stroke.created_at_iso is stroke.created_at_iso
+
     def test_stroke_default_smoothing(self) -> None:
         """Test stroke with default smoothing value."""
         stroke = Stroke(position=Point(x=0, y=0), points=[])
@@ -387,6 +393,22 @@ class TestCanvas:
         assert canvas.elements == []
         assert len(canvas.elements) == 0
 
+    def test_canvas_elements_by_zindex(self) -> None:
+        """Test that elements_by_zindex is sorted and follows changes to the elements."""
+        top = Text(content="top", z_index=2)
+        bottom = Stroke(z_index=0)
+        canvas = Canvas(name="Test", elements=[top, bottom])
+
+        assert canvas.elements_by_zindex == [bottom, top]
+
+        middle = Shape(z_index=1)
+        canvas.elements.append(middle)
+        assert canvas.elements_by_zindex == [bottom, middle, top]
+
+        # In-place z_index changes don't touch updated_at but must still reorder
+        top.z_index = -1
+        assert canvas.elements_by_zindex == [top, bottom, middle]
+
 
 class TestElementInheritance:
     """Tests for element inheritance and polymorphism."""
@@ -18,7 +18,7 @@ class TestRoomKick:
         host = Player(id=uuid4(), user_id="host123", user_name="Host", is_host=True)
         player = Player(id=uuid4(), user_id="player123", user_name="Player")
 
-        room.players = [host, player]
+        room.replace_players([host, player])
         room.host_id = host.id
 
         kicked = room.kick_player(host.id, player.id)
@@ -34,7 +34,7 @@ class TestRoomKick:
         player1 = Player(id=uuid4(), user_id="player1", user_name="Player1")
         player2 = Player(id=uuid4(), user_id="player2", user_name="Player2")
 
-        room.players = [host, player1, player2]
+        room.replace_players([host, player1, player2])
         room.host_id = host.id
 
         with pytest.raises(ValueError, match="Only the host can kick"):
@@ -46,7 +46,7 @@ class TestRoomKick:
         host = Player(id=uuid4(), user_id="host123", user_name="Host", is_host=True)
         player = Player(id=uuid4(), user_id="player123", user_name="Player")
 
-        room.players = [host, player]
+        room.replace_players([host, player])
         room.host_id = host.id
 
         with pytest.raises(ValueError, match="Cannot kick the host"):
@@ -58,7 +58,7 @@ class TestRoomKick:
         host = Player(id=uuid4(), user_id="host123", user_name="Host", is_host=True)
         player = Player(id=uuid4(), user_id="player123", user_name="Player")
 
-        room.players = [host, player]
+        room.replace_players([host, player])
         room.host_id = host.id
 
         # Kick the player
@@ -80,7 +80,7 @@ class TestRoomBan:
         host = Player(id=uuid4(), user_id="host123", user_name="Host", is_host=True)
         player = Player(id=uuid4(), user_id="player123", user_name="Player")
 
-        room.players = [host, player]
+        room.replace_players([host, player])
         room.host_id = host.id
 
         banned = room.ban_player(host.id, player.id)
@@ -97,7 +97,7 @@ class TestRoomBan:
         player1 = Player(id=uuid4(), user_id="player1", user_name="Player1")
         player2 = Player(id=uuid4(), user_id="player2", user_name="Player2")
 
-        room.players = [host, player1, player2]
+        room.replace_players([host, player1, player2])
         room.host_id = host.id
 
         with pytest.raises(ValueError, match="Only the host can ban"):
@@ -109,7 +109,7 @@ class TestRoomBan:
         host = Player(id=uuid4(), user_id="host123", user_name="Host", is_host=True)
         player = Player(id=uuid4(), user_id="player123", user_name="Player")
 
-        room.players = [host, player]
+        room.replace_players([host, player])
         room.host_id = host.id
 
         with pytest.raises(ValueError, match="Cannot ban the host"):
@@ -121,7 +121,7 @@ class TestRoomBan:
         host = Player(id=uuid4(), user_id="host123", user_name="Host", is_host=True)
         player = Player(id=uuid4(), user_id="player123", user_name="Player")
 
-        room.players = [host, player]
+        room.replace_players([host, player])
         room.host_id = host.id
 
         # Ban the player
@@ -138,7 +138,7 @@ class TestRoomBan:
         host = Player(id=uuid4(), user_id="host123", user_name="Host", is_host=True)
         player = Player(id=uuid4(), user_id="player123", user_name="Player")
 
-        room.players = [host, player]
+        room.replace_players([host, player])
         room.host_id = host.id
 
         # Ban then unban
@@ -164,7 +164,7 @@ class TestTransferHost:
         host = Player(id=uuid4(), user_id="host123", user_name="Host", is_host=True)
         player = Player(id=uuid4(), user_id="player123", user_name="Player")
 
-        room.players = [host, player]
+        room.replace_players([host, player])
         room.host_id = host.id
 
         result = room.transfer_host(host.id, player.id)
@@ -181,7 +181,7 @@ class TestTransferHost:
         player1 = Player(id=uuid4(), user_id="player1", user_name="Player1")
         player2 = Player(id=uuid4(), user_id="player2", user_name="Player2")
 
-        room.players = [host, player1, player2]
+        room.replace_players([host, player1, player2])
         room.host_id = host.id
 
         with pytest.raises(ValueError, match="Only the host can transfer"):
@@ -198,7 +198,7 @@ class TestTransferHost:
             connection_state=PlayerState.DISCONNECTED,
         )
 
-        room.players = [host, player]
+        room.replace_players([host, player])
         room.host_id = host.id
 
         with pytest.raises(ValueError, match="disconnected"):
@@ -215,7 +215,7 @@ class TestTransferHost:
             is_spectator=True,
         )
 
-        room.players = [host, spectator]
+        room.replace_players([host, spectator])
         room.host_id = host.id
 
         with pytest.raises(ValueError, match="spectator"):
@@ -229,7 +229,7 @@ class TestIsHost:
         """Test is_host returns True for host."""
         room = GameRoom(settings=GameSettings())
         host = Player(id=uuid4(), user_id="host123", user_name="Host", is_host=True)
-        room.players = [host]
+        room.replace_players([host])
         room.host_id = host.id
 
         assert room.is_host(host.id) is True
@@ -239,7 +239,30 @@ class TestIsHost:
         room = GameRoom(settings=GameSettings())
         host = Player(id=uuid4(), user_id="host123", user_name="Host", is_host=True)
         player = Player(id=uuid4(), user_id="player123", user_name="Player")
-        room.players = [host, player]
+        room.replace_players([host, player])
         room.host_id = host.id
 
         assert room.is_host(player.id) is False
+
+
+class TestGetPlayer:
+    """Tests for player lookup by ID."""
+
+    def test_get_player_after_add(self) -> None:
+        """Test that added players can be looked up by ID."""
+        room = GameRoom(settings=GameSettings())
+        player = Player(id=uuid4(), user_id="player123", user_name="Player")
+        room.add_player(player)
+
+        assert room.get_player(player.id) is player
+        assert room.get_player(uuid4()) is None
+
+    def test_get_player_after_players_reassigned(self) -> None:
+        """Test that lookups see players set through replace_players."""
+        room = GameRoom(settings=GameSettings())
+        host = Player(id=uuid4(), user_id="host123", user_name="Host", is_host=True)
+        room.add_player(host)
+        player = Player(id=uuid4(), user_id="player123", user_name="Player")
+        room.replace_players([host, player])
+
+        assert room.get_player(player.id) is player
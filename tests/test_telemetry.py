@@ -0,0 +1,108 @@
+"""Tests for the telemetry service."""
+
+from __future__ import annotations
+
+import time
+from dataclasses import fields
+from uuid import uuid4
+
+import pytest
+
+from scribbl_py.services import telemetry as telemetry_module
+from scribbl_py.services.telemetry import TelemetryService, TelemetryStats
+
+
+class TestRecentActivity:
+    """Tests for the recent activity counters."""
+
+    def test_recent_counts_follow_tracked_events(self) -> None:
+        """Test that recent counters reflect events inside the window."""
+        telemetry = TelemetryService()
+        room_id = uuid4()
+        player_id = uuid4()
+
+        telemetry.track_game_started(room_id, player_count=3)
+        telemetry.track_guess(room_id, player_id, correct=False)
+        telemetry.track_guess(room_id, player_id, correct=True)
+
+        stats = telemetry.get_stats()
+        assert stats.recent_games_started == 1
+        assert stats.recent_guesses == 2
+        assert stats.total_guesses == 2
+        assert stats.total_correct_guesses == 1
+
+        # Fetching stats again must not double count
+        stats = telemetry.get_stats()
+        assert stats.recent_games_started == 1
+        assert stats.recent_guesses == 2
+
+    def test_recent_counts_expire_after_window(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that events older than the window drop out of the recent counters."""
+        now = 1000.0
+        monkeypatch.setattr(time, "monotonic", lambda: now)
+        telemetry = TelemetryService()
+        room_id = uuid4()
+
+        telemetry.track_game_started(room_id, player_count=2)
+        telemetry.track_guess(room_id, uuid4(), correct=False)
+
+        now += 200.0
+        telemetry.track_guess(room_id, uuid4(), correct=True)
+
+        now += 150.0
+        stats = telemetry.get_stats()
+        assert stats.recent_games_started == 0
+        assert stats.recent_guesses == 1
+        assert stats.total_guesses == 2
+        assert stats.uptime_seconds == 350.0
+
+
+class TestStatsDict:
+    """Tests for the serialized stats snapshot."""
+
+    def test_stats_dict_has_every_field(self) -> None:
+        """Test that the stats dict covers all stats fields and is JSON friendly."""
+        telemetry = TelemetryService()
+        telemetry.track_connection_opened()
+
+        data = telemetry.get_stats_dict()
+
+        assert list(data) == [f.name for f in fields(TelemetryStats)]
+        assert data["active_websocket_connections"] == 1
+        assert isinstance(data["started_at"], str)
+
+
+class TestRecentEventsCap:
+    """Tests for the hard cap on recent events."""
+
+    def test_cap_evicts_oldest_and_keeps_counts(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that hitting the cap drops the oldest events and their counts."""
+        monkeypatch.setattr(telemetry_module, "_RECENT_EVENTS_MAX", 3)
+        telemetry = TelemetryService()
+        room_id = uuid4()
+
+        telemetry.track_game_started(room_id, player_count=2)
+        for _ in range(3):
+            telemetry.track_guess(room_id, uuid4(), correct=False)
+
+        stats = telemetry.get_stats()
+        assert stats.recent_games_started == 0
+        assert stats.recent_guesses == 3
+
+
+class TestDebugLogging:
+    """Tests for the cached debug-logging check."""
+
+    def test_debug_flag_is_read_at_init(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that events skip debug logging when DEBUG was disabled at construction."""
+        monkeypatch.setattr(telemetry_module, "is_debug_enabled", lambda: False)
+        logged: list[str] = []
+        monkeypatch.setattr(telemetry_module.logger, "debug", lambda event, **_: logged.append(event))
+        received: list[str] = []
+        telemetry = TelemetryService()
+        telemetry.add_callback(lambda event, _data: received.append(event))
+
+        telemetry.track_connection_opened()
+
+        assert logged == []
+        assert received == ["connection_opened"]